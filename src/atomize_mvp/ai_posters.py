@@ -1,11 +1,16 @@
-import base64
+import contextvars
+import io
 import json
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
-from atomize_mvp.llm_client import generate_image_base64
+from atomize_mvp.design_system import Theme, get_theme
+from atomize_mvp.image_cache import IMAGE_SIZE, ImageCache, generate_image, image_source
+from atomize_mvp.procedural import procedural_background
+from atomize_mvp.render_manifest import RenderManifest, poster_hash
 
 PLATFORM_FOLDERS = {
     "LinkedIn": "LinkedIn",
@@ -92,38 +97,91 @@ def _compose_poster(background: Image.Image, card: dict) -> Image.Image:
     return canvas.convert("RGB")
 
 
+def _render_ai_poster(
+    card: dict,
+    posters_root: Path,
+    backgrounds_dir: Path | None,
+    model: str,
+    image_cache: ImageCache | None,
+    theme: Theme | None = None,
+) -> Path:
+    if theme is not None:
+        image = procedural_background(card["id"], theme)
+    else:
+        prompt = build_background_prompt(card)
+        image = generate_image(prompt, model=model, size=IMAGE_SIZE, cache=image_cache)
+    if backgrounds_dir is not None:
+        (backgrounds_dir / f"{card['id']}.png").write_bytes(image)
+
+    with Image.open(io.BytesIO(image)) as background:
+        poster = _compose_poster(background, card)
+
+    output_path = ai_poster_output_path(posters_root, card["platform"], card["id"])
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    poster.save(output_path, format="PNG")
+    return output_path
+
+
 def export_ai_posters(
     cards_dir: Path,
     posters_root: Path,
     model: str,
     count: int,
+    image_cache: ImageCache | None = None,
+    workers: int = 4,
+    keep_backgrounds: bool = False,
+    backgrounds: str = "ai",
+    theme_name: str = "bright_canva",
+    manifest: RenderManifest | None = None,
 ) -> list[Path]:
+    """Generate and compose the hero posters, ``workers`` cards at a time.
+
+    Image calls go through the shared LLM rate limiter, so fanning them out
+    only overlaps their latency. Backgrounds are decoded in memory and written
+    to ``_backgrounds`` only with ``keep_backgrounds``. With ``backgrounds``
+    set to ``procedural`` they are drawn locally in the theme colors instead.
+    Posters whose inputs are unchanged since the last run are kept as they are.
+    """
     cards_json = cards_dir / "cards.json"
     if not cards_json.exists():
         raise FileNotFoundError("cards.json not found. Run render_cards first.")
 
     cards = json.loads(cards_json.read_text(encoding="utf-8"))
     selected = select_hero_cards(cards, count)
-    outputs: list[Path] = []
-
-    backgrounds_dir = posters_root / "_backgrounds"
-    backgrounds_dir.mkdir(parents=True, exist_ok=True)
-
-    for card in selected:
-        content_id = card["id"]
-        platform = card["platform"]
-        prompt = build_background_prompt(card)
-
-        image_b64 = generate_image_base64(prompt, model=model, size="1024x1024")
-        background_path = backgrounds_dir / f"{content_id}.png"
-        background_path.write_bytes(base64.b64decode(image_b64))
-
-        background = Image.open(background_path)
-        poster = _compose_poster(background, card)
-
-        output_path = ai_poster_output_path(posters_root, platform, content_id)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        poster.save(output_path, format="PNG")
-        outputs.append(output_path)
-
+    theme = get_theme(theme_name) if backgrounds == "procedural" else None
+    manifest = manifest or RenderManifest(posters_root)
+    source = theme_name if theme is not None else image_source(model)
+    outputs = [
+        ai_poster_output_path(posters_root, card["platform"], card["id"]) for card in selected
+    ]
+    pending = [
+        card
+        for card, output_path in zip(selected, outputs)
+        if manifest.needs_render(
+            output_path, poster_hash("ai", card, backgrounds, source, keep_backgrounds)
+        )
+    ]
+
+    backgrounds_dir = None
+    if keep_backgrounds:
+        backgrounds_dir = posters_root / "_backgrounds"
+        backgrounds_dir.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _render_ai_poster,
+                card,
+                posters_root,
+                backgrounds_dir,
+                model,
+                image_cache,
+                theme,
+            )
+            for card in pending
+        ]
+        for future in futures:
+            future.result()
+    manifest.commit()
     return outputs
@@ -0,0 +1,117 @@
+import atexit
+import base64
+import hashlib
+import logging
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Pages never reach this host; pooled contexts answer it from the store.
+ASSET_ORIGIN = "https://assets.atomize.local/"
+MB = 1024 * 1024
+
+
+class AssetStore:
+    """Content-addressed files that pooled browser pages load by URL.
+
+    Posters used to inline every image as a base64 data URI, which meant
+    building, shipping and decoding megabytes of text per render. The store
+    writes the decoded bytes to disk once and hands out a short URL; the
+    browser pool routes that origin to the files here. Once the store holds
+    more than ``max_bytes``, the least recently put files are deleted, so a
+    long-running server does not keep every image it ever rendered.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = 256 * MB) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes = {path.name: path.stat().st_size for path in self.root.iterdir()}
+        self.served = 0
+        self.missing = 0
+        self.evicted = 0
+
+    def put(self, data: bytes, suffix: str) -> str:
+        name = f"{hashlib.sha256(data).hexdigest()[:32]}{suffix}"
+        path = self.root / name
+        with self._lock:
+            if name in self._sizes and path.exists():
+                # Re-putting marks the file as recently used.
+                os.utime(path)
+            else:
+                fd, temp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(temp, path)
+                self._sizes[name] = len(data)
+                self._evict(keep=name)
+        return ASSET_ORIGIN + name
+
+    def _evict(self, keep: str) -> None:
+        if not self.max_bytes:
+            return
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        candidates = []
+        for name in self._sizes:
+            try:
+                candidates.append(((self.root / name).stat().st_mtime, name))
+            except OSError:
+                candidates.append((0.0, name))
+        for _, name in sorted(candidates):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            try:
+                (self.root / name).unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("Evicting asset %s failed: %s", name, exc)
+                continue
+            total -= self._sizes.pop(name)
+            self.evicted += 1
+
+    def put_base64(self, data: str, suffix: str = ".png") -> str:
+        return self.put(base64.b64decode(data), suffix)
+
+    def path_for(self, url: str) -> Path | None:
+        if not url.startswith(ASSET_ORIGIN):
+            return None
+        name = url[len(ASSET_ORIGIN) :].split("?", 1)[0]
+        if not name or "/" in name or name.startswith("."):
+            return None
+        path = self.root / name
+        return path if path.is_file() else None
+
+    async def handle(self, route) -> None:
+        """Playwright route handler for requests to ``ASSET_ORIGIN``."""
+        path = self.path_for(route.request.url)
+        if path is None:
+            self.missing += 1
+            await route.fulfill(status=404, body="")
+            return
+        self.served += 1
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        await route.fulfill(path=str(path), content_type=content_type)
+
+
+_STORE: AssetStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_asset_store() -> AssetStore:
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            root = Path(tempfile.mkdtemp(prefix="atomize-assets-"))
+            max_mb = int(os.environ.get("ATOMIZE_ASSET_STORE_MAX_MB", "") or 256)
+            _STORE = AssetStore(root, max_bytes=max_mb * MB)
+            atexit.register(shutil.rmtree, root, ignore_errors=True)
+    return _STORE
@@ -1,11 +1,26 @@
+import contextvars
 import json
+import logging
+import math
 import os
 import re
 import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from atomize_mvp.llm_client import generate_blueprint, generate_repair, set_system_prompt
-from atomize_mvp.schemas import ContentBlueprint
+from atomize_mvp.cleanup import cleanup_text, split_passages
+from atomize_mvp.json_repair import repair_model
+from atomize_mvp.json_schemas import model_schema
+from atomize_mvp.llm_client import (
+    generate_blueprint,
+    generate_repair,
+    generate_text,
+    set_system_prompt,
+)
+from atomize_mvp.reuse import transcript_diff
+from atomize_mvp.schemas import ContentBlueprint, PartialBlueprint
+
+logger = logging.getLogger(__name__)
 
 SCHEMA_TEXT = """{
   "title": "string",
@@ -19,6 +34,17 @@ SCHEMA_TEXT = """{
 COUNTS_TEXT = (
     "Counts: key_points 8-12, hooks 10-20, quotes 10-20, ctas 8-12, do_not_say 5-10."
 )
+PARTIAL_SCHEMA_TEXT = """{
+  "summary": "string",
+  "key_points": ["string"],
+  "hooks": ["string"],
+  "quotes": ["string"],
+  "ctas": ["string"],
+  "do_not_say": ["string"]
+}"""
+PARTIAL_COUNTS_TEXT = (
+    "Counts: key_points 3-6, hooks 3-8, quotes 3-8, ctas 2-5, do_not_say 1-4."
+)
 
 
 def _truncate_text(text: str, max_chars: int) -> str:
@@ -82,14 +108,16 @@ def _offline_blueprint(text: str, title: str, lang: str) -> ContentBlueprint:
     )
 
 
-def _build_prompt(clean_text: str, title: str, lang: str) -> str:
+def _lang_hint(lang: str) -> str:
     if lang == "en":
-        lang_hint = "Respond in English."
-    elif lang == "ar":
-        lang_hint = "Respond in Arabic."
-    else:
-        lang_hint = "Respond in the same language as the transcript."
+        return "Respond in English."
+    if lang == "ar":
+        return "Respond in Arabic."
+    return "Respond in the same language as the transcript."
+
 
+def _build_prompt(clean_text: str, title: str, lang: str) -> str:
+    lang_hint = _lang_hint(lang)
     return (
         "You must output JSON only, no markdown, no code fences.\n"
         "The JSON must match this schema exactly:\n"
@@ -115,36 +143,133 @@ def _extract_json_block(text: str) -> str:
     return text[start : end + 1]
 
 
-def generate_content_blueprint(
-    clean_text: str,
+def plan_chunk_count(text_len: int, max_input_chars: int, chunks: int) -> int:
+    if chunks > 0:
+        return chunks
+    return max(1, math.ceil(text_len / max(max_input_chars, 1)))
+
+
+def chunk_transcript(text: str, chunk_count: int, max_chars: int) -> list[str]:
+    target = min(max_chars, max(1, math.ceil(len(text) / max(chunk_count, 1))))
+    paragraphs = split_passages(text, target)
+    chunks: list[str] = []
+    current: list[str] = []
+    current_len = 0
+    for paragraph in paragraphs:
+        if current and current_len + len(paragraph) > target:
+            chunks.append("\n\n".join(current))
+            current = []
+            current_len = 0
+        current.append(paragraph)
+        current_len += len(paragraph) + 2
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _build_map_prompt(section: str, title: str, lang: str, index: int, total: int) -> str:
+    # A total of 0 means sections are still being produced (pipelined mode).
+    position = f"Section {index} of {total}" if total else f"Section {index}"
+    return (
+        "You must output JSON only, no markdown, no code fences.\n"
+        "The JSON must match this schema exactly:\n"
+        f"{PARTIAL_SCHEMA_TEXT}\n"
+        f"{PARTIAL_COUNTS_TEXT}\n"
+        "Do not invent facts beyond this section.\n"
+        "Quotes must be exact phrases from this section.\n"
+        f"{_lang_hint(lang)}\n\n"
+        f"Title: {title}\n"
+        f"{position}\n\n"
+        "Transcript section:\n"
+        f"{section}"
+    )
+
+
+def _build_reduce_prompt(partials: list[PartialBlueprint], title: str, lang: str) -> str:
+    partials_json = json.dumps(
+        [partial.model_dump() for partial in partials], ensure_ascii=False, indent=2
+    )
+    return (
+        "You must output JSON only, no markdown, no code fences.\n"
+        "Merge these partial blueprints, extracted from consecutive sections of one "
+        "transcript, into a single blueprint.\n"
+        "The JSON must match this schema exactly:\n"
+        f"{SCHEMA_TEXT}\n"
+        f"{COUNTS_TEXT}\n"
+        "Remove duplicates and near-duplicates; keep the strongest items across all sections.\n"
+        "The summary must cover the whole transcript, not only the first section.\n"
+        "Quotes must be copied verbatim from the partial quotes.\n"
+        "Do not invent facts beyond the partial blueprints.\n"
+        f"{_lang_hint(lang)}\n\n"
+        f"Title: {title}\n\n"
+        "Partial blueprints:\n"
+        f"{partials_json}"
+    )
+
+
+def _parse_partial(raw: str, model: str, temperature: float) -> PartialBlueprint:
+    for attempt in range(2):
+        try:
+            return PartialBlueprint.model_validate(json.loads(_extract_json_block(raw)))
+        except Exception as exc:  # noqa: BLE001
+            repaired = repair_model(raw, PartialBlueprint)
+            if repaired is not None:
+                return repaired
+            if attempt >= 1:
+                raise
+            repair_prompt = (
+                "Fix the JSON to match the schema exactly. Output JSON only.\n"
+                f"Schema:\n{PARTIAL_SCHEMA_TEXT}\n\n"
+                f"Validation error:\n{exc}\n\n"
+                f"Broken output:\n{raw}"
+            )
+            raw = generate_repair(
+                repair_prompt,
+                model,
+                temperature,
+                model_schema(PartialBlueprint),
+                "partial_blueprint",
+            )
+    raise RuntimeError("Failed to generate a valid partial blueprint.")
+
+
+def extract_partial_blueprint(
+    section: str,
     title: str,
     prompt_path: Path,
     model: str,
     temperature: float,
-    max_input_chars: int,
     lang: str,
-) -> tuple[str, ContentBlueprint, str]:
-    trimmed_text = _truncate_text(clean_text, max_input_chars)
-    input_hash = _hash_text(clean_text)
-
-    if os.environ.get("ATOMIZE_OFFLINE") == "1":
-        blueprint = _offline_blueprint(trimmed_text, title, lang)
-        raw = json.dumps(blueprint.model_dump(), indent=2, sort_keys=True)
-        return raw, blueprint, input_hash
-
+    index: int = 1,
+    total: int = 1,
+) -> PartialBlueprint:
     system_prompt = prompt_path.read_text(encoding="utf-8")
-    set_system_prompt(system_prompt)
+    user_prompt = _build_map_prompt(section, title, lang, index, total)
+    raw = generate_text(
+        system_prompt,
+        user_prompt,
+        model,
+        temperature,
+        model_schema(PartialBlueprint),
+        "partial_blueprint",
+        step="blueprint_map",
+    )
+    return _parse_partial(raw, model, temperature)
 
-    user_prompt = _build_prompt(trimmed_text, title, lang)
-    raw = generate_blueprint(user_prompt, model, temperature)
 
+def _parse_with_repair(
+    raw: str, model: str, temperature: float
+) -> tuple[str, ContentBlueprint]:
     for attempt in range(3):
         try:
             candidate = _extract_json_block(raw)
             data = json.loads(candidate)
             blueprint = ContentBlueprint.model_validate(data)
-            return candidate, blueprint, input_hash
+            return candidate, blueprint
         except Exception as exc:  # noqa: BLE001
+            repaired = repair_model(raw, ContentBlueprint)
+            if repaired is not None:
+                return json.dumps(repaired.model_dump(), ensure_ascii=False, indent=2), repaired
             if attempt >= 2:
                 raise
             repair_prompt = (
@@ -156,6 +281,278 @@ def generate_content_blueprint(
                 f"Validation error:\n{exc}\n\n"
                 f"Broken output:\n{raw}"
             )
-            raw = generate_repair(repair_prompt, model, temperature)
+            raw = generate_repair(
+                repair_prompt, model, temperature, model_schema(ContentBlueprint)
+            )
 
     raise RuntimeError("Failed to generate a valid content blueprint.")
+
+
+def reduce_blueprints(
+    partials: list[PartialBlueprint],
+    title: str,
+    prompt_path: Path,
+    model: str,
+    temperature: float,
+    lang: str,
+) -> tuple[str, ContentBlueprint]:
+    system_prompt = prompt_path.read_text(encoding="utf-8")
+    set_system_prompt(system_prompt)
+    user_prompt = _build_reduce_prompt(partials, title, lang)
+    raw = generate_blueprint(
+        user_prompt, model, temperature, model_schema(ContentBlueprint)
+    )
+    return _parse_with_repair(raw, model, temperature)
+
+
+def generate_content_blueprint(
+    clean_text: str,
+    title: str,
+    prompt_path: Path,
+    model: str,
+    temperature: float,
+    max_input_chars: int,
+    lang: str,
+    chunks: int = 0,
+    workers: int = 4,
+    partials: list[PartialBlueprint] | None = None,
+) -> tuple[str, ContentBlueprint, str]:
+    input_hash = _hash_text(clean_text)
+    chunk_count = plan_chunk_count(len(clean_text), max_input_chars, chunks)
+
+    if os.environ.get("ATOMIZE_OFFLINE") == "1":
+        trimmed_text = _truncate_text(clean_text, max_input_chars)
+        blueprint = _offline_blueprint(trimmed_text, title, lang)
+        raw = json.dumps(blueprint.model_dump(), indent=2, sort_keys=True)
+        return raw, blueprint, input_hash
+
+    if partials:
+        # Sections were already mapped while the audio was being transcribed.
+        raw, blueprint = reduce_blueprints(
+            partials, title, prompt_path, model, temperature, lang
+        )
+        return raw, blueprint, input_hash
+
+    if chunk_count > 1:
+        sections = chunk_transcript(clean_text, chunk_count, max_input_chars)
+        logger.info(
+            "Map-reduce blueprint: %s sections, %s workers", len(sections), workers
+        )
+        map_prompt_path = prompt_path.parent / "blueprint_map.txt"
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    extract_partial_blueprint,
+                    section,
+                    title,
+                    map_prompt_path,
+                    model,
+                    temperature,
+                    lang,
+                    idx,
+                    len(sections),
+                )
+                for idx, section in enumerate(sections, start=1)
+            ]
+            partials = [future.result() for future in futures]
+        raw, blueprint = reduce_blueprints(
+            partials, title, prompt_path, model, temperature, lang
+        )
+        return raw, blueprint, input_hash
+
+    trimmed_text = _truncate_text(clean_text, max_input_chars)
+    if len(trimmed_text) < len(clean_text):
+        logger.warning(
+            "Transcript truncated to %s of %s chars for blueprint",
+            len(trimmed_text),
+            len(clean_text),
+        )
+    system_prompt = prompt_path.read_text(encoding="utf-8")
+    set_system_prompt(system_prompt)
+
+    user_prompt = _build_prompt(trimmed_text, title, lang)
+    raw = generate_blueprint(
+        user_prompt, model, temperature, model_schema(ContentBlueprint)
+    )
+    candidate, blueprint = _parse_with_repair(raw, model, temperature)
+    return candidate, blueprint, input_hash
+
+
+def _build_refresh_prompt(
+    prior: ContentBlueprint, added: list[str], removed: list[str], title: str, lang: str
+) -> str:
+    added_text = "\n".join(f"+ {sentence}" for sentence in added) or "(none)"
+    removed_text = "\n".join(f"- {sentence}" for sentence in removed) or "(none)"
+    return (
+        "You must output JSON only, no markdown, no code fences.\n"
+        "The transcript below is a re-edited cut of a recording that already has a "
+        "blueprint. Update the blueprint to match the new cut.\n"
+        "The JSON must match this schema exactly:\n"
+        f"{SCHEMA_TEXT}\n"
+        f"{COUNTS_TEXT}\n"
+        "Drop items that rely only on removed sentences. Add items for important new "
+        "sentences. Keep every other item unchanged.\n"
+        "Quotes must be exact phrases from the kept or added sentences.\n"
+        f"{_lang_hint(lang)}\n\n"
+        f"Title: {title}\n\n"
+        "Current blueprint:\n"
+        f"{json.dumps(prior.model_dump(), ensure_ascii=False, indent=2)}\n\n"
+        "Removed sentences:\n"
+        f"{removed_text}\n\n"
+        "Added sentences:\n"
+        f"{added_text}"
+    )
+
+
+def reuse_content_blueprint(
+    clean_text: str,
+    prior_text: str,
+    prior_raw: str,
+    title: str,
+    prompt_path: Path,
+    model: str,
+    temperature: float,
+    lang: str,
+    refresh: bool = False,
+) -> tuple[str, ContentBlueprint, str]:
+    """Start from a near-duplicate job's blueprint instead of a fresh one.
+
+    With ``refresh`` the transcript diff is sent in one call to update the
+    prior blueprint; without it, or when nothing changed, it is kept as is.
+    """
+    input_hash = _hash_text(clean_text)
+    candidate, prior = _parse_with_repair(prior_raw, model, temperature)
+    if not refresh:
+        return candidate, prior, input_hash
+    added, removed = transcript_diff(prior_text, clean_text)
+    if not added and not removed:
+        return candidate, prior, input_hash
+    logger.info(
+        "Refreshing blueprint: %s sentences added, %s removed", len(added), len(removed)
+    )
+    system_prompt = prompt_path.read_text(encoding="utf-8")
+    set_system_prompt(system_prompt)
+    user_prompt = _build_refresh_prompt(prior, added, removed, title, lang)
+    raw = generate_blueprint(
+        user_prompt, model, temperature, model_schema(ContentBlueprint)
+    )
+    candidate, blueprint = _parse_with_repair(raw, model, temperature)
+    return candidate, blueprint, input_hash
+
+
+def _segments_text(segments: list[dict]) -> str:
+    paragraphs: list[str] = []
+    current: list[str] = []
+    last_end = None
+    for segment in segments:
+        if current and last_end is not None and segment["start"] - last_end >= 1.0:
+            paragraphs.append(" ".join(current))
+            current = []
+        current.append(segment["text"])
+        last_end = segment["end"]
+    if current:
+        paragraphs.append(" ".join(current))
+    return cleanup_text("\n\n".join(paragraphs))
+
+
+class SectionMapper:
+    """Run partial-blueprint map calls while transcription is still going.
+
+    Transcribed chunks can finish out of order, so segments are only released
+    once every earlier chunk has arrived. Each time the released audio covers
+    ``section_seconds``, that section is cleaned and sent to the map prompt.
+    The partials are saved to ``partials_dir`` as they complete.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        prompt_path: Path,
+        model: str,
+        temperature: float,
+        lang: str,
+        partials_dir: Path,
+        section_seconds: int = 900,
+        workers: int = 4,
+    ) -> None:
+        self.title = title
+        self.prompt_path = prompt_path
+        self.model = model
+        self.temperature = temperature
+        self.lang = lang
+        self.partials_dir = partials_dir
+        self.section_seconds = section_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        self._futures: list[Future] = []
+        self._pending_chunks: dict[int, list[dict]] = {}
+        self._next_chunk = 0
+        self._section: list[dict] = []
+        self._section_start: float | None = None
+
+    @property
+    def sections(self) -> int:
+        return len(self._futures)
+
+    def add_chunk(self, index: int, segments: list[dict]) -> None:
+        self._pending_chunks[index] = segments
+        while self._next_chunk in self._pending_chunks:
+            for segment in self._pending_chunks.pop(self._next_chunk):
+                self._add_segment(segment)
+            self._next_chunk += 1
+
+    def _add_segment(self, segment: dict) -> None:
+        if self._section_start is None:
+            self._section_start = segment["start"]
+        elif segment["start"] - self._section_start >= self.section_seconds:
+            self._flush()
+            self._section_start = segment["start"]
+        self._section.append(segment)
+
+    def _flush(self) -> None:
+        text = _segments_text(self._section)
+        self._section = []
+        if not text:
+            return
+        index = len(self._futures) + 1
+        logger.info("Pipelined blueprint: mapping section %s (%s chars)", index, len(text))
+        self._futures.append(
+            self._executor.submit(
+                contextvars.copy_context().run, self._map_section, text, index
+            )
+        )
+
+    def _map_section(self, text: str, index: int) -> PartialBlueprint:
+        partial = extract_partial_blueprint(
+            text,
+            self.title,
+            self.prompt_path,
+            self.model,
+            self.temperature,
+            self.lang,
+            index,
+            0,
+        )
+        self.partials_dir.mkdir(parents=True, exist_ok=True)
+        (self.partials_dir / f"partial_{index:03d}.json").write_text(
+            json.dumps(partial.model_dump(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        return partial
+
+    def finish(self) -> list[PartialBlueprint]:
+        # Chunks that never arrived (a failed worker) leave later ones unreleased.
+        for index in sorted(self._pending_chunks):
+            for segment in self._pending_chunks.pop(index):
+                self._add_segment(segment)
+        if self._section:
+            self._flush()
+        try:
+            return [future.result() for future in self._futures]
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def cancel(self) -> None:
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
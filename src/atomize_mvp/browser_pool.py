@@ -0,0 +1,427 @@
+import asyncio
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from playwright.async_api import async_playwright
+
+from atomize_mvp.asset_store import ASSET_ORIGIN, AssetStore, get_asset_store
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+MB = 1024 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "") or default)
+    except ValueError:
+        logger.warning("Ignoring invalid %s", name)
+        return default
+
+
+def _process_parents() -> dict[int, int]:
+    parents: dict[int, int] = {}
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return parents
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        # The command name may contain spaces, so split after its closing paren.
+        parents[int(entry.name)] = int(stat.rsplit(")", 1)[1].split()[1])
+    return parents
+
+
+def _descendants(pid: int, parents: dict[int, int]) -> set[int]:
+    children: dict[int, list[int]] = {}
+    for child, parent in parents.items():
+        children.setdefault(parent, []).append(child)
+    found: set[int] = set()
+    stack = [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            if child not in found:
+                found.add(child)
+                stack.append(child)
+    return found
+
+
+def process_tree_rss(pid: int) -> int | None:
+    """Resident memory of ``pid`` and its descendants in bytes (Linux only)."""
+    parents = _process_parents()
+    if pid not in parents:
+        return None
+    total = 0
+    for member in {pid} | _descendants(pid, parents):
+        try:
+            status = Path(f"/proc/{member}/status").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                total += int(line.split()[1]) * 1024
+                break
+    return total
+
+
+class _Slot:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.browser = None
+        self.pid: int | None = None
+        self.contexts: dict[tuple, asyncio.Task] = {}
+        self.shell_pages: dict[tuple, list] = {}
+        self.renders = 0
+        self.active = 0
+        self.draining = False
+
+
+class BrowserPool:
+    """Warm Chromium instances shared by every poster step in the process.
+
+    Playwright runs on its own event-loop thread. Callers pass an async
+    ``render(page)`` function; the pool picks a warm browser with a free page
+    slot, opens a page in a pre-created context for the requested viewport and
+    runs the function there. Renders that pass a ``shell`` document get a page
+    that already has it loaded, and the page is kept for the next render of
+    the same shell. With an ``assets`` store, every context serves
+    ``ASSET_ORIGIN`` URLs from it. Each browser serves up to ``pages_per_browser``
+    renders at once. A browser is drained and relaunched after ``max_renders``
+    renders, once its process tree grows past ``max_rss_mb``, or when it
+    disconnects.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        pages_per_browser: int = 4,
+        max_renders: int = 200,
+        max_rss_mb: int = 1536,
+        launch_options: dict | None = None,
+        assets: AssetStore | None = None,
+    ) -> None:
+        self.size = max(1, size)
+        self.pages_per_browser = max(1, pages_per_browser)
+        self.max_renders = max_renders
+        self.max_rss_mb = max_rss_mb
+        self.launch_options = launch_options or {}
+        self.assets = assets
+        self._slots = [_Slot(idx) for idx in range(self.size)]
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._playwright = None
+        self._available: asyncio.Condition | None = None
+        self._launch_lock: asyncio.Lock | None = None
+        self._context_keys: set[tuple] = set()
+        self._started_at = time.monotonic()
+        self.busy = 0
+        self.renders = 0
+        self.launches = 0
+        self.recycles = 0
+        self.leases = 0
+        self.shell_loads = 0
+        self._wait_seconds = 0.0
+        self._busy_seconds = 0.0
+
+    @classmethod
+    def from_env(cls, assets: AssetStore | None = None) -> "BrowserPool":
+        return cls(
+            size=_env_int("ATOMIZE_BROWSER_POOL_SIZE", 2),
+            pages_per_browser=_env_int("ATOMIZE_BROWSER_PAGES", 4),
+            max_renders=_env_int("ATOMIZE_BROWSER_MAX_RENDERS", 200),
+            max_rss_mb=_env_int("ATOMIZE_BROWSER_MAX_RSS_MB", 1536),
+            assets=assets,
+        )
+
+    @property
+    def capacity(self) -> int:
+        return self.size * self.pages_per_browser
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="atomize-browser-pool", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    async def _start(self) -> None:
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+            self._available = asyncio.Condition()
+        async with self._launch_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+    async def _launch(self, slot: _Slot) -> None:
+        async with self._launch_lock:
+            if slot.browser is not None:
+                return
+            # Launches are serialized so the new browser's processes can be told apart.
+            before = _descendants(os.getpid(), _process_parents())
+            slot.browser = await self._playwright.chromium.launch(**self.launch_options)
+            parents = _process_parents()
+            spawned = _descendants(os.getpid(), parents) - before
+            roots = [pid for pid in spawned if parents.get(pid) not in spawned]
+            slot.pid = roots[0] if len(roots) == 1 else None
+            slot.contexts = {}
+            slot.renders = 0
+            self.launches += 1
+        for key in sorted(self._context_keys):
+            await self._context(slot, key)
+        logger.info("Browser %s launched (pid %s)", slot.index, slot.pid)
+
+    async def _context(self, slot: _Slot, key: tuple):
+        if key not in slot.contexts:
+            # Store the task so concurrent renders share one context per viewport.
+            slot.contexts[key] = asyncio.ensure_future(self._new_context(slot.browser, key))
+        return await slot.contexts[key]
+
+    async def _new_context(self, browser, key: tuple):
+        width, height, scale = key
+        context = await browser.new_context(
+            viewport={"width": width, "height": height}, device_scale_factor=scale
+        )
+        if self.assets is not None:
+            await context.route(f"{ASSET_ORIGIN}**", self.assets.handle)
+        return context
+
+    async def _close_slot(self, slot: _Slot) -> None:
+        browser, slot.browser, slot.pid, slot.contexts = slot.browser, None, None, {}
+        slot.shell_pages = {}
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Closing browser %s failed: %s", slot.index, exc)
+
+    def _recycle_reason(self, slot: _Slot) -> str | None:
+        if slot.browser is None:
+            return None
+        if not slot.browser.is_connected():
+            return "disconnected"
+        if self.max_renders and slot.renders >= self.max_renders:
+            return f"{slot.renders} renders"
+        if self.max_rss_mb and slot.pid is not None:
+            rss = process_tree_rss(slot.pid)
+            if rss is not None and rss > self.max_rss_mb * MB:
+                return f"RSS {rss // MB} MB"
+        return None
+
+    def _pick_slot(self) -> _Slot | None:
+        free = [
+            slot
+            for slot in self._slots
+            if not slot.draining and slot.active < self.pages_per_browser
+        ]
+        if not free:
+            return None
+        # Fill warm browsers first; only launch another when they are all busy.
+        return min(free, key=lambda slot: (slot.browser is None, slot.active, slot.index))
+
+    async def _acquire(self) -> _Slot:
+        await self._start()
+        waited = time.monotonic()
+        async with self._available:
+            slot = self._pick_slot()
+            while slot is None:
+                await self._available.wait()
+                slot = self._pick_slot()
+            slot.active += 1
+        self._wait_seconds += time.monotonic() - waited
+        self.leases += 1
+        return slot
+
+    async def _release(self, slot: _Slot) -> None:
+        async with self._available:
+            slot.active -= 1
+            if not slot.draining:
+                reason = self._recycle_reason(slot)
+                if reason:
+                    logger.info("Recycling browser %s (%s)", slot.index, reason)
+                    slot.draining = True
+            relaunch = slot.draining and slot.active == 0
+        if relaunch:
+            self.recycles += 1
+            await self._close_slot(slot)
+            try:
+                await self._launch(slot)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Relaunching browser %s failed: %s", slot.index, exc)
+            slot.draining = False
+        async with self._available:
+            self._available.notify_all()
+
+    async def _shell_page(self, slot: _Slot, context, shell_key: tuple, shell: str):
+        idle = slot.shell_pages.get(shell_key)
+        if idle:
+            return idle.pop()
+        page = await context.new_page()
+        await page.set_content(shell, wait_until="load")
+        self.shell_loads += 1
+        return page
+
+    async def _render(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        viewport: tuple[int, int],
+        scale: float,
+        shell: str | None = None,
+    ) -> T:
+        slot = await self._acquire()
+        key = (viewport[0], viewport[1], scale)
+        self._context_keys.add(key)
+        self.busy += 1
+        started = time.monotonic()
+        try:
+            await self._launch(slot)
+            context = await self._context(slot, key)
+            if shell is None:
+                page = await context.new_page()
+                try:
+                    return await func(page)
+                finally:
+                    await page.close()
+            shell_key = (key, hashlib.sha1(shell.encode("utf-8")).hexdigest())
+            page = await self._shell_page(slot, context, shell_key, shell)
+            try:
+                result = await func(page)
+            except BaseException:
+                await page.close()
+                raise
+            slot.shell_pages.setdefault(shell_key, []).append(page)
+            return result
+        finally:
+            self.busy -= 1
+            self._busy_seconds += time.monotonic() - started
+            slot.renders += 1
+            self.renders += 1
+            await self._release(slot)
+
+    def submit(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        viewport: tuple[int, int] = (1080, 1080),
+        device_scale_factor: float = 1,
+        shell: str | None = None,
+    ) -> Future:
+        """Schedule ``func(page)`` on a pooled browser and return a future."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._render(func, viewport, device_scale_factor, shell), loop
+        )
+
+    def render(
+        self,
+        func: Callable[[Any], Awaitable[T]],
+        viewport: tuple[int, int] = (1080, 1080),
+        device_scale_factor: float = 1,
+        shell: str | None = None,
+    ) -> T:
+        return self.submit(func, viewport, device_scale_factor, shell).result()
+
+    def render_many(
+        self,
+        funcs: Iterable[Callable[[Any], Awaitable[T]]],
+        concurrency: int = 4,
+        viewport: tuple[int, int] = (1080, 1080),
+        device_scale_factor: float = 1,
+        shell: str | None = None,
+    ) -> list[T]:
+        """Run renders with at most ``concurrency`` in flight, results in input order.
+
+        ``funcs`` is consumed lazily, so work done while producing the next
+        render (building HTML, fetching images) overlaps with earlier renders.
+        """
+        futures: list[Future] = []
+        for func in funcs:
+            pending = [future for future in futures if not future.done()]
+            while len(pending) >= max(1, concurrency):
+                wait(pending, return_when=FIRST_COMPLETED)
+                pending = [future for future in pending if not future.done()]
+            futures.append(self.submit(func, viewport, device_scale_factor, shell))
+        return [future.result() for future in futures]
+
+    def metrics(self) -> dict:
+        uptime = max(time.monotonic() - self._started_at, 1e-9)
+        return {
+            "size": self.size,
+            "pages_per_browser": self.pages_per_browser,
+            "launched": sum(1 for slot in self._slots if slot.browser is not None),
+            "busy": self.busy,
+            "leases": self.leases,
+            "renders": self.renders,
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "shell_loads": self.shell_loads,
+            "assets_served": self.assets.served if self.assets is not None else 0,
+            "avg_wait_ms": round(self._wait_seconds / self.leases * 1000, 1)
+            if self.leases
+            else 0.0,
+            "utilization": round(self._busy_seconds / (uptime * self.capacity), 4),
+        }
+
+    async def _shutdown(self) -> None:
+        for slot in self._slots:
+            await self._close_slot(slot)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Browser pool shutdown failed: %s", exc)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+
+async def hydrate_screenshot(
+    page, data: dict, output_path: Path, selector: str = "#poster"
+) -> Path:
+    """Fill a loaded shell through its ``window.hydrate`` function and capture it."""
+    await page.evaluate("(data) => window.hydrate(data)", data)
+    element = await page.query_selector(selector)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    await element.screenshot(path=str(output_path))
+    return output_path
+
+
+_POOL: BrowserPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = BrowserPool.from_env(assets=get_asset_store())
+            atexit.register(_POOL.close)
+    return _POOL
+
+
+def pool_metrics() -> dict | None:
+    """Metrics of the shared pool, or None when no poster has been rendered yet."""
+    with _POOL_LOCK:
+        return _POOL.metrics() if _POOL is not None else None
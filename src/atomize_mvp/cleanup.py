@@ -41,8 +41,45 @@ def _merge_short_lines(text: str) -> str:
     return "\n".join(merged).strip()
 
 
+def split_paragraphs(text: str) -> list[str]:
+    paragraphs = re.split(r"\n\s*\n", text.strip())
+    return [paragraph.strip() for paragraph in paragraphs if paragraph.strip()]
+
+
+def _split_oversized(paragraph: str, max_chars: int) -> list[str]:
+    if len(paragraph) <= max_chars:
+        return [paragraph]
+    parts: list[str] = []
+    current = ""
+    for sentence in re.split(r"(?<=[.!?؟])\s+", paragraph):
+        while len(sentence) > max_chars:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            parts.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_passages(text: str, max_chars: int) -> list[str]:
+    passages: list[str] = []
+    for paragraph in split_paragraphs(text):
+        passages.extend(_split_oversized(paragraph, max_chars))
+    return passages
+
+
+def cleanup_text(text: str) -> str:
+    normalized = _normalize_whitespace(text)
+    return _merge_short_lines(normalized).strip()
+
+
 def cleanup_transcript_file(source: Path, target: Path) -> None:
     text = source.read_text(encoding="utf-8")
-    normalized = _normalize_whitespace(text)
-    merged = _merge_short_lines(normalized)
-    target.write_text(merged.strip() + "\n", encoding="utf-8")
+    target.write_text(cleanup_text(text) + "\n", encoding="utf-8")
@@ -6,6 +6,11 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from atomize_mvp.logging_utils import configure_logging
+from atomize_mvp.image_cache import IMAGE_CACHE_MODES
+from atomize_mvp.procedural import BACKGROUND_SOURCES
+from atomize_mvp.render_posters import CAPTURE_MODES, POSTER_RENDERERS
+from atomize_mvp.reuse import REUSE_MODES
+from atomize_mvp.routing import STEPS, load_routes, parse_route_spec
 from atomize_mvp.runner import run_pipeline
 from atomize_mvp.web import main as web_main
 
@@ -36,12 +41,123 @@ def build_parser() -> argparse.ArgumentParser:
     run_parser.add_argument("--device", default="cpu", help="Device (default: cpu)")
     run_parser.add_argument("--model", default="gpt-4o-mini", help="LLM model (default: gpt-4o-mini)")
     run_parser.add_argument("--temperature", default=0.3, type=float, help="LLM temperature")
+    run_parser.add_argument(
+        "--route",
+        action="append",
+        default=[],
+        help=(
+            "Per-step model route step=model[:temperature[:max_tokens]]; steps: "
+            f"{', '.join(STEPS)} (repeatable)"
+        ),
+    )
+    run_parser.add_argument(
+        "--routes-file",
+        default=None,
+        help="JSON file mapping steps to model routes (CLI --route entries win)",
+    )
     run_parser.add_argument(
         "--max-input-chars",
         default=120000,
         type=int,
         help="Max characters to send to the model",
     )
+    run_parser.add_argument(
+        "--blueprint-chunks",
+        default=0,
+        type=int,
+        help="Blueprint map-reduce sections (0 = auto from --max-input-chars, 1 = single pass)",
+    )
+    run_parser.add_argument(
+        "--blueprint-workers",
+        default=4,
+        type=int,
+        help="Parallel blueprint map calls (default: 4)",
+    )
+    run_parser.add_argument(
+        "--pipeline-section-minutes",
+        default=0,
+        type=int,
+        help="Map blueprint sections of this many audio minutes during transcription (0 = off)",
+    )
+    run_parser.add_argument(
+        "--reuse-threshold",
+        default=0.0,
+        type=float,
+        help="Reuse blueprint and drafts from a prior job whose transcript has at least "
+        "this MinHash Jaccard similarity (0 = off, e.g. 0.8)",
+    )
+    run_parser.add_argument(
+        "--reuse-mode",
+        default="reuse",
+        choices=list(REUSE_MODES),
+        help="reuse: copy the prior results; refresh: update the prior blueprint from the transcript diff",
+    )
+    run_parser.add_argument(
+        "--poster-concurrency",
+        default=4,
+        type=int,
+        help="Posters rendered at once across pooled browser pages (default: 4)",
+    )
+    run_parser.add_argument(
+        "--poster-renderer",
+        default="browser",
+        choices=list(POSTER_RENDERERS),
+        help="Basic poster renderer: browser (Chromium screenshots) or native (Pillow, no browser)",
+    )
+    run_parser.add_argument(
+        "--poster-capture",
+        default="batch",
+        choices=list(CAPTURE_MODES),
+        help="batch: one full-page capture cropped per card; element: one screenshot per card",
+    )
+    run_parser.add_argument(
+        "--poster-backgrounds",
+        default="ai",
+        choices=list(BACKGROUND_SOURCES),
+        help="AI, structured and premium poster backgrounds: ai (image generation) "
+        "or procedural (drawn locally from the card ID and theme)",
+    )
+    run_parser.add_argument(
+        "--image-cache",
+        default="job",
+        choices=list(IMAGE_CACHE_MODES),
+        help="Where generated poster images are cached: job, shared (across jobs in --out) or off",
+    )
+    run_parser.add_argument(
+        "--image-cache-max-mb",
+        default=1024,
+        type=int,
+        help="Evict least recently used cached images above this size (0 = unbounded)",
+    )
+    run_parser.add_argument(
+        "--compress-tokens",
+        default=0,
+        type=int,
+        help="Extractively compress the transcript to this token budget before LLM steps (0 = off)",
+    )
+    run_parser.add_argument(
+        "--retrieval-tokens",
+        default=0,
+        type=int,
+        help="Send each draft call only BM25-retrieved passages within this token budget (0 = off)",
+    )
+    run_parser.add_argument(
+        "--stream-drafts",
+        action="store_true",
+        help="Stream draft calls and write completed items to drafts.partial.json as they arrive",
+    )
+    run_parser.add_argument(
+        "--draft-shard-size",
+        default=0,
+        type=int,
+        help="Split platforms with more drafts than this into parallel shard requests (0 = off)",
+    )
+    run_parser.add_argument(
+        "--draft-workers",
+        default=4,
+        type=int,
+        help="Parallel shard requests per platform when --draft-shard-size is set",
+    )
     run_parser.add_argument(
         "--lang",
         default="auto",
@@ -68,6 +184,17 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Number of AI posters to generate (default: 2)",
     )
+    run_parser.add_argument(
+        "--ai-poster-workers",
+        default=4,
+        type=int,
+        help="AI poster backgrounds generated and composed at once (default: 4)",
+    )
+    run_parser.add_argument(
+        "--keep-ai-backgrounds",
+        action="store_true",
+        help="Also save the raw AI backgrounds under Posters_AI/_backgrounds",
+    )
     run_parser.add_argument(
         "--structured-posters",
         action="store_true",
@@ -97,8 +224,8 @@ def build_parser() -> argparse.ArgumentParser:
     run_parser.add_argument(
         "--mode",
         default="full",
-        choices=["quick", "full"],
-        help="Run mode (quick or full, default: full)",
+        choices=["quick", "full", "progressive"],
+        help="Run mode: quick, full, or progressive (quick preview, then full; default: full)",
     )
 
     web_parser = subparsers.add_parser("web", help="Start Atomize web server")
@@ -122,6 +249,14 @@ def main() -> None:
             print(f"Input not found: {input_path}", file=sys.stderr)
             sys.exit(2)
 
+        try:
+            routes = load_routes(args.routes_file) if args.routes_file else {}
+            for spec in args.route:
+                routes.update(parse_route_spec(spec))
+        except (OSError, ValueError) as exc:
+            print(f"Invalid model routes: {exc}", file=sys.stderr)
+            sys.exit(2)
+
         configure_logging(out_root, args.client, args.title, args.log_level)
         run_pipeline(
             input_path=input_path,
@@ -143,12 +278,31 @@ def main() -> None:
             ig_count=args.ig_count,
             ai_posters=args.ai_posters,
             ai_poster_count=args.ai_poster_count,
+            ai_poster_workers=args.ai_poster_workers,
+            keep_ai_backgrounds=args.keep_ai_backgrounds,
             structured_posters=args.structured_posters,
             structured_count=args.structured_count,
             structured_theme=args.structured_theme,
             structured_only=args.structured_only,
             structured_premium=args.structured_premium,
             mode=args.mode,
+            blueprint_chunks=args.blueprint_chunks,
+            blueprint_workers=args.blueprint_workers,
+            compress_tokens=args.compress_tokens,
+            retrieval_tokens=args.retrieval_tokens,
+            routes=routes,
+            stream_drafts=args.stream_drafts,
+            draft_shard_size=args.draft_shard_size,
+            draft_workers=args.draft_workers,
+            pipeline_section_seconds=args.pipeline_section_minutes * 60,
+            reuse_threshold=args.reuse_threshold,
+            reuse_mode=args.reuse_mode,
+            poster_concurrency=args.poster_concurrency,
+            poster_renderer=args.poster_renderer,
+            poster_capture=args.poster_capture,
+            image_cache=args.image_cache,
+            poster_backgrounds=args.poster_backgrounds,
+            image_cache_max_mb=args.image_cache_max_mb,
         )
     elif args.command == "web":
         out_root = Path(args.out).expanduser()
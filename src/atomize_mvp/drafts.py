@@ -1,10 +1,21 @@
+import contextvars
 import json
+import logging
+import math
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 
-from atomize_mvp.llm_client import generate_repair_text, generate_text
+from atomize_mvp.json_repair import parse_json_loose, repair_list, repair_model, unwrap_list
+from atomize_mvp.json_schemas import list_schema, model_schema
+from atomize_mvp.json_stream import ArrayItemParser
+from atomize_mvp.llm_client import generate_repair_text, generate_text, stream_text
+from atomize_mvp.minhash import NearDuplicateFilter
+from atomize_mvp.retrieval import BM25Index, retrieve_passages
 from atomize_mvp.schemas import (
     BlogOutline,
     DraftsSchema,
@@ -14,6 +25,11 @@ from atomize_mvp.schemas import (
     XThread,
 )
 
+logger = logging.getLogger(__name__)
+
+DEDUPE_THRESHOLD = 0.7
+MAX_TOPUP_ROUNDS = 3
+
 LINKEDIN_SCHEMA = """[
   {
     "id": "LI-01",
@@ -97,34 +113,50 @@ def _lang_hint(lang: str) -> str:
     return "Output in the same language as the transcript."
 
 
+def _compact_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
 def _build_user_prompt(
     platform: str,
+    instructions: str,
     count: int,
     tone: str,
     lang: str,
     blueprint_json: str,
     transcript_text: str,
 ) -> str:
+    # Shared content goes first so the prompt prefix stays byte-identical across
+    # the platform calls of a job and can be served from the provider prompt cache.
     return (
-        f"Platform: {platform}\n"
-        f"Count: {count}\n"
-        f"Tone: {tone}\n"
-        f"{_lang_hint(lang)}\n"
         "Use blueprint fields heavily. Do not invent facts beyond transcript.\n"
         "Ensure items are unique and non-repetitive.\n\n"
         "Blueprint JSON:\n"
         f"{blueprint_json}\n\n"
         "Transcript:\n"
-        f"{transcript_text}\n"
+        f"{transcript_text}\n\n"
+        "Platform instructions:\n"
+        f"{instructions.strip()}\n\n"
+        f"Platform: {platform}\n"
+        f"Count: {count}\n"
+        f"Tone: {tone}\n"
+        f"{_lang_hint(lang)}\n"
+        f"Requested count: {count}. Output exactly {count} items.\n"
     )
 
 
 def _validate_list(raw: str, adapter: TypeAdapter) -> list:
-    data = json.loads(raw)
+    data = unwrap_list(json.loads(raw))
     return adapter.validate_python(data)
 
 
-def _repair_json(raw: str, schema: str, model: str, temperature: float) -> str:
+def _repair_json(
+    raw: str,
+    schema: str,
+    model: str,
+    temperature: float,
+    json_schema: dict | None = None,
+) -> str:
     prompt = (
         "Fix the JSON to match the schema exactly. Output JSON only.\n"
         f"Schema:\n{schema}\n\n"
@@ -132,7 +164,7 @@ def _repair_json(raw: str, schema: str, model: str, temperature: float) -> str:
         "blueprint phrases (do not invent facts).\n"
         f"Broken output:\n{raw}"
     )
-    return generate_repair_text(prompt, model, temperature)
+    return generate_repair_text(prompt, model, temperature, json_schema)
 
 
 def generate_quick_bundle(
@@ -153,19 +185,279 @@ def generate_quick_bundle(
         "Transcript:\n"
         f"{trimmed_transcript}\n"
     )
-    raw = generate_text(system_prompt, user_prompt, model, temperature)
+    quick_schema = model_schema(QuickBundle)
+    raw = generate_text(
+        system_prompt,
+        user_prompt,
+        model,
+        temperature,
+        quick_schema,
+        "quick_bundle",
+        step="quick",
+    )
     for attempt in range(3):
         try:
             data = json.loads(raw)
             bundle = QuickBundle.model_validate(data)
             return raw, bundle
         except Exception:  # noqa: BLE001
+            repaired = repair_model(raw, QuickBundle)
+            if repaired is not None:
+                return json.dumps(repaired.model_dump(), ensure_ascii=False, indent=2), repaired
             if attempt >= 2:
                 raise
-            raw = _repair_json(raw, QUICK_SCHEMA, model, temperature)
+            raw = _repair_json(raw, QUICK_SCHEMA, model, temperature, quick_schema)
     raise RuntimeError("Failed to generate quick bundle.")
 
 
+def _parse_items(raw: str, adapter: TypeAdapter) -> list:
+    try:
+        return _validate_list(raw, adapter)
+    except Exception:  # noqa: BLE001
+        pass
+    items = repair_list(raw, adapter)
+    if items is not None:
+        return items
+    try:
+        data = unwrap_list(parse_json_loose(raw))
+    except ValueError:
+        return []
+    if not isinstance(data, list):
+        return []
+    valid = []
+    for entry in data:
+        try:
+            valid.extend(adapter.validate_python([entry]))
+        except Exception:  # noqa: BLE001
+            continue
+    return valid
+
+
+def _id_prefix(schema: str) -> str:
+    match = re.search(r'"id": "([A-Za-z]+)-', schema)
+    return match.group(1) if match else "ITEM"
+
+
+def _item_hook(item) -> str:
+    for field in ("hook", "title"):
+        value = getattr(item, field, None)
+        if value:
+            return value
+    for field in ("tweets", "slides"):
+        values = getattr(item, field, None)
+        if values:
+            return values[0]
+    return ""
+
+
+def _next_id(prefix: str, used: set[str], start: int) -> tuple[str, int]:
+    idx = start
+    while f"{prefix}-{idx:02d}" in used:
+        idx += 1
+    return f"{prefix}-{idx:02d}", idx
+
+
+def _renumber(items: list, existing: list, prefix: str) -> list:
+    used = {item.id for item in existing}
+    idx = len(existing) + 1
+    renumbered = []
+    for item in items:
+        new_id, idx = _next_id(prefix, used, idx)
+        used.add(new_id)
+        renumbered.append(item.model_copy(update={"id": new_id}))
+    return renumbered
+
+
+def _build_topup_prompt(
+    platform: str,
+    instructions: str,
+    missing: int,
+    tone: str,
+    lang: str,
+    blueprint_json: str,
+    transcript_text: str,
+    existing: list,
+    prefix: str,
+) -> str:
+    existing_lines = "\n".join(f"- {item.id}: {_item_hook(item)}" for item in existing)
+    next_id, _ = _next_id(prefix, {item.id for item in existing}, len(existing) + 1)
+    return _build_user_prompt(
+        platform=platform,
+        instructions=instructions,
+        count=missing,
+        tone=tone,
+        lang=lang,
+        blueprint_json=blueprint_json,
+        transcript_text=transcript_text,
+    ) + (
+        "\nThese items already exist. Do not repeat their IDs, hooks or angles:\n"
+        f"{existing_lines}\n"
+        f"Return only the {missing} missing items as a JSON array, starting at id {next_id}.\n"
+    )
+
+
+def _dump_items(items: list) -> str:
+    return json.dumps([item.model_dump() for item in items], ensure_ascii=False, indent=2)
+
+
+def _stream_platform(
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    temperature: float,
+    json_schema: dict,
+    adapter: TypeAdapter,
+    count: int,
+    on_progress: Callable[[list], None],
+) -> str:
+    parser = ArrayItemParser()
+    streamed: list = []
+
+    def on_delta(delta: str) -> None:
+        for data in parser.feed(delta):
+            if len(streamed) >= count:
+                return
+            try:
+                streamed.extend(adapter.validate_python([data]))
+            except ValidationError as exc:
+                logger.info("Skipping invalid streamed item: %s", exc)
+                continue
+            on_progress(list(streamed))
+
+    return stream_text(
+        system_prompt,
+        user_prompt,
+        model,
+        temperature,
+        on_delta,
+        json_schema,
+        "platform_drafts",
+    )
+
+
+def _item_text(item) -> str:
+    parts: list[str] = []
+    for value in item.model_dump(exclude={"id"}).values():
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, list):
+            parts.extend(entry for entry in value if isinstance(entry, str))
+    return " ".join(parts)
+
+
+def _shard_counts(count: int, shard_size: int) -> list[int]:
+    shards = math.ceil(count / shard_size)
+    base, extra = divmod(count, shards)
+    return [base + (1 if idx < extra else 0) for idx in range(shards)]
+
+
+def _shard_blueprint(blueprint: dict, index: int, total: int) -> dict:
+    # Each shard leads with a different slice of hooks and key points.
+    sharded = dict(blueprint)
+    for field in ("hooks", "key_points"):
+        selected = (blueprint.get(field) or [])[index::total]
+        if selected:
+            sharded[field] = selected
+    return sharded
+
+
+def _generate_sharded(
+    name: str,
+    prompt_path: Path,
+    schema: str,
+    count: int,
+    tone: str,
+    lang: str,
+    blueprint: dict,
+    transcript: str,
+    model: str,
+    temperature: float,
+    max_input_chars: int,
+    adapter: TypeAdapter,
+    shard_size: int,
+    workers: int,
+    on_progress: Callable[[list], None] | None = None,
+) -> tuple[str, list]:
+    counts = _shard_counts(count, shard_size)
+    prefix = _id_prefix(schema)
+    logger.info("%s: generating %s items in %s shards", name, count, len(counts))
+    shards: list[list] = [[] for _ in counts]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run,
+                _generate_platform,
+                name=name,
+                prompt_path=prompt_path,
+                schema=schema,
+                count=shard_count,
+                tone=tone,
+                lang=lang,
+                blueprint=_shard_blueprint(blueprint, idx, len(counts)),
+                transcript=transcript,
+                model=model,
+                temperature=temperature,
+                max_input_chars=max_input_chars,
+                adapter=adapter,
+            ): idx
+            for idx, shard_count in enumerate(counts)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                _, shards[idx] = future.result()
+            except (ValueError, RuntimeError) as exc:
+                # A failed shard just leaves a gap for the top-up below.
+                logger.warning("%s shard %s failed: %s", name, idx + 1, exc)
+            if on_progress is not None:
+                on_progress(_renumber([item for shard in shards for item in shard], [], prefix))
+
+    dedupe = NearDuplicateFilter(DEDUPE_THRESHOLD)
+    merged = [item for shard in shards for item in shard]
+    unique = [item for item in merged if dedupe.add(_item_text(item))]
+    if len(unique) < len(merged):
+        logger.info("%s: dropped %s near-duplicate items", name, len(merged) - len(unique))
+    items = _renumber(unique, [], prefix)
+
+    system_prompt = (prompt_path.parent / "drafts.txt").read_text(encoding="utf-8")
+    instructions = prompt_path.read_text(encoding="utf-8")
+    for _ in range(MAX_TOPUP_ROUNDS):
+        missing = count - len(items)
+        if missing <= 0:
+            break
+        logger.info("%s: topping up %s missing items", name, missing)
+        topup_prompt = _build_topup_prompt(
+            platform=name,
+            instructions=instructions,
+            missing=missing,
+            tone=tone,
+            lang=lang,
+            blueprint_json=_compact_json(blueprint),
+            transcript_text=_truncate_text(transcript, max_input_chars),
+            existing=items,
+            prefix=prefix,
+        )
+        raw = generate_text(
+            system_prompt,
+            topup_prompt,
+            model,
+            temperature,
+            list_schema(adapter, missing),
+            "platform_drafts",
+        )
+        fresh = [item for item in _parse_items(raw, adapter) if dedupe.add(_item_text(item))]
+        items.extend(_renumber(fresh, items, prefix))
+
+    items = items[:count]
+    if len(items) < count:
+        raise ValueError(
+            f"Model did not return the requested item count ({len(items)} != {count})."
+        )
+    if on_progress is not None:
+        on_progress(list(items))
+    return _dump_items(items), items
+
+
 def _generate_platform(
     name: str,
     prompt_path: Path,
@@ -179,39 +471,136 @@ def _generate_platform(
     temperature: float,
     max_input_chars: int,
     adapter: TypeAdapter,
+    on_progress: Callable[[list], None] | None = None,
+    shard_size: int = 0,
+    workers: int = 4,
 ) -> tuple[str, list]:
     if os.environ.get("ATOMIZE_OFFLINE") == "1":
         raise RuntimeError("ATOMIZE_OFFLINE is not supported for Phase 4.")
-
-    system_prompt = prompt_path.read_text(encoding="utf-8")
-    system_prompt = system_prompt + f"\nRequested count: {count}. Output exactly {count} items."
-    blueprint_json = json.dumps(blueprint, indent=2, sort_keys=True)
+    if shard_size > 0 and count > shard_size:
+        return _generate_sharded(
+            name=name,
+            prompt_path=prompt_path,
+            schema=schema,
+            count=count,
+            tone=tone,
+            lang=lang,
+            blueprint=blueprint,
+            transcript=transcript,
+            model=model,
+            temperature=temperature,
+            max_input_chars=max_input_chars,
+            adapter=adapter,
+            shard_size=shard_size,
+            workers=workers,
+            on_progress=on_progress,
+        )
+
+    system_prompt = (prompt_path.parent / "drafts.txt").read_text(encoding="utf-8")
+    instructions = prompt_path.read_text(encoding="utf-8")
+    blueprint_json = _compact_json(blueprint)
     trimmed_transcript = _truncate_text(transcript, max_input_chars)
     user_prompt = _build_user_prompt(
         platform=name,
+        instructions=instructions,
         count=count,
         tone=tone,
         lang=lang,
         blueprint_json=blueprint_json,
         transcript_text=trimmed_transcript,
     )
-    raw = generate_text(system_prompt, user_prompt, model, temperature)
-
+    if on_progress is None:
+        raw = generate_text(
+            system_prompt,
+            user_prompt,
+            model,
+            temperature,
+            list_schema(adapter, count),
+            "platform_drafts",
+        )
+    else:
+        raw = _stream_platform(
+            system_prompt,
+            user_prompt,
+            model,
+            temperature,
+            list_schema(adapter, count),
+            adapter,
+            count,
+            on_progress,
+        )
+    prefix = _id_prefix(schema)
+
+    items: list = []
     for attempt in range(3):
-        try:
-            items = _validate_list(raw, adapter)
-            if len(items) != count:
-                raise ValueError(
-                    f"Model did not return the requested item count ({len(items)} != {count})."
-                )
-            return raw, items
-        except Exception:  # noqa: BLE001
-            if attempt >= 2:
-                raise
-            raw = _repair_json(raw, schema, model, temperature)
+        parsed = _parse_items(raw, adapter)
+        if items:
+            parsed = _renumber(parsed, items, prefix)
+        items.extend(parsed)
+        if len(items) > count:
+            logger.info("%s returned %s items, trimming to %s", name, len(items), count)
+            items = items[:count]
+        if on_progress is not None:
+            on_progress(list(items))
+        if len(items) == count:
+            if attempt == 0 and len(parsed) == count:
+                return raw, items
+            return _dump_items(items), items
+        if attempt >= 2:
+            raise ValueError(
+                f"Model did not return the requested item count ({len(items)} != {count})."
+            )
+        if not items:
+            raw = _repair_json(
+                raw, schema, model, temperature, list_schema(adapter, count)
+            )
+            continue
+        missing = count - len(items)
+        logger.info(
+            "%s returned %s of %s items, requesting %s more", name, len(items), count, missing
+        )
+        topup_prompt = _build_topup_prompt(
+            platform=name,
+            instructions=instructions,
+            missing=missing,
+            tone=tone,
+            lang=lang,
+            blueprint_json=blueprint_json,
+            transcript_text=trimmed_transcript,
+            existing=items,
+            prefix=prefix,
+        )
+        raw = generate_text(
+            system_prompt,
+            topup_prompt,
+            model,
+            temperature,
+            list_schema(adapter, missing),
+            "platform_drafts",
+        )
     raise RuntimeError("Failed to generate valid platform drafts.")
 
 
+def _platform_transcript(
+    index: BM25Index | None,
+    blueprint: dict,
+    platform: str,
+    transcript: str,
+    retrieval_tokens: int,
+) -> str:
+    if index is None:
+        return transcript
+    return retrieve_passages(index, blueprint, platform, retrieval_tokens)
+
+
+def _field_progress(
+    on_progress: Callable[[str, list], None] | None, field: str
+) -> Callable[[list], None] | None:
+    if on_progress is None:
+        return None
+    return lambda items: on_progress(field, items)
+
+
 def generate_all_drafts(
     blueprint: dict,
     transcript: str,
@@ -225,6 +614,10 @@ def generate_all_drafts(
     x_count: int,
     blog_count: int,
     ig_count: int,
+    retrieval_tokens: int = 0,
+    on_progress: Callable[[str, list], None] | None = None,
+    shard_size: int = 0,
+    workers: int = 4,
 ) -> tuple[DraftsSchema, dict[str, str]]:
     linkedin_adapter = TypeAdapter(list[LinkedinPost])
     x_adapter = TypeAdapter(list[XThread])
@@ -232,6 +625,7 @@ def generate_all_drafts(
     ig_adapter = TypeAdapter(list[IGStory])
 
     raw_outputs: dict[str, str] = {}
+    index = BM25Index.from_text(transcript) if retrieval_tokens > 0 else None
 
     raw, linkedin = _generate_platform(
         name="LinkedIn",
@@ -241,11 +635,16 @@ def generate_all_drafts(
         tone=tone,
         lang=lang,
         blueprint=blueprint,
-        transcript=transcript,
+        transcript=_platform_transcript(
+            index, blueprint, "LinkedIn", transcript, retrieval_tokens
+        ),
         model=model,
         temperature=temperature,
         max_input_chars=max_input_chars,
         adapter=linkedin_adapter,
+        on_progress=_field_progress(on_progress, "linkedin_posts"),
+        shard_size=shard_size,
+        workers=workers,
     )
     raw_outputs["raw_linkedin"] = raw
 
@@ -257,11 +656,16 @@ def generate_all_drafts(
         tone=tone,
         lang=lang,
         blueprint=blueprint,
-        transcript=transcript,
+        transcript=_platform_transcript(
+            index, blueprint, "X", transcript, retrieval_tokens
+        ),
         model=model,
         temperature=temperature,
         max_input_chars=max_input_chars,
         adapter=x_adapter,
+        on_progress=_field_progress(on_progress, "x_threads"),
+        shard_size=shard_size,
+        workers=workers,
     )
     raw_outputs["raw_x_threads"] = raw
 
@@ -273,11 +677,16 @@ def generate_all_drafts(
         tone=tone,
         lang=lang,
         blueprint=blueprint,
-        transcript=transcript,
+        transcript=_platform_transcript(
+            index, blueprint, "Blog", transcript, retrieval_tokens
+        ),
         model=model,
         temperature=temperature,
         max_input_chars=max_input_chars,
         adapter=blog_adapter,
+        on_progress=_field_progress(on_progress, "blog_outlines"),
+        shard_size=shard_size,
+        workers=workers,
     )
     raw_outputs["raw_blog_outlines"] = raw
 
@@ -289,11 +698,16 @@ def generate_all_drafts(
         tone=tone,
         lang=lang,
         blueprint=blueprint,
-        transcript=transcript,
+        transcript=_platform_transcript(
+            index, blueprint, "IG Stories", transcript, retrieval_tokens
+        ),
         model=model,
         temperature=temperature,
         max_input_chars=max_input_chars,
         adapter=ig_adapter,
+        on_progress=_field_progress(on_progress, "ig_stories"),
+        shard_size=shard_size,
+        workers=workers,
     )
     raw_outputs["raw_ig_stories"] = raw
 
@@ -311,3 +725,14 @@ def write_drafts_json(path: Path, drafts: DraftsSchema) -> None:
         json.dumps(drafts.model_dump(), indent=2, sort_keys=True),
         encoding="utf-8",
     )
+
+
+def write_partial_drafts(path: Path, partial: dict[str, list]) -> None:
+    data = {field: [item.model_dump() for item in items] for field, items in partial.items()}
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    # Readers poll this file, so swap it in atomically.
+    tmp_path.replace(path)
@@ -0,0 +1,132 @@
+import math
+import re
+from pathlib import Path
+
+import numpy as np
+
+from atomize_mvp.cleanup import split_paragraphs
+
+SENTENCE_RE = re.compile(r"[^.!?؟。]+(?:[.!?؟。]+|$)")
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+MAX_FEATURES = 4096
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+def split_sentences(text: str) -> list[tuple[int, str]]:
+    sentences: list[tuple[int, str]] = []
+    for paragraph_idx, paragraph in enumerate(split_paragraphs(text)):
+        for line in paragraph.splitlines():
+            for match in SENTENCE_RE.finditer(line):
+                sentence = match.group(0).strip()
+                if sentence:
+                    sentences.append((paragraph_idx, sentence))
+    return sentences
+
+
+def _tfidf_matrix(sentences: list[str]) -> np.ndarray:
+    tokenized = [WORD_RE.findall(sentence.lower()) for sentence in sentences]
+    doc_freq: dict[str, int] = {}
+    for tokens in tokenized:
+        for token in set(tokens):
+            doc_freq[token] = doc_freq.get(token, 0) + 1
+
+    # Terms that appear in a single sentence add nothing to cross-sentence similarity.
+    shared = [term for term, freq in doc_freq.items() if freq > 1]
+    shared.sort(key=lambda term: doc_freq[term], reverse=True)
+    vocab = {term: idx for idx, term in enumerate(shared[:MAX_FEATURES])}
+
+    matrix = np.zeros((len(sentences), max(len(vocab), 1)), dtype=np.float32)
+    for row, tokens in enumerate(tokenized):
+        for token in tokens:
+            col = vocab.get(token)
+            if col is not None:
+                matrix[row, col] += 1.0
+
+    if vocab:
+        freqs = np.zeros(len(vocab), dtype=np.float32)
+        for term, col in vocab.items():
+            freqs[col] = doc_freq[term]
+        idf = np.log((1.0 + len(sentences)) / (1.0 + freqs)) + 1.0
+        matrix *= idf
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def rank_sentences(
+    sentences: list[str], damping: float = 0.85, iterations: int = 50
+) -> np.ndarray:
+    count = len(sentences)
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    matrix = _tfidf_matrix(sentences)
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0.0)
+
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    dangling = row_sums[:, 0] == 0
+    row_sums[row_sums == 0] = 1.0
+    transition = similarity / row_sums
+    transition[dangling] = 1.0 / count
+
+    scores = np.full(count, 1.0 / count, dtype=np.float32)
+    for _ in range(iterations):
+        updated = (1.0 - damping) / count + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < 1e-6:
+            scores = updated
+            break
+        scores = updated
+    return scores
+
+
+def compress_text(text: str, target_tokens: int) -> tuple[str, dict]:
+    original_tokens = estimate_tokens(text)
+    sentences = split_sentences(text)
+    stats = {
+        "target_tokens": target_tokens,
+        "original_tokens": original_tokens,
+        "compressed_tokens": original_tokens,
+        "sentences_total": len(sentences),
+        "sentences_kept": len(sentences),
+        "ratio": 1.0,
+    }
+    if target_tokens <= 0 or original_tokens <= target_tokens or not sentences:
+        return text, stats
+
+    scores = rank_sentences([sentence for _, sentence in sentences])
+    budget_chars = target_tokens * 4
+    selected: list[int] = []
+    used = 0
+    for idx in np.argsort(-scores, kind="stable"):
+        length = len(sentences[idx][1]) + 2
+        if used + length > budget_chars:
+            continue
+        selected.append(int(idx))
+        used += length
+
+    paragraphs: dict[int, list[str]] = {}
+    for idx in sorted(selected):
+        paragraph_idx, sentence = sentences[idx]
+        paragraphs.setdefault(paragraph_idx, []).append(sentence)
+    compressed = "\n\n".join(" ".join(parts) for parts in paragraphs.values())
+
+    compressed_tokens = estimate_tokens(compressed)
+    stats.update(
+        {
+            "compressed_tokens": compressed_tokens,
+            "sentences_kept": len(selected),
+            "ratio": round(compressed_tokens / max(original_tokens, 1), 4),
+        }
+    )
+    return compressed, stats
+
+
+def compress_transcript_file(source: Path, target: Path, target_tokens: int) -> dict:
+    text = source.read_text(encoding="utf-8")
+    compressed, stats = compress_text(text, target_tokens)
+    target.write_text(compressed.strip() + "\n", encoding="utf-8")
+    return stats
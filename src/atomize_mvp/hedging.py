@@ -0,0 +1,150 @@
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZE = 200
+T = TypeVar("T")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        logger.warning("Ignoring invalid %s", name)
+        return default
+
+
+def hedging_enabled() -> bool:
+    return os.environ.get("ATOMIZE_HEDGE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class HedgePolicy:
+    """Fire a duplicate request once a call runs past its usual latency.
+
+    Latency history is kept per call type. A hedge is only sent after
+    ``min_samples`` observations, once the primary exceeds the configured
+    percentile, and while hedged calls stay under ``budget`` of all calls.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.1,
+        min_samples: int = 10,
+        max_workers: int = 8,
+    ) -> None:
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._history: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="atomize-hedge"
+        )
+        self.calls = 0
+        self.hedges = 0
+        self.wins = 0
+
+    @classmethod
+    def from_env(cls) -> "HedgePolicy":
+        return cls(
+            percentile=_env_float("ATOMIZE_HEDGE_PERCENTILE", 95.0),
+            budget=_env_float("ATOMIZE_HEDGE_BUDGET", 0.1),
+            min_samples=int(_env_float("ATOMIZE_HEDGE_MIN_SAMPLES", 10)),
+        )
+
+    def threshold(self, call_type: str) -> float | None:
+        with self._lock:
+            samples = sorted(self._history.get(call_type, ()))
+        if len(samples) < self.min_samples:
+            return None
+        rank = max(0, math.ceil(self.percentile / 100.0 * len(samples)) - 1)
+        return samples[rank]
+
+    def record(self, call_type: str, seconds: float) -> None:
+        with self._lock:
+            self._history.setdefault(call_type, deque(maxlen=HISTORY_SIZE)).append(seconds)
+
+    def _reserve_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def _submit(self, func: Callable[[], T]) -> Future:
+        return self._executor.submit(contextvars.copy_context().run, func)
+
+    def run(self, call_type: str, func: Callable[[], T]) -> T:
+        with self._lock:
+            self.calls += 1
+        started = time.monotonic()
+        threshold = self.threshold(call_type)
+        if threshold is None:
+            result = func()
+            self.record(call_type, time.monotonic() - started)
+            return result
+
+        primary = self._submit(func)
+        done, _ = wait([primary], timeout=threshold)
+        if done or not self._reserve_hedge():
+            result = primary.result()
+            self.record(call_type, time.monotonic() - started)
+            return result
+
+        logger.info("Hedging %s after %.1fs", call_type, threshold)
+        hedge = self._submit(func)
+        pending = {primary, hedge}
+        first_error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    first_error = first_error or future.exception()
+                    continue
+                # The slower request keeps running; its result is discarded.
+                won = future is hedge
+                with self._lock:
+                    self.wins += int(won)
+                    win_rate = self.wins / self.hedges
+                logger.info(
+                    "Hedge for %s %s (win rate %.0f%% over %s hedges)",
+                    call_type,
+                    "won" if won else "lost",
+                    win_rate * 100,
+                    self.hedges,
+                )
+                self.record(call_type, time.monotonic() - started)
+                return future.result()
+        raise first_error
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedges": self.hedges,
+                "wins": self.wins,
+                "win_rate": round(self.wins / self.hedges, 4) if self.hedges else 0.0,
+            }
+
+
+_POLICY: HedgePolicy | None = None
+_POLICY_LOCK = threading.Lock()
+
+
+def get_policy() -> HedgePolicy | None:
+    global _POLICY
+    if not hedging_enabled():
+        return None
+    with _POLICY_LOCK:
+        if _POLICY is None:
+            _POLICY = HedgePolicy.from_env()
+    return _POLICY
@@ -0,0 +1,158 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+
+from atomize_mvp.llm_client import generate_image_base64
+from atomize_mvp.routing import resolve_route
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_MODES = ("job", "shared", "off")
+IMAGE_SIZE = "1024x1024"
+MB = 1024 * 1024
+
+
+def image_source(model: str, size: str = IMAGE_SIZE) -> dict:
+    """The routed image model and size that actually produce a poster background."""
+    return {"model": resolve_route("image", model, 0.0).model, "size": size}
+
+
+def image_cache_root(mode: str, state_dir: Path, out_root: Path) -> Path | None:
+    """Cache directory for ``mode``: the job's state dir, or one shared by all jobs."""
+    if mode not in IMAGE_CACHE_MODES:
+        raise ValueError(f"Unknown image cache mode '{mode}'.")
+    if mode == "shared":
+        return out_root / ".atomize_cache" / "images"
+    if mode == "job":
+        return state_dir / "images"
+    return None
+
+
+class ImageCache:
+    """Generated images on disk, addressed by ``(prompt, model, size)``.
+
+    The structured, premium and AI poster steps ask for the same backgrounds,
+    so each distinct request is generated once and read back afterwards.
+    Concurrent requests for a key that is still being generated wait for that
+    call instead of starting their own. With ``max_bytes`` set, the least
+    recently used files are evicted once the cache grows past it.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int = 0,
+        generate: Callable[..., str] = generate_image_base64,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._generate = generate
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evicted = 0
+
+    @staticmethod
+    def key(prompt: str, model: str, size: str) -> str:
+        payload = json.dumps([prompt, model, size], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.png"
+
+    def _read(self, path: Path) -> bytes | None:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        # Reads refresh the mtime, which is the recency used for eviction.
+        os.utime(path)
+        return data
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp, path)
+
+    def get(self, prompt: str, model: str, size: str) -> bytes:
+        """PNG bytes for the request, generating them only on a cache miss."""
+        key = self.key(prompt, image_source(model, size)["model"], size)
+        path = self.path(key)
+        with self._lock:
+            data = self._read(path)
+            if data is not None:
+                self.hits += 1
+                return data
+            pending = self._in_flight.get(key)
+            if pending is None:
+                future: Future = Future()
+                self._in_flight[key] = future
+        if pending is not None:
+            with self._lock:
+                self.shared += 1
+            return pending.result()
+
+        try:
+            data = base64.b64decode(self._generate(prompt, model=model, size=size))
+            self._write(path, data)
+        except BaseException as exc:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            self._in_flight.pop(key, None)
+            self.misses += 1
+        future.set_result(data)
+        self.evict()
+        return data
+
+    def evict(self) -> None:
+        if not self.max_bytes or not self.root.exists():
+            return
+        with self._lock:
+            files = []
+            for path in self.root.glob("*/*.png"):
+                try:
+                    files.append((path.stat(), path))
+                except OSError:
+                    continue
+            total = sum(stat.st_size for stat, _ in files)
+            for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError as exc:
+                    logger.warning("Evicting %s failed: %s", path, exc)
+                    continue
+                total -= stat.st_size
+                self.evicted += 1
+
+    def metrics(self) -> dict:
+        return {
+            "root": str(self.root),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "evicted": self.evicted,
+        }
+
+
+def generate_image(
+    prompt: str, model: str, size: str, cache: ImageCache | None = None
+) -> bytes:
+    if cache is None:
+        return base64.b64decode(generate_image_base64(prompt, model=model, size=size))
+    return cache.get(prompt, model, size)
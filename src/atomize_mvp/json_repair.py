@@ -0,0 +1,180 @@
+import json
+import logging
+import re
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.*?)```", re.DOTALL)
+SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "„": '"', "«": '"', "»": '"'})
+PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def strip_fences(text: str) -> str:
+    match = FENCE_RE.search(text)
+    if match:
+        return match.group(1).strip()
+    return text.strip()
+
+
+def _extract_block(text: str) -> str:
+    starts = [pos for pos in (text.find("{"), text.find("[")) if pos != -1]
+    if not starts:
+        return text
+    start = min(starts)
+    closer = "}" if text[start] == "{" else "]"
+    end = text.rfind(closer)
+    if end <= start:
+        return text[start:]
+    return text[start : end + 1]
+
+
+def _normalize(text: str) -> str:
+    out: list[str] = []
+    stack: list[str] = []
+    quote = ""
+    idx = 0
+    while idx < len(text):
+        char = text[idx]
+        if quote:
+            if char == "\\" and idx + 1 < len(text):
+                escaped = text[idx + 1]
+                out.append("'" if escaped == "'" else text[idx : idx + 2])
+                idx += 2
+                continue
+            if char == quote:
+                out.append('"')
+                quote = ""
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            else:
+                out.append(char)
+            idx += 1
+            continue
+        if char in "\"'":
+            quote = char
+            out.append('"')
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+            out.append(char)
+        elif char in "}]":
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(char)
+        elif char.isalpha() or char == "_":
+            word = re.match(r"\w+", text[idx:]).group(0)
+            idx += len(word)
+            if re.match(r"\s*:", text[idx:]):
+                out.append(f'"{word}"')
+            else:
+                out.append(PY_LITERALS.get(word, word))
+            continue
+        else:
+            out.append(char)
+        idx += 1
+
+    # Close anything left open by a truncated response.
+    if quote:
+        out.append('"')
+    while out and (out[-1].isspace() or out[-1] == ","):
+        out.pop()
+    out.extend(reversed(stack))
+    return "".join(out)
+
+
+def parse_json_loose(raw: str) -> Any:
+    text = strip_fences(raw or "")
+    candidates = [text, _extract_block(text)]
+    block = candidates[-1]
+    candidates.append(_normalize(block))
+    candidates.append(_normalize(block.translate(SMART_QUOTES)))
+    last_error: Exception | None = None
+    for candidate in candidates:
+        try:
+            return json.loads(candidate, strict=False)
+        except ValueError as exc:
+            last_error = exc
+    raise ValueError(f"Could not repair JSON locally: {last_error}")
+
+
+def unwrap_list(data: Any) -> Any:
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        list_values = [value for value in data.values() if isinstance(value, list)]
+        if len(data) == 1 and len(list_values) == 1:
+            return list_values[0]
+        if "items" in data and isinstance(data["items"], list):
+            return data["items"]
+        if "id" in data:
+            return [data]
+    return data
+
+
+def count_limits(model: type[BaseModel]) -> dict[str, tuple[int, int | None]]:
+    limits: dict[str, tuple[int, int | None]] = {}
+    for name, prop in model.model_json_schema().get("properties", {}).items():
+        if prop.get("type") != "array":
+            continue
+        # Only string lists can be padded safely; object lists are trimmed only.
+        paddable = prop.get("items", {}).get("type") == "string"
+        min_items = prop.get("minItems", 0) if paddable else 0
+        limits[name] = (min_items, prop.get("maxItems"))
+    return limits
+
+
+def fit_list_counts(data: dict, limits: dict[str, tuple[int, int | None]]) -> dict:
+    fitted = dict(data)
+    for name, (min_len, max_len) in limits.items():
+        items = fitted.get(name)
+        if not isinstance(items, list):
+            continue
+        items = [item for item in items if item]
+        if max_len is not None and len(items) > max_len:
+            items = items[:max_len]
+        if len(items) < min_len:
+            # Pad by repeating the list's own entries; other fields mean other
+            # things (verbatim quotes, banned phrases). An empty list stays
+            # empty so validation fails and the LLM repair runs instead.
+            source = items[:]
+            idx = 0
+            while source and len(items) < min_len:
+                items.append(source[idx % len(source)])
+                idx += 1
+        fitted[name] = items
+    return fitted
+
+
+def repair_model(raw: str, model: type[BaseModel]) -> BaseModel | None:
+    try:
+        data = parse_json_loose(raw)
+        if isinstance(data, dict) and len(data) == 1:
+            inner = next(iter(data.values()))
+            if isinstance(inner, dict) and not set(data) & set(model.model_fields):
+                data = inner
+        if isinstance(data, dict):
+            data = fit_list_counts(data, count_limits(model))
+        result = model.model_validate(data)
+    except Exception as exc:  # noqa: BLE001
+        logger.info("Local JSON repair failed for %s: %s", model.__name__, exc)
+        return None
+    logger.info("Local JSON repair succeeded for %s", model.__name__)
+    return result
+
+
+def repair_list(raw: str, adapter: TypeAdapter) -> list | None:
+    try:
+        result = adapter.validate_python(unwrap_list(parse_json_loose(raw)))
+    except Exception as exc:  # noqa: BLE001
+        logger.info("Local JSON repair failed for list: %s", exc)
+        return None
+    logger.info("Local JSON repair succeeded for list")
+    return result
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, TypeAdapter
+
+DROP_KEYS = {"title", "default", "description"}
+
+
+def strict_schema(schema):
+    if isinstance(schema, list):
+        return [strict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    strict = {}
+    for key, value in schema.items():
+        if key in DROP_KEYS:
+            continue
+        if key in {"properties", "$defs"}:
+            strict[key] = {name: strict_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = strict_schema(value)
+    if "properties" in schema:
+        # Strict mode needs every property listed as required and no extras.
+        strict["required"] = list(schema["properties"])
+        strict["additionalProperties"] = False
+    return strict
+
+
+def model_schema(model: type[BaseModel]) -> dict:
+    return strict_schema(model.model_json_schema())
+
+
+def list_schema(adapter: TypeAdapter, count: int | None = None) -> dict:
+    schema = adapter.json_schema()
+    defs = schema.pop("$defs", {})
+    if count is not None:
+        schema["minItems"] = count
+        schema["maxItems"] = count
+    # Structured outputs need an object at the root, so lists are wrapped in "items".
+    wrapper = {
+        "type": "object",
+        "properties": {"items": schema},
+    }
+    if defs:
+        wrapper["$defs"] = defs
+    return strict_schema(wrapper)
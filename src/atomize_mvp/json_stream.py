@@ -0,0 +1,63 @@
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ArrayItemParser:
+    """Incrementally pull complete objects out of a streamed JSON array.
+
+    The first array in the stream is treated as the item list, so both a bare
+    ``[...]`` and a structured-output wrapper like ``{"items": [...]}`` work.
+    Each object is returned as soon as its closing brace arrives.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._array_depth: int | None = None
+        self._item: list[str] | None = None
+        self._in_string = False
+        self._escaped = False
+        self.done = False
+
+    def feed(self, chunk: str) -> list[Any]:
+        items: list[Any] = []
+        for char in chunk:
+            if self.done:
+                break
+            if self._item is not None:
+                self._item.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if char == "[" and self._array_depth is None:
+                    self._array_depth = self._depth + 1
+                elif char == "{" and self._depth == self._array_depth:
+                    self._item = [char]
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._array_depth is None:
+                    continue
+                if char == "]" and self._depth < self._array_depth:
+                    self.done = True
+                elif char == "}" and self._item is not None and self._depth == self._array_depth:
+                    items.extend(self._emit("".join(self._item)))
+                    self._item = None
+        return items
+
+    def _emit(self, text: str) -> list[Any]:
+        try:
+            return [json.loads(text)]
+        except ValueError as exc:
+            logger.info("Skipping unparsable streamed item: %s", exc)
+            return []
@@ -1,11 +1,21 @@
 import os
 import json
 import logging
+import threading
+from contextvars import ContextVar
 from datetime import datetime, timezone
+from typing import Callable
 
-from openai import OpenAI
+from openai import BadRequestError, OpenAI
+
+from atomize_mvp.hedging import get_policy as get_hedge_policy
+from atomize_mvp.rate_limit import call_with_retry, estimate_request_tokens
+from atomize_mvp.routing import ModelRoute, resolve_route
 
 _SYSTEM_PROMPT = ""
+_USAGE_SCOPE: ContextVar[str] = ContextVar("atomize_usage_scope", default="")
+_USAGE: dict[str, list[dict]] = {}
+_USAGE_LOCK = threading.Lock()
 logger = logging.getLogger(__name__)
 
 
@@ -14,11 +24,50 @@ def set_system_prompt(prompt: str) -> None:
     _SYSTEM_PROMPT = prompt
 
 
+def set_usage_scope(scope: str) -> None:
+    _USAGE_SCOPE.set(scope)
+
+
+def _record_usage(response, context: str) -> None:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    details = getattr(usage, "input_tokens_details", None)
+    record = {
+        "context": context,
+        "model": getattr(response, "model", None),
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+    }
+    logger.info(
+        "LLM usage for %s: input=%s cached=%s output=%s",
+        context,
+        record["input_tokens"],
+        record["cached_tokens"],
+        record["output_tokens"],
+    )
+    with _USAGE_LOCK:
+        _USAGE.setdefault(_USAGE_SCOPE.get(), []).append(record)
+
+
+def pop_usage() -> dict:
+    with _USAGE_LOCK:
+        records = _USAGE.pop(_USAGE_SCOPE.get(), [])
+    totals = {"calls": len(records), "input_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+    for record in records:
+        for key in ("input_tokens", "cached_tokens", "output_tokens"):
+            totals[key] += record[key]
+    totals["models"] = sorted({record["model"] for record in records if record.get("model")})
+    return totals
+
+
 def _build_client() -> OpenAI:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is not set in the environment.")
-    return OpenAI(api_key=api_key)
+    # Retries are handled by rate_limit.call_with_retry so they share the limiter.
+    return OpenAI(api_key=api_key, max_retries=0)
 
 
 def _collect_text(node, chunks: list[str]) -> None:
@@ -79,63 +128,206 @@ def _response_text(response, context: str) -> str:
     return merged
 
 
-def _responses_create(client: OpenAI, **kwargs):
+def _structured_outputs_enabled() -> bool:
+    value = os.environ.get("ATOMIZE_STRUCTURED_OUTPUTS", "1")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _text_format(schema: dict | None, schema_name: str) -> dict:
+    if schema is not None and _structured_outputs_enabled():
+        return {
+            "format": {
+                "type": "json_schema",
+                "name": schema_name,
+                "schema": schema,
+                "strict": True,
+            }
+        }
+    return {"format": {"type": "json_object"}}
+
+
+def _route_kwargs(route: ModelRoute, temperature: bool = True) -> dict:
+    kwargs: dict = {"model": route.model}
+    if temperature:
+        kwargs["temperature"] = route.temperature
+    if route.max_output_tokens:
+        kwargs["max_output_tokens"] = route.max_output_tokens
+    return kwargs
+
+
+def _create(client: OpenAI, context: str, hedge: bool = True, **kwargs):
+    tokens = estimate_request_tokens(kwargs.get("instructions"), kwargs.get("input"))
+
+    def call():
+        return call_with_retry(lambda: client.responses.create(**kwargs), tokens, context)
+
+    policy = get_hedge_policy() if hedge else None
+    if policy is None:
+        return call()
+    text_format = kwargs.get("text", {}).get("format", {})
+    call_type = f"{context}:{text_format.get('name', 'text')}:{kwargs.get('model')}"
+    return policy.run(call_type, call)
+
+
+def _is_schema_error(exc: BadRequestError) -> bool:
+    # Only rejections of the structured output format are worth a json_object
+    # retry; context-length, model and parameter errors would fail again.
+    param = getattr(exc, "param", None) or ""
+    code = getattr(exc, "code", None) or ""
+    return param.startswith("text.format") or "json_schema" in code
+
+
+def _responses_create(client: OpenAI, context: str, **kwargs):
     try:
-        return client.responses.create(**kwargs)
+        return _create(client, context, **kwargs)
     except TypeError as exc:
-        if "response_format" not in str(exc):
+        if "text" not in str(exc):
+            raise
+        kwargs.pop("text", None)
+        return _create(client, context, **kwargs)
+    except BadRequestError as exc:
+        text_format = kwargs.get("text", {}).get("format", {})
+        if text_format.get("type") != "json_schema" or not _is_schema_error(exc):
             raise
-        kwargs.pop("response_format", None)
-        return client.responses.create(**kwargs)
+        logger.warning(
+            "Schema %s rejected for structured output, retrying as json_object: %s",
+            text_format.get("name"),
+            exc,
+        )
+        kwargs["text"] = {"format": {"type": "json_object"}}
+        return _create(client, context, **kwargs)
 
 
-def generate_blueprint(text: str, model: str, temperature: float) -> str:
+def generate_blueprint(
+    text: str,
+    model: str,
+    temperature: float,
+    schema: dict | None = None,
+    schema_name: str = "content_blueprint",
+    step: str = "blueprint",
+) -> str:
     client = _build_client()
+    route = resolve_route(step, model, temperature)
     response = _responses_create(
         client,
-        model=model,
-        temperature=temperature,
+        "generate_blueprint",
+        **_route_kwargs(route),
         instructions=_SYSTEM_PROMPT or None,
         input=[{"role": "user", "content": text}],
-        response_format={"type": "json_object"},
+        text=_text_format(schema, schema_name),
     )
+    _record_usage(response, "generate_blueprint")
     return _response_text(response, "generate_blueprint")
 
 
-def generate_repair(text: str, model: str, temperature: float) -> str:
+def generate_repair(
+    text: str,
+    model: str,
+    temperature: float,
+    schema: dict | None = None,
+    schema_name: str = "repaired_output",
+    step: str = "repair",
+) -> str:
     client = _build_client()
+    route = resolve_route(step, model, temperature)
     response = _responses_create(
         client,
-        model=model,
-        temperature=temperature,
+        "generate_repair",
+        **_route_kwargs(route),
         instructions="You fix JSON outputs to match a required schema. Output JSON only.",
         input=[{"role": "user", "content": text}],
-        response_format={"type": "json_object"},
+        text=_text_format(schema, schema_name),
     )
+    _record_usage(response, "generate_repair")
     return _response_text(response, "generate_repair")
 
 
-def generate_text(system_prompt: str, user_prompt: str, model: str, temperature: float) -> str:
+def generate_text(
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    temperature: float,
+    schema: dict | None = None,
+    schema_name: str = "output",
+    step: str = "drafts",
+) -> str:
     client = _build_client()
+    route = resolve_route(step, model, temperature)
     response = _responses_create(
         client,
-        model=model,
-        temperature=temperature,
+        "generate_text",
+        **_route_kwargs(route),
         instructions=system_prompt or None,
         input=[{"role": "user", "content": user_prompt}],
-        response_format={"type": "json_object"},
+        text=_text_format(schema, schema_name),
     )
+    _record_usage(response, "generate_text")
     return _response_text(response, "generate_text")
 
 
-def generate_repair_text(text: str, model: str, temperature: float) -> str:
-    return generate_repair(text, model, temperature)
+def stream_text(
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    temperature: float,
+    on_delta: Callable[[str], None],
+    schema: dict | None = None,
+    schema_name: str = "output",
+    step: str = "drafts",
+) -> str:
+    client = _build_client()
+    route = resolve_route(step, model, temperature)
+    # Streams are consumed once, so they are never hedged.
+    stream = _responses_create(
+        client,
+        "stream_text",
+        hedge=False,
+        stream=True,
+        **_route_kwargs(route),
+        instructions=system_prompt or None,
+        input=[{"role": "user", "content": user_prompt}],
+        text=_text_format(schema, schema_name),
+    )
+    chunks: list[str] = []
+    final = None
+    for event in stream:
+        event_type = getattr(event, "type", "")
+        if event_type == "response.output_text.delta":
+            chunks.append(event.delta)
+            on_delta(event.delta)
+        elif event_type == "response.completed":
+            final = event.response
+        elif event_type in {"response.failed", "error"}:
+            path = _log_response_error(event, "stream_text")
+            raise RuntimeError(f"Streaming response failed. Details logged to {path}")
+    if final is not None:
+        _record_usage(final, "stream_text")
+    text = "".join(chunks)
+    if not text.strip() and final is not None:
+        return _response_text(final, "stream_text")
+    return text
+
 
+def generate_repair_text(
+    text: str,
+    model: str,
+    temperature: float,
+    schema: dict | None = None,
+    schema_name: str = "repaired_output",
+    step: str = "repair",
+) -> str:
+    return generate_repair(text, model, temperature, schema, schema_name, step)
 
-def generate_image_base64(prompt: str, model: str, size: str) -> str:
+
+def generate_image_base64(prompt: str, model: str, size: str, step: str = "image") -> str:
     client = _build_client()
-    response = client.responses.create(
-        model=model,
+    route = resolve_route(step, model, 0.0)
+    # Image calls are too expensive to duplicate, so they are never hedged.
+    response = _create(
+        client,
+        "generate_image",
+        hedge=False,
+        **_route_kwargs(route, temperature=False),
         input=prompt,
         tools=[{"type": "image_generation", "model": "gpt-image-1-mini", "size": size}],
     )
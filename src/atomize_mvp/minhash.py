@@ -0,0 +1,102 @@
+import hashlib
+import re
+
+import numpy as np
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+DEFAULT_PERMUTATIONS = 128
+DEFAULT_BANDS = 32
+
+
+def shingles(text: str, size: int = 3) -> set[str]:
+    words = WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[idx : idx + size]) for idx in range(len(words) - size + 1)}
+
+
+def _hash_shingle(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = DEFAULT_PERMUTATIONS, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.seed = seed
+        self._a = rng.integers(1, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = np.array(
+            [_hash_shingle(shingle) for shingle in shingles(text)], dtype=np.uint64
+        )
+        if hashes.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        # Universal hashing (a*x + b) mod p, one row per permutation.
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME
+        return (permuted & MAX_HASH).min(axis=0).astype(np.uint64)
+
+
+def estimate_jaccard(first: np.ndarray, second: np.ndarray) -> float:
+    return float(np.mean(first == second))
+
+
+class LSHIndex:
+    """Band the signatures so only likely near-duplicates are compared."""
+
+    def __init__(self, num_perm: int = DEFAULT_PERMUTATIONS, bands: int = DEFAULT_BANDS) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[dict[bytes, list]] = [{} for _ in range(bands)]
+        self._signatures: dict = {}
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key, signature: np.ndarray) -> None:
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray, threshold: float) -> list:
+        candidates = {
+            key
+            for band, band_key in enumerate(self._band_keys(signature))
+            for key in self._buckets[band].get(band_key, [])
+        }
+        return [
+            key
+            for key in candidates
+            if estimate_jaccard(signature, self._signatures[key]) >= threshold
+        ]
+
+
+class NearDuplicateFilter:
+    def __init__(self, threshold: float, hasher: MinHasher | None = None) -> None:
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher()
+        self._index = LSHIndex(self.hasher.num_perm)
+        self._count = 0
+
+    def add(self, text: str) -> bool:
+        """Remember ``text`` and return True unless it near-duplicates an earlier one."""
+        signature = self.hasher.signature(text)
+        if self._index.query(signature, self.threshold):
+            return False
+        self._index.add(self._count, signature)
+        self._count += 1
+        return True
+
+
+def filter_near_duplicates(texts: list[str], threshold: float) -> list[int]:
+    """Return indices of texts to keep, dropping later near-duplicates."""
+    dedupe = NearDuplicateFilter(threshold)
+    return [idx for idx, text in enumerate(texts) if dedupe.add(text)]
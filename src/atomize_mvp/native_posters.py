@@ -0,0 +1,225 @@
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from atomize_mvp.render_manifest import RenderManifest, file_digest, poster_hash
+from atomize_mvp.render_posters import poster_output_path
+
+# Mirrors cards.css: a 272px grid column rendered at deviceScaleFactor 2.
+SCALE = 2
+CARD_WIDTH = 272
+CARD_PADDING = 16
+CARD_RADIUS = 16
+LINE_HEIGHT = 1.2
+
+PAGE_BG = "#f7f6f2"
+CARD_BG = "#ffffff"
+INK = "#1f1f1f"
+MUTED = "#5a5a5a"
+BADGE_COLORS = {
+    "linkedin": "#0a66c2",
+    "x": "#111111",
+    "blog": "#d97706",
+    "ig": "#e11d48",
+}
+
+REGULAR_FONTS = ("segoeui.ttf", "arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf")
+BOLD_FONTS = ("segoeuib.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf")
+
+
+@lru_cache(maxsize=None)
+def load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    candidates = BOLD_FONTS if bold else REGULAR_FONTS
+    custom = os.environ.get("ATOMIZE_FONT_PATH")
+    if custom and not bold:
+        candidates = (custom, *candidates)
+    for name in candidates:
+        try:
+            return ImageFont.truetype(name, size=size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+@lru_cache(maxsize=4096)
+def _text_width(text: str, size: int, bold: bool) -> float:
+    return load_font(size, bold).getlength(text)
+
+
+def _break_word(word: str, size: int, bold: bool, max_width: float) -> list[str]:
+    pieces: list[str] = []
+    current = ""
+    for char in word:
+        if current and _text_width(current + char, size, bold) > max_width:
+            pieces.append(current)
+            current = char
+        else:
+            current += char
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def wrap_text(text: str, size: int, max_width: float, bold: bool = False) -> list[str]:
+    """Wrap on measured glyph widths, keeping explicit newlines like ``pre-wrap``."""
+    lines: list[str] = []
+    space = _text_width(" ", size, bold)
+    for paragraph in text.splitlines() or [""]:
+        current = ""
+        current_width = 0.0
+        for word in paragraph.split():
+            width = _text_width(word, size, bold)
+            if width > max_width:
+                if current:
+                    lines.append(current)
+                *full, current = _break_word(word, size, bold, max_width)
+                lines.extend(full)
+                current_width = _text_width(current, size, bold)
+            elif current and current_width + space + width > max_width:
+                lines.append(current)
+                current, current_width = word, width
+            else:
+                current_width += (space if current else 0) + width
+                current = f"{current} {word}" if current else word
+        lines.append(current)
+    return lines
+
+
+@dataclass
+class _TextBlock:
+    lines: list[str]
+    size: int
+    bold: bool
+    color: str
+    top: int
+
+
+@dataclass
+class CardLayout:
+    width: int
+    height: int
+    scale: int
+    badge_class: str
+    badge_text: str
+    badge_box: tuple[int, int, int, int]
+    blocks: list[_TextBlock] = field(default_factory=list)
+
+
+def _badge_class(platform: str) -> str:
+    if platform.startswith("X"):
+        return "x"
+    if platform.startswith("Blog"):
+        return "blog"
+    if platform.startswith("Instagram"):
+        return "ig"
+    return "linkedin"
+
+
+def layout_card(card: dict, scale: int = SCALE) -> CardLayout:
+    """Measure every block once, in device pixels, before anything is drawn."""
+
+    def px(value: float) -> int:
+        return int(round(value * scale))
+
+    inner = px(CARD_WIDTH - 2 * CARD_PADDING)
+    y = px(CARD_PADDING)
+
+    badge_text = card["platform"].upper()
+    badge_size = px(12)
+    tracking = 0.08 * badge_size
+    badge_width = int(_text_width(badge_text, badge_size, True) + tracking * len(badge_text))
+    badge_box = (
+        px(CARD_PADDING),
+        y,
+        px(CARD_PADDING) + badge_width + px(20),
+        y + int(badge_size * LINE_HEIGHT) + px(12),
+    )
+    y = badge_box[3] + px(10)
+
+    layout = CardLayout(
+        width=px(CARD_WIDTH),
+        height=0,
+        scale=scale,
+        badge_class=_badge_class(card["platform"]),
+        badge_text=badge_text,
+        badge_box=badge_box,
+    )
+
+    def add(text: str, size: int, bold: bool, color: str, margin_top: int, margin_bottom: int):
+        nonlocal y
+        y += px(margin_top)
+        lines = wrap_text(text, px(size), inner, bold) if text else []
+        layout.blocks.append(_TextBlock(lines, px(size), bold, color, y))
+        y += int(len(lines) * px(size) * LINE_HEIGHT) + px(margin_bottom)
+
+    add(card["id"], 12, False, MUTED, 0, 0)
+    add(card.get("title") or "", 18, True, INK, 6, 10)
+    add(card.get("content") or "", 16, False, MUTED, 0, 10)
+    if card.get("cta"):
+        add(f"CTA: {card['cta']}", 16, True, INK, 10, 0)
+    hashtags = " ".join(card.get("hashtags") or [])
+    if hashtags:
+        add(hashtags, 16, False, MUTED, 8, 0)
+    layout.height = y + px(CARD_PADDING)
+    return layout
+
+
+def draw_card(layout: CardLayout) -> Image.Image:
+    scale = layout.scale
+    image = Image.new("RGB", (layout.width, layout.height), PAGE_BG)
+    draw = ImageDraw.Draw(image)
+    draw.rounded_rectangle(
+        (0, 0, layout.width - 1, layout.height - 1),
+        radius=CARD_RADIUS * scale,
+        fill=CARD_BG,
+    )
+
+    left, top, right, bottom = layout.badge_box
+    draw.rounded_rectangle(
+        (left, top, right, bottom),
+        radius=(bottom - top) // 2,
+        fill=BADGE_COLORS[layout.badge_class],
+    )
+    badge_size = 12 * scale
+    badge_font = load_font(badge_size, True)
+    # Pillow has no letter-spacing, so the tracked badge label is drawn per glyph.
+    x = left + 10 * scale
+    for char in layout.badge_text:
+        draw.text((x, top + 6 * scale), char, font=badge_font, fill="#ffffff")
+        x += _text_width(char, badge_size, True) + 0.08 * badge_size
+
+    for block in layout.blocks:
+        font = load_font(block.size, block.bold)
+        for idx, line in enumerate(block.lines):
+            y = block.top + idx * block.size * LINE_HEIGHT
+            draw.text((CARD_PADDING * scale, y), line, font=font, fill=block.color)
+    return image
+
+
+def export_native_posters(
+    cards_dir: Path, posters_root: Path, manifest: RenderManifest | None = None
+) -> list[Path]:
+    """Render the card design from ``cards.py`` with Pillow instead of Chromium."""
+    cards_json = cards_dir / "cards.json"
+    if not cards_json.exists():
+        raise FileNotFoundError("Cards output missing. Run render_cards first.")
+
+    cards = json.loads(cards_json.read_text(encoding="utf-8"))
+    posters_root.mkdir(parents=True, exist_ok=True)
+    manifest = manifest or RenderManifest(posters_root)
+    font = file_digest(os.environ.get("ATOMIZE_FONT_PATH"))
+
+    outputs: list[Path] = []
+    for card in cards:
+        output_path = poster_output_path(posters_root, card["platform"], card["id"])
+        outputs.append(output_path)
+        if not manifest.needs_render(output_path, poster_hash("native", card, font)):
+            continue
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        draw_card(layout_card(card)).save(output_path, format="PNG")
+    manifest.commit()
+    return outputs
@@ -0,0 +1,109 @@
+import hashlib
+import io
+
+import numpy as np
+from PIL import Image
+
+from atomize_mvp.design_system import Theme
+
+BACKGROUND_SOURCES = ("ai", "procedural")
+# Everything is soft, so it is computed at this size and upscaled.
+WORK_SIZE = 384
+
+
+def _rgb(value: str) -> np.ndarray:
+    value = value.lstrip("#")
+    return np.array([int(value[idx : idx + 2], 16) for idx in (0, 2, 4)], dtype=np.float32) / 255
+
+
+def _seed(card_id: str, theme: Theme) -> int:
+    key = f"{card_id}|{theme.name.value}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _value_noise(rng: np.random.Generator, size: int, cells: int) -> np.ndarray:
+    """Smoothly interpolated random lattice, ``cells`` lattice steps per side."""
+    lattice = rng.random((cells + 1, cells + 1), dtype=np.float32)
+    coords = np.linspace(0, cells, size, endpoint=False, dtype=np.float32)
+    index = coords.astype(np.int64)
+    frac = coords - index
+    frac = frac * frac * (3 - 2 * frac)
+    fy, fx = frac[:, None], frac[None, :]
+    top = lattice[np.ix_(index, index)] * (1 - fx) + lattice[np.ix_(index, index + 1)] * fx
+    bottom = (
+        lattice[np.ix_(index + 1, index)] * (1 - fx) + lattice[np.ix_(index + 1, index + 1)] * fx
+    )
+    return top * (1 - fy) + bottom * fy
+
+
+def _fractal_noise(rng: np.random.Generator, size: int, octaves: int = 4) -> np.ndarray:
+    total = np.zeros((size, size), dtype=np.float32)
+    weight = 0.0
+    for octave in range(octaves):
+        amplitude = 0.5**octave
+        total += _value_noise(rng, size, 2 ** (octave + 2)) * amplitude
+        weight += amplitude
+    return total / weight
+
+
+def _blend(canvas: np.ndarray, color: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    alpha = np.clip(alpha, 0, 1)[..., None]
+    return canvas * (1 - alpha) + color * alpha
+
+
+def render_background(card_id: str, theme: Theme, size: int = 1024) -> Image.Image:
+    """Abstract gradient background, the same for the same card and theme.
+
+    A three-stop gradient in the theme colors is warped by fractal noise,
+    washed toward the theme background and overlaid with soft discs and rings,
+    all as whole-array NumPy operations.
+    """
+    output_size = size
+    size = min(size, WORK_SIZE)
+    rng = np.random.default_rng(_seed(card_id, theme))
+    axis = np.linspace(0, 1, size, dtype=np.float32)
+    y, x = np.meshgrid(axis, axis, indexing="ij")
+
+    angle = rng.uniform(0, 2 * np.pi)
+    ramp = (x - 0.5) * np.cos(angle) + (y - 0.5) * np.sin(angle)
+    ramp = (ramp - ramp.min()) / (ramp.max() - ramp.min())
+    noise = _fractal_noise(rng, size)
+    ramp = np.clip(ramp + (noise - 0.5) * 0.35, 0, 1)
+
+    stops = np.stack([_rgb(color) for color in theme.gradients])
+    positions = np.linspace(0, 1, len(stops))
+    canvas = np.stack(
+        [np.interp(ramp, positions, stops[:, channel]) for channel in range(3)], axis=-1
+    ).astype(np.float32)
+    canvas = _blend(canvas, _rgb(theme.background), np.full((size, size), 0.3, np.float32))
+
+    highlight = _rgb(theme.background)
+    accent = _rgb(theme.accent)
+    for _ in range(int(rng.integers(3, 7))):
+        cx, cy = rng.uniform(0, 1, 2)
+        radius = rng.uniform(0.08, 0.35)
+        distance = np.hypot(x - cx, y - cy)
+        if rng.random() < 0.5:
+            disc = np.clip(1 - distance / radius, 0, 1) ** 2
+            canvas = _blend(canvas, accent, disc * rng.uniform(0.15, 0.35))
+        else:
+            width = radius * rng.uniform(0.04, 0.1)
+            ring = np.exp(-(((distance - radius) / width) ** 2))
+            canvas = _blend(canvas, highlight, ring * rng.uniform(0.25, 0.5))
+
+    # Keep the centre calm for overlaid text and darken the corners slightly.
+    vignette = np.hypot(x - 0.5, y - 0.5) / np.sqrt(0.5)
+    canvas *= (1 - 0.18 * vignette**2)[..., None]
+    canvas += (noise[..., None] - 0.5) * 0.03
+    pixels = (np.clip(canvas, 0, 1) * 255).astype(np.uint8)
+    image = Image.fromarray(pixels, mode="RGB")
+    if output_size != size:
+        image = image.resize((output_size, output_size), Image.Resampling.BICUBIC)
+    return image
+
+
+def procedural_background(card_id: str, theme: Theme, size: int = 1024) -> bytes:
+    """PNG bytes of ``render_background``, interchangeable with a generated image."""
+    buffer = io.BytesIO()
+    render_background(card_id, theme, size).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
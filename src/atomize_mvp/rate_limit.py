@@ -0,0 +1,265 @@
+import logging
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import closing
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from openai import APIConnectionError, APIStatusError
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+RETRYABLE_STATUS = {408, 409, 429}
+WAITER_TTL_SECONDS = 30.0
+MAX_SLEEP_SECONDS = 1.0
+
+_LANE: ContextVar[str] = ContextVar("atomize_llm_lane", default=BULK)
+_LIMITERS: dict[tuple[str, int, int], "RateLimiter"] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+T = TypeVar("T")
+
+
+def set_lane(lane: str) -> None:
+    _LANE.set(lane)
+
+
+def current_lane() -> str:
+    return _LANE.get()
+
+
+def estimate_request_tokens(*parts: object) -> int:
+    return math.ceil(sum(len(str(part)) for part in parts if part) / 4)
+
+
+class RateLimiter:
+    """Token buckets for requests and tokens per minute, shared through SQLite.
+
+    Every process pointing at the same database file draws from the same
+    buckets. Bulk callers hold back while an interactive caller is waiting.
+    """
+
+    def __init__(self, path: Path, rpm: int, tpm: int) -> None:
+        self.path = Path(path)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(name TEXT PRIMARY KEY, level REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS waiters "
+                "(id TEXT PRIMARY KEY, lane TEXT NOT NULL, seen REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+
+    def _capacities(self) -> dict[str, int]:
+        limits = {"requests": self.rpm, "tokens": self.tpm}
+        return {name: limit for name, limit in limits.items() if limit > 0}
+
+    def _levels(self, conn: sqlite3.Connection, now: float) -> dict[str, float]:
+        levels: dict[str, float] = {}
+        for name, capacity in self._capacities().items():
+            row = conn.execute(
+                "SELECT level, updated FROM buckets WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                levels[name] = float(capacity)
+                continue
+            level, updated = row
+            refill = max(0.0, now - updated) * capacity / 60.0
+            levels[name] = min(float(capacity), level + refill)
+        return levels
+
+    def _store(self, conn: sqlite3.Connection, levels: dict[str, float], now: float) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO buckets (name, level, updated) VALUES (?, ?, ?)",
+            [(name, level, now) for name, level in levels.items()],
+        )
+
+    def acquire(self, tokens: int, lane: str = BULK) -> float:
+        capacities = self._capacities()
+        if not capacities:
+            return 0.0
+        # A single oversized request must still fit in a full bucket.
+        cost = {"requests": 1.0, "tokens": float(min(tokens, self.tpm or tokens))}
+        waiter_id = uuid.uuid4().hex
+        started = time.monotonic()
+        conn = self._connect()
+        try:
+            while True:
+                now = time.time()
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "DELETE FROM waiters WHERE seen < ?", (now - WAITER_TTL_SECONDS,)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO waiters (id, lane, seen) VALUES (?, ?, ?)",
+                    (waiter_id, lane, now),
+                )
+                yielding = lane != INTERACTIVE and conn.execute(
+                    "SELECT 1 FROM waiters WHERE lane = ? LIMIT 1", (INTERACTIVE,)
+                ).fetchone()
+                levels = self._levels(conn, now)
+                shortfall = {
+                    name: cost[name] - level
+                    for name, level in levels.items()
+                    if level < cost[name]
+                }
+                if not yielding and not shortfall:
+                    for name in levels:
+                        levels[name] -= cost[name]
+                    self._store(conn, levels, now)
+                    conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+                    conn.execute("COMMIT")
+                    return time.monotonic() - started
+                conn.execute("COMMIT")
+                delay = max(
+                    [deficit * 60.0 / capacities[name] for name, deficit in shortfall.items()],
+                    default=MAX_SLEEP_SECONDS,
+                )
+                time.sleep(min(max(delay, 0.01), MAX_SLEEP_SECONDS))
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+            raise
+        finally:
+            conn.close()
+
+    def adjust(self, tokens: int) -> None:
+        """Charge (or refund) the token bucket once the real usage is known."""
+        if self.tpm <= 0 or tokens == 0:
+            return
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            levels = self._levels(conn, now)
+            levels["tokens"] = min(float(self.tpm), levels["tokens"] - tokens)
+            self._store(conn, levels, now)
+            conn.execute("COMMIT")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+def get_limiter() -> RateLimiter | None:
+    rpm = _env_int("ATOMIZE_LLM_RPM", 0)
+    tpm = _env_int("ATOMIZE_LLM_TPM", 0)
+    if rpm <= 0 and tpm <= 0:
+        return None
+    path = os.environ.get("ATOMIZE_RATE_LIMIT_DB") or str(
+        Path(tempfile.gettempdir()) / "atomize_rate_limit.sqlite3"
+    )
+    key = (path, rpm, tpm)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = RateLimiter(Path(path), rpm, tpm)
+            _LIMITERS[key] = limiter
+    return limiter
+
+
+def is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, APIConnectionError):
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in RETRYABLE_STATUS or exc.status_code >= 500
+    return False
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: float | None = None,
+    base: float = 1.0,
+    cap: float = 60.0,
+) -> float:
+    if retry_after is not None:
+        return min(cap, retry_after) + random.uniform(0.0, base)
+    # Full jitter keeps concurrent jobs from retrying in lockstep.
+    return random.uniform(0.0, min(cap, base * 2**attempt))
+
+
+def _usage_tokens(response: object) -> int | None:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return (getattr(usage, "input_tokens", 0) or 0) + (getattr(usage, "output_tokens", 0) or 0)
+
+
+def call_with_retry(func: Callable[[], T], tokens: int, context: str) -> T:
+    limiter = get_limiter()
+    max_attempts = max(1, _env_int("ATOMIZE_LLM_MAX_RETRIES", 5) + 1)
+    lane = current_lane()
+    for attempt in range(max_attempts):
+        if limiter is not None:
+            waited = limiter.acquire(tokens, lane)
+            if waited >= 1.0:
+                logger.info("%s waited %.1fs for rate limit (%s lane)", context, waited, lane)
+        try:
+            response = func()
+        except Exception as exc:  # noqa: BLE001
+            if not is_retryable(exc) or attempt + 1 >= max_attempts:
+                raise
+            delay = backoff_delay(attempt, retry_after_seconds(exc))
+            logger.warning(
+                "%s failed (%s), retry %s/%s in %.1fs",
+                context,
+                exc.__class__.__name__,
+                attempt + 1,
+                max_attempts - 1,
+                delay,
+            )
+            time.sleep(delay)
+            continue
+        used = _usage_tokens(response)
+        if limiter is not None and used is not None:
+            limiter.adjust(used - min(tokens, limiter.tpm or tokens))
+        return response
+    raise RuntimeError(f"{context} exhausted its retries.")
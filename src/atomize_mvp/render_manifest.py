@@ -0,0 +1,87 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = ".render_manifest.json"
+# Bump when poster drawing code changes so every poster is rendered again.
+RENDER_VERSION = 1
+
+
+def poster_hash(renderer: str, *inputs) -> str:
+    """Digest of everything that determines one poster's pixels."""
+    payload = json.dumps(
+        [RENDER_VERSION, renderer, *inputs], sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path | str | None) -> str | None:
+    if not path:
+        return None
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class RenderManifest:
+    """Input hash of every poster under ``posters_root`` as of its last render.
+
+    Exporters ask ``needs_render`` for each poster they would produce and only
+    render the ones whose inputs changed or whose file is gone. ``commit``
+    then deletes the outputs of posters that were not asked about this time,
+    such as cards removed from the job, and saves the manifest. Kept posters
+    get a fresh mtime so results filtered by job start time still list them.
+    """
+
+    def __init__(self, posters_root: Path, path: Path | None = None) -> None:
+        self.root = posters_root
+        self.path = path or posters_root / MANIFEST_FILE
+        self.entries: dict[str, str] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self.entries = dict(data.get("posters", {}))
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable render manifest %s: %s", self.path, exc)
+        self._current: dict[str, str] = {}
+        self.rendered = 0
+        self.skipped = 0
+        self.removed = 0
+
+    def _key(self, output_path: Path) -> str:
+        return output_path.relative_to(self.root).as_posix()
+
+    def needs_render(self, output_path: Path, digest: str) -> bool:
+        key = self._key(output_path)
+        self._current[key] = digest
+        if self.entries.get(key) == digest and output_path.exists():
+            os.utime(output_path)
+            self.skipped += 1
+            return False
+        self.rendered += 1
+        return True
+
+    def commit(self) -> list[Path]:
+        removed: list[Path] = []
+        for key in sorted(set(self.entries) - set(self._current)):
+            path = self.root / key
+            if path.exists():
+                path.unlink()
+                removed.append(path)
+        self.removed += len(removed)
+        self.entries = dict(self._current)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"version": RENDER_VERSION, "posters": self.entries}, handle, indent=2)
+        os.replace(temp, self.path)
+        return removed
+
+    def metrics(self) -> dict:
+        return {"rendered": self.rendered, "skipped": self.skipped, "removed": self.removed}
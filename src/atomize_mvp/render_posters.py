@@ -1,7 +1,29 @@
+import io
 import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
+from PIL import Image
+
+from atomize_mvp.browser_pool import get_pool
+from atomize_mvp.render_manifest import RenderManifest, file_digest, poster_hash
+
+POSTER_RENDERERS = ("browser", "native")
+CAPTURE_MODES = ("batch", "element")
+# Tallest full-page screenshot taken in one go, in CSS pixels.
+MAX_BAND_HEIGHT = 4000
+RECTS_SCRIPT = """() => Array.from(document.querySelectorAll("[data-card-id]")).map((el) => {
+  const rect = el.getBoundingClientRect();
+  return {
+    id: el.dataset.cardId,
+    x: rect.left + window.scrollX,
+    y: rect.top + window.scrollY,
+    width: rect.width,
+    height: rect.height,
+  };
+})"""
 
 PLATFORM_FOLDERS = {
     "LinkedIn": "LinkedIn",
@@ -16,34 +38,142 @@ def poster_output_path(posters_root: Path, platform: str, content_id: str) -> Pa
     return posters_root / folder / f"{content_id}.png"
 
 
-def export_posters(cards_dir: Path, posters_root: Path) -> list[Path]:
-    cards_json = cards_dir / "cards.json"
-    index_html = cards_dir / "index.html"
-    if not cards_json.exists() or not index_html.exists():
-        raise FileNotFoundError("Cards output missing. Run render_cards first.")
+def plan_bands(rects: list[dict], max_height: float = MAX_BAND_HEIGHT) -> list[list[dict]]:
+    """Group card rects top to bottom into bands no taller than ``max_height``."""
+    bands: list[list[dict]] = []
+    current: list[dict] = []
+    top = 0.0
+    for rect in sorted(rects, key=lambda item: (item["y"], item["x"])):
+        if current and rect["y"] + rect["height"] - top > max_height:
+            bands.append(current)
+            current = []
+        if not current:
+            top = rect["y"]
+        current.append(rect)
+    if current:
+        bands.append(current)
+    return bands
+
+
+def _band_clip(band: list[dict]) -> dict:
+    left = min(rect["x"] for rect in band)
+    top = min(rect["y"] for rect in band)
+    right = max(rect["x"] + rect["width"] for rect in band)
+    bottom = max(rect["y"] + rect["height"] for rect in band)
+    return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+
+def _crop_card(band_image: Image.Image, clip: dict, rect: dict, output_path: Path) -> Path:
+    scale_x = band_image.width / clip["width"]
+    scale_y = band_image.height / clip["height"]
+    box = (
+        round((rect["x"] - clip["x"]) * scale_x),
+        round((rect["y"] - clip["y"]) * scale_y),
+        round((rect["x"] + rect["width"] - clip["x"]) * scale_x),
+        round((rect["y"] + rect["height"] - clip["y"]) * scale_y),
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    band_image.crop(box).save(output_path, format="PNG")
+    return output_path
 
-    cards = json.loads(cards_json.read_text(encoding="utf-8"))
-    posters_root.mkdir(parents=True, exist_ok=True)
 
-    outputs: list[Path] = []
+def _export_batch(
+    cards: list[dict], index_html: Path, posters_root: Path, concurrency: int
+) -> list[Path]:
+    wanted = {card["id"] for card in cards}
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch()
-        page = browser.new_page(viewport={"width": 1200, "height": 1200, "deviceScaleFactor": 2})
-        page.goto(index_html.resolve().as_uri())
+    async def capture(page) -> tuple[list[dict], list[tuple[dict, list[dict], bytes]]]:
+        await page.goto(index_html.resolve().as_uri())
+        # Only the requested cards are captured; unchanged ones stay out of the bands.
+        rects = [rect for rect in await page.evaluate(RECTS_SCRIPT) if rect["id"] in wanted]
+        shots = []
+        for band in plan_bands(rects):
+            clip = _band_clip(band)
+            shots.append((clip, band, await page.screenshot(clip=clip, full_page=True)))
+        return rects, shots
 
-        for card in cards:
+    rects, shots = get_pool().render(capture, viewport=(1200, 1200), device_scale_factor=2)
+    found = {rect["id"] for rect in rects}
+    missing = [card["id"] for card in cards if card["id"] not in found]
+    if missing:
+        raise RuntimeError(f"Cards missing from index.html: {', '.join(missing)}")
+
+    paths = {
+        card["id"]: poster_output_path(posters_root, card["platform"], card["id"])
+        for card in cards
+    }
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = []
+        for clip, band, png in shots:
+            band_image = Image.open(io.BytesIO(png))
+            band_image.load()
+            futures.extend(
+                executor.submit(_crop_card, band_image, clip, rect, paths[rect["id"]])
+                for rect in band
+                if rect["id"] in paths
+            )
+        for future in futures:
+            future.result()
+    return [paths[card["id"]] for card in cards]
+
+
+def _export_elements(
+    cards: list[dict], index_html: Path, posters_root: Path, concurrency: int
+) -> list[Path]:
+    async def capture(page, group: list[dict]) -> list[Path]:
+        outputs: list[Path] = []
+        await page.goto(index_html.resolve().as_uri())
+        for card in group:
             content_id = card["id"]
             platform = card["platform"]
-            element = page.wait_for_selector(
+            element = await page.wait_for_selector(
                 f'[data-card-id="{content_id}"]', timeout=5000
             )
-            element.scroll_into_view_if_needed()
+            await element.scroll_into_view_if_needed()
             output_path = poster_output_path(posters_root, platform, content_id)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            element.screenshot(path=str(output_path))
+            await element.screenshot(path=str(output_path))
             outputs.append(output_path)
+        return outputs
+
+    # Each page loads the card sheet once and captures a contiguous run of cards.
+    size = max(1, math.ceil(len(cards) / max(1, concurrency)))
+    groups = [cards[idx : idx + size] for idx in range(0, len(cards), size)]
+    results = get_pool().render_many(
+        (partial(capture, group=group) for group in groups),
+        concurrency=concurrency,
+        viewport=(1200, 1200),
+        device_scale_factor=2,
+    )
+    return [path for group_outputs in results for path in group_outputs]
+
 
-        browser.close()
+def export_posters(
+    cards_dir: Path,
+    posters_root: Path,
+    concurrency: int = 4,
+    capture: str = "batch",
+    manifest: RenderManifest | None = None,
+) -> list[Path]:
+    """Screenshot every card, re-rendering only cards whose inputs changed."""
+    cards_json = cards_dir / "cards.json"
+    index_html = cards_dir / "index.html"
+    if not cards_json.exists() or not index_html.exists():
+        raise FileNotFoundError("Cards output missing. Run render_cards first.")
 
+    cards = json.loads(cards_json.read_text(encoding="utf-8"))
+    posters_root.mkdir(parents=True, exist_ok=True)
+    manifest = manifest or RenderManifest(posters_root)
+    css = file_digest(cards_dir / "cards.css")
+    outputs = [poster_output_path(posters_root, card["platform"], card["id"]) for card in cards]
+    pending = [
+        card
+        for card, output_path in zip(cards, outputs)
+        if manifest.needs_render(output_path, poster_hash("browser", card, css))
+    ]
+    if pending and capture == "element":
+        _export_elements(pending, index_html, posters_root, concurrency)
+    elif pending:
+        _export_batch(pending, index_html, posters_root, concurrency)
+    manifest.commit()
     return outputs
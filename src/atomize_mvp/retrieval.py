@@ -0,0 +1,112 @@
+import math
+import re
+
+from atomize_mvp.cleanup import split_passages
+from atomize_mvp.extractive import estimate_tokens
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+MAX_PASSAGE_CHARS = 1200
+
+PLATFORM_FIELDS = {
+    "LinkedIn": ("key_points", "hooks", "quotes", "ctas"),
+    "X": ("hooks", "quotes", "key_points"),
+    "Blog": ("key_points", "quotes"),
+    "IG Stories": ("hooks", "key_points", "quotes"),
+}
+
+
+def _tokenize(text: str) -> list[str]:
+    return WORD_RE.findall(text.lower())
+
+
+class BM25Index:
+    def __init__(self, passages: list[str], k1: float = 1.5, b: float = 0.75) -> None:
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+        self._lengths: list[int] = []
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        for idx, passage in enumerate(passages):
+            tokens = _tokenize(passage)
+            self._lengths.append(len(tokens))
+            counts: dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, freq in counts.items():
+                self._postings.setdefault(token, []).append((idx, freq))
+        self._avg_length = sum(self._lengths) / max(len(self._lengths), 1)
+
+    @classmethod
+    def from_text(cls, text: str, max_chars: int = MAX_PASSAGE_CHARS) -> "BM25Index":
+        return cls(split_passages(text, max_chars))
+
+    def _idf(self, token: str) -> float:
+        doc_freq = len(self._postings.get(token, []))
+        total = len(self.passages)
+        return math.log(1.0 + (total - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def scores(self, query: str) -> dict[int, float]:
+        results: dict[int, float] = {}
+        for token in set(_tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = self._idf(token)
+            for idx, freq in postings:
+                norm = 1.0 - self.b + self.b * self._lengths[idx] / max(self._avg_length, 1.0)
+                results[idx] = results.get(idx, 0.0) + idf * (
+                    freq * (self.k1 + 1.0) / (freq + self.k1 * norm)
+                )
+        return results
+
+    def select(self, queries: list[str], budget_tokens: int) -> list[int]:
+        rankings = []
+        for query in queries:
+            scored = self.scores(query)
+            rankings.append(sorted(scored, key=lambda idx: scored[idx], reverse=True))
+
+        selected: list[int] = []
+        seen: set[int] = set()
+        used = 0
+        # Round-robin across queries so every blueprint item gets supporting context.
+        depth = 0
+        while rankings and any(depth < len(ranking) for ranking in rankings):
+            for ranking in rankings:
+                if depth >= len(ranking):
+                    continue
+                idx = ranking[depth]
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                cost = estimate_tokens(self.passages[idx])
+                if used + cost > budget_tokens:
+                    continue
+                selected.append(idx)
+                used += cost
+            if used >= budget_tokens:
+                break
+            depth += 1
+        return sorted(selected)
+
+
+def blueprint_queries(blueprint: dict, fields: tuple[str, ...]) -> list[str]:
+    queries: list[str] = []
+    for field in fields:
+        queries.extend(item for item in blueprint.get(field, []) if item)
+    return queries
+
+
+def retrieve_passages(
+    index: BM25Index, blueprint: dict, platform: str, budget_tokens: int
+) -> str:
+    fields = PLATFORM_FIELDS.get(platform, ("key_points", "hooks", "quotes"))
+    selected = index.select(blueprint_queries(blueprint, fields), budget_tokens)
+    if not selected:
+        used = 0
+        for idx, passage in enumerate(index.passages):
+            cost = estimate_tokens(passage)
+            if used + cost > budget_tokens:
+                break
+            selected.append(idx)
+            used += cost
+    return "\n\n".join(index.passages[idx] for idx in selected)
@@ -0,0 +1,148 @@
+import difflib
+import json
+import logging
+import re
+from pathlib import Path
+
+import numpy as np
+
+from atomize_mvp.minhash import MinHasher
+from atomize_mvp.paths import delivery_tree
+from atomize_mvp.schemas import DraftsSchema
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_FILE = "minhash.json"
+REUSE_MODES = ("reuse", "refresh")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+RAW_DRAFT_FILES = ("raw_linkedin", "raw_x_threads", "raw_blog_outlines", "raw_ig_stories")
+
+
+def write_signature(path: Path, text: str, hasher: MinHasher | None = None) -> np.ndarray:
+    hasher = hasher or MinHasher()
+    signature = hasher.signature(text)
+    data = {
+        "num_perm": hasher.num_perm,
+        "seed": hasher.seed,
+        "signature": [int(value) for value in signature],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return signature
+
+
+def load_signature(path: Path, hasher: MinHasher | None = None) -> np.ndarray | None:
+    hasher = hasher or MinHasher()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    # Signatures from a different hash family are not comparable.
+    if data.get("num_perm") != hasher.num_perm or data.get("seed") != hasher.seed:
+        return None
+    return np.array(data.get("signature", []), dtype=np.uint64)
+
+
+def _load_steps(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("steps", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _has_blueprint(job_root: Path) -> bool:
+    tree = delivery_tree(job_root)
+    steps = _load_steps(tree["state"] / "steps.json")
+    return (
+        steps.get("blueprint", {}).get("status") == "done"
+        and (tree["content"] / "blueprint" / "content_blueprint.json").exists()
+        and (tree["transcripts"] / "clean_transcript.txt").exists()
+    )
+
+
+def find_similar_job(
+    out_root: Path,
+    signature: np.ndarray,
+    threshold: float,
+    exclude: Path | None = None,
+    hasher: MinHasher | None = None,
+) -> tuple[Path, float] | None:
+    """Return the prior job whose transcript is most similar, if above ``threshold``."""
+    roots: list[Path] = []
+    signatures: list[np.ndarray] = []
+    for path in sorted(out_root.glob(f"*/*/.atomize/{SIGNATURE_FILE}")):
+        job_root = path.parent.parent
+        if exclude is not None and job_root.resolve() == exclude.resolve():
+            continue
+        candidate = load_signature(path, hasher)
+        if candidate is None or candidate.shape != signature.shape:
+            continue
+        roots.append(job_root)
+        signatures.append(candidate)
+    if not signatures:
+        return None
+    similarities = (np.stack(signatures) == signature).mean(axis=1)
+    for idx in np.argsort(-similarities, kind="stable"):
+        similarity = float(similarities[idx])
+        if similarity < threshold:
+            break
+        if _has_blueprint(roots[idx]):
+            return roots[idx], similarity
+    return None
+
+
+def _sentences(text: str) -> list[str]:
+    return [
+        sentence.strip()
+        for paragraph in text.splitlines()
+        for sentence in SENTENCE_RE.split(paragraph)
+        if sentence.strip()
+    ]
+
+
+def transcript_diff(old: str, new: str) -> tuple[list[str], list[str]]:
+    """Return the sentences added to and removed from ``old`` to get ``new``."""
+    old_sentences = _sentences(old)
+    new_sentences = _sentences(new)
+    matcher = difflib.SequenceMatcher(None, old_sentences, new_sentences, autojunk=False)
+    added: list[str] = []
+    removed: list[str] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in {"delete", "replace"}:
+            removed.extend(old_sentences[i1:i2])
+        if tag in {"insert", "replace"}:
+            added.extend(new_sentences[j1:j2])
+    return added, removed
+
+
+def load_reusable_drafts(
+    job_root: Path, lang: str, tone: str, counts: dict[str, int], mode: str = "reuse"
+) -> tuple[DraftsSchema, dict[str, str]] | None:
+    """Load a prior job's drafts when they were made with the same settings.
+
+    In ``refresh`` mode the blueprint is rebuilt from the transcript diff, so
+    the prior drafts may quote removed sentences and are never reused.
+    """
+    if mode != "reuse":
+        return None
+    tree = delivery_tree(job_root)
+    drafts_dir = tree["content"] / "drafts"
+    step = _load_steps(tree["state"] / "steps.json").get("generate_drafts", {})
+    metadata = step.get("metadata", {})
+    if step.get("status") != "done" or not (drafts_dir / "drafts.json").exists():
+        return None
+    if (metadata.get("lang"), metadata.get("tone"), metadata.get("counts")) != (
+        lang,
+        tone,
+        counts,
+    ):
+        logger.info("Prior drafts in %s use different settings; regenerating", job_root)
+        return None
+    drafts = DraftsSchema.model_validate_json(
+        (drafts_dir / "drafts.json").read_text(encoding="utf-8")
+    )
+    raw_outputs = {}
+    for name in RAW_DRAFT_FILES:
+        path = drafts_dir / f"{name}.txt"
+        raw_outputs[name] = path.read_text(encoding="utf-8") if path.exists() else ""
+    return drafts, raw_outputs
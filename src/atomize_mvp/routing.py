@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STEPS = ("blueprint", "blueprint_map", "drafts", "repair", "quick", "image")
+# Steps without their own route inherit from a related one before the default.
+FALLBACKS = {"blueprint_map": "blueprint"}
+ROUTE_FIELDS = ("model", "temperature", "max_output_tokens")
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    model: str
+    temperature: float
+    max_output_tokens: int | None = None
+
+
+def _coerce_route(step: str, value) -> dict:
+    if step not in STEPS:
+        raise ValueError(f"Unknown route step '{step}'. Expected one of: {', '.join(STEPS)}")
+    if isinstance(value, str):
+        value = {"model": value}
+    if not isinstance(value, dict):
+        raise ValueError(f"Route for '{step}' must be a model name or an object.")
+    unknown = set(value) - set(ROUTE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown route fields for '{step}': {', '.join(sorted(unknown))}")
+    route: dict = {}
+    if value.get("model"):
+        route["model"] = str(value["model"])
+    if value.get("temperature") is not None:
+        route["temperature"] = float(value["temperature"])
+    if value.get("max_output_tokens") is not None:
+        route["max_output_tokens"] = int(value["max_output_tokens"])
+    return route
+
+
+def parse_route_spec(spec: str) -> dict[str, dict]:
+    """Parse ``step=model[:temperature[:max_output_tokens]]`` entries.
+
+    Entries are separated by commas, e.g. ``repair=gpt-4o-mini:0,blueprint=gpt-4o``.
+    """
+    routes: dict[str, dict] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        step, sep, value = entry.partition("=")
+        if not sep or not value.strip():
+            raise ValueError(f"Invalid route '{entry}'. Use step=model[:temperature[:max_tokens]].")
+        parts = [part.strip() for part in value.split(":")]
+        route = {"model": parts[0]}
+        if len(parts) > 1 and parts[1]:
+            route["temperature"] = parts[1]
+        if len(parts) > 2 and parts[2]:
+            route["max_output_tokens"] = parts[2]
+        routes[step.strip()] = _coerce_route(step.strip(), route)
+    return routes
+
+
+def load_routes(source: str) -> dict[str, dict]:
+    """Load routes from a JSON object, a JSON file path or a route spec string."""
+    source = source.strip()
+    if not source:
+        return {}
+    if not source.startswith("{") and Path(source).is_file():
+        source = Path(source).read_text(encoding="utf-8")
+    if source.startswith("{"):
+        data = json.loads(source)
+        return {step: _coerce_route(step, value) for step, value in data.items()}
+    return parse_route_spec(source)
+
+
+class RouteTable:
+    def __init__(
+        self,
+        model: str,
+        temperature: float,
+        overrides: dict[str, dict] | None = None,
+    ) -> None:
+        self.default = ModelRoute(model=model, temperature=temperature)
+        self.overrides = {
+            step: _coerce_route(step, value) for step, value in (overrides or {}).items()
+        }
+
+    @classmethod
+    def from_sources(
+        cls, model: str, temperature: float, routes: dict[str, dict] | None = None
+    ) -> "RouteTable":
+        merged = load_routes(os.environ.get("ATOMIZE_MODEL_ROUTES", ""))
+        for step, value in (routes or {}).items():
+            merged[step] = {**merged.get(step, {}), **_coerce_route(step, value)}
+        return cls(model, temperature, merged)
+
+    def resolve(
+        self, step: str, model: str | None = None, temperature: float | None = None
+    ) -> ModelRoute:
+        base = {
+            "model": model if model is not None else self.default.model,
+            "temperature": temperature if temperature is not None else self.default.temperature,
+        }
+        fallback = FALLBACKS.get(step)
+        if fallback and step not in self.overrides:
+            base.update(self.overrides.get(fallback, {}))
+        base.update(self.overrides.get(step, {}))
+        return ModelRoute(**base)
+
+    def to_dict(self) -> dict[str, dict]:
+        return {step: asdict(self.resolve(step)) for step in STEPS}
+
+
+_ROUTES: ContextVar[RouteTable | None] = ContextVar("atomize_model_routes", default=None)
+
+
+def set_routes(table: RouteTable | None) -> None:
+    _ROUTES.set(table)
+
+
+def resolve_route(step: str, model: str, temperature: float) -> ModelRoute:
+    table = _ROUTES.get()
+    if table is None:
+        return ModelRoute(model=model, temperature=temperature)
+    return table.resolve(step, model, temperature)
@@ -3,11 +3,18 @@ import logging
 import os
 import shutil
 import gc
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 
-from atomize_mvp.blueprint import generate_content_blueprint
+from atomize_mvp.blueprint import (
+    SectionMapper,
+    generate_content_blueprint,
+    plan_chunk_count,
+    reuse_content_blueprint,
+)
 from atomize_mvp.ai_posters import export_ai_posters
+from atomize_mvp.browser_pool import pool_metrics
 from atomize_mvp.cards import render_cards
 from atomize_mvp.cleanup import cleanup_transcript_file
 from atomize_mvp.delivery import (
@@ -16,12 +23,30 @@ from atomize_mvp.delivery import (
     write_linkedin_docx,
     write_x_threads_docx,
 )
-from atomize_mvp.drafts import generate_all_drafts, generate_quick_bundle, write_drafts_json
+from atomize_mvp.extractive import compress_transcript_file
+from atomize_mvp.drafts import (
+    generate_all_drafts,
+    generate_quick_bundle,
+    write_drafts_json,
+    write_partial_drafts,
+)
 from atomize_mvp.ffmpeg_utils import convert_to_mp4, ensure_ffmpeg, split_audio
 from atomize_mvp.finalize import finalize_delivery
+from atomize_mvp.llm_client import pop_usage, set_usage_scope
+from atomize_mvp.native_posters import export_native_posters
 from atomize_mvp.paths import build_delivery_root, delivery_tree
+from atomize_mvp.rate_limit import BULK, INTERACTIVE, set_lane
+from atomize_mvp.reuse import (
+    SIGNATURE_FILE,
+    find_similar_job,
+    load_reusable_drafts,
+    write_signature,
+)
+from atomize_mvp.image_cache import MB, ImageCache, image_cache_root
+from atomize_mvp.routing import RouteTable, set_routes
 from atomize_mvp.structured_posters import export_structured_posters, generate_visual_blueprints
 from atomize_mvp.structured_premium import export_structured_posters_premium
+from atomize_mvp.render_manifest import RenderManifest
 from atomize_mvp.render_posters import export_posters
 from atomize_mvp.schemas import ContentBlueprint, DraftsSchema
 from atomize_mvp.transcribe import (
@@ -69,6 +94,10 @@ def _step_done(steps: dict, name: str) -> bool:
     return steps.get("steps", {}).get(name, {}).get("status") == "done"
 
 
+def _step_metadata(steps: dict, name: str) -> dict:
+    return steps.get("steps", {}).get(name, {}).get("metadata") or {}
+
+
 def _start_step(steps: dict, name: str) -> None:
     steps.setdefault("steps", {}).setdefault(name, {})
     steps["steps"][name]["status"] = "running"
@@ -161,6 +190,12 @@ def _outputs_exist(paths: list[Path]) -> bool:
     return all(path.exists() for path in paths)
 
 
+def _render_manifest(tree: dict, posters_root: Path) -> RenderManifest:
+    # Kept in the state dir so manifests never end up in delivery zips.
+    path = tree["state"] / "render_manifests" / f"{posters_root.name}.json"
+    return RenderManifest(posters_root, path=path)
+
+
 def _should_skip(steps: dict, name: str, outputs: list[Path], force: bool) -> bool:
     return _step_done(steps, name) and _outputs_exist(outputs) and not force
 
@@ -205,6 +240,60 @@ def _snapshot_posters(tree: dict) -> None:
         shutil.copy2(path, target)
 
 
+PREVIEW_STEPS = ("generate_quick", "render_cards", "export_posters")
+# Steps the full phase must run again because the preview produced their outputs.
+PREVIEW_REFRESH_STEPS = ("render_cards", "export_posters")
+FULL_STEPS = (
+    "blueprint",
+    "generate_drafts",
+    "finalize_delivery",
+    "render_cards",
+    "export_posters",
+    "export_ai_posters",
+    "export_structured_posters",
+    "export_structured_posters_premium",
+)
+
+
+def _set_delivery_phase(run_file: Path, phase: str) -> None:
+    run_data = _load_json(run_file, {})
+    run_data["delivery_phase"] = phase
+    run_data.setdefault("phase_times", {})[phase] = _now_iso()
+    _save_json(run_file, run_data)
+
+
+def _reset_steps(state_file: Path, run_file: Path, names: tuple[str, ...]) -> None:
+    steps = _load_steps(state_file)
+    for name in names:
+        steps.get("steps", {}).pop(name, None)
+    _save_steps(state_file, steps, run_file)
+
+
+def _run_progressive(params: dict) -> None:
+    root = build_delivery_root(params["out_root"], params["client"], params["title"])
+    tree = delivery_tree(root)
+    state_file = tree["state"] / "steps.json"
+    run_file = tree["state"] / "run.json"
+    tree["state"].mkdir(parents=True, exist_ok=True)
+
+    _set_delivery_phase(run_file, "preview")
+    run_pipeline(**{**params, "mode": "quick"})
+    _set_delivery_phase(run_file, "preview_ready")
+    logger.info("Preview ready, continuing with the full library")
+
+    # Transcripts and the quick bundle are reused; only preview renders are redone.
+    reset = PREVIEW_REFRESH_STEPS + (FULL_STEPS if params["force"] else ())
+    _reset_steps(state_file, run_file, reset)
+    _set_delivery_phase(run_file, "full")
+    run_pipeline(**{**params, "mode": "full", "force": False})
+    _set_delivery_phase(run_file, "complete")
+
+
+def _record_partial_drafts(path: Path, partial_drafts: dict, field: str, items: list) -> None:
+    partial_drafts[field] = items
+    write_partial_drafts(path, partial_drafts)
+
+
 def run_pipeline(
     input_path: Path,
     client: str,
@@ -231,7 +320,29 @@ def run_pipeline(
     structured_only: bool,
     structured_premium: bool,
     mode: str = "full",
+    blueprint_chunks: int = 0,
+    blueprint_workers: int = 4,
+    compress_tokens: int = 0,
+    retrieval_tokens: int = 0,
+    routes: dict[str, dict] | None = None,
+    stream_drafts: bool = False,
+    draft_shard_size: int = 0,
+    draft_workers: int = 4,
+    pipeline_section_seconds: int = 0,
+    reuse_threshold: float = 0.0,
+    reuse_mode: str = "reuse",
+    poster_concurrency: int = 4,
+    poster_renderer: str = "browser",
+    poster_capture: str = "batch",
+    image_cache: str = "job",
+    image_cache_max_mb: int = 1024,
+    ai_poster_workers: int = 4,
+    keep_ai_backgrounds: bool = False,
+    poster_backgrounds: str = "ai",
 ) -> None:
+    if mode.lower() == "progressive" and os.environ.get("ATOMIZE_OFFLINE") != "1":
+        _run_progressive(dict(locals()))
+        return
     root = build_delivery_root(out_root, client, title)
     tree = delivery_tree(root)
     state_file = tree["state"] / "steps.json"
@@ -239,6 +350,7 @@ def run_pipeline(
 
     _ensure_dirs(tree)
     steps = _load_steps(state_file)
+    set_usage_scope(str(root))
     is_quick = mode.lower() == "quick"
     is_offline = os.environ.get("ATOMIZE_OFFLINE") == "1"
     if is_offline:
@@ -247,6 +359,11 @@ def run_pipeline(
         structured_posters = False
         structured_premium = False
         ai_posters = False
+    # Quick jobs are interactive previews; let them jump ahead of bulk runs.
+    set_lane(INTERACTIVE if is_quick else BULK)
+    route_table = RouteTable.from_sources(model, temperature, routes)
+    set_routes(route_table)
+    section_mapper: SectionMapper | None = None
 
     input_hash = _hash_file(input_path)
     run_data = _load_json(run_file, {})
@@ -266,7 +383,8 @@ def run_pipeline(
             "phase": "phase_8",
             "mode": "quick" if is_quick else "full",
         }
-        _save_json(run_file, meta)
+        # Merge so the input hash and a progressive job's delivery phase survive.
+        _save_json(run_file, {**_load_json(run_file, {}), **meta})
         _finish_step(steps, "init")
         _save_steps(state_file, steps, run_file)
         logger.info("Step init complete")
@@ -354,6 +472,22 @@ def run_pipeline(
             tree["transcripts"] / "transcript.srt",
         ]
         if not _should_skip(steps, "transcribe", transcript_outputs, force):
+            if (
+                pipeline_section_seconds > 0
+                and not is_quick
+                and (force or not _step_done(steps, "blueprint"))
+            ):
+                # Map sections of the blueprint while Whisper is still transcribing.
+                section_mapper = SectionMapper(
+                    title=title,
+                    prompt_path=Path(__file__).parent / "prompts" / "blueprint_map.txt",
+                    model=model,
+                    temperature=temperature,
+                    lang=lang,
+                    partials_dir=tree["content"] / "blueprint" / "partials",
+                    section_seconds=pipeline_section_seconds,
+                    workers=blueprint_workers,
+                )
             logger.info("Running step transcribe")
             _start_step(steps, "transcribe")
             try:
@@ -400,6 +534,7 @@ def run_pipeline(
                                 srt_path=tree["transcripts"] / "transcript.srt",
                                 segment_seconds=segment_seconds,
                                 max_workers=workers,
+                                on_chunk=section_mapper.add_chunk if section_mapper else None,
                             )
                         elif use_subprocess:
                             segment_count, info = transcribe_audio_chunks_subprocess(
@@ -427,6 +562,7 @@ def run_pipeline(
                                 segments_jsonl_path=tree["transcripts"] / "transcript.jsonl",
                                 srt_path=tree["transcripts"] / "transcript.srt",
                                 segment_seconds=segment_seconds,
+                                on_chunk=section_mapper.add_chunk if section_mapper else None,
                             )
                     else:
                         if use_subprocess:
@@ -472,6 +608,8 @@ def run_pipeline(
                     shutil.rmtree(chunk_dir, ignore_errors=True)
                 _cleanup_memory("transcribe")
             except Exception as exc:  # noqa: BLE001
+                if section_mapper is not None:
+                    section_mapper.cancel()
                 _fail_step(steps, "transcribe", str(exc))
                 _save_steps(state_file, steps, run_file)
                 raise
@@ -494,6 +632,61 @@ def run_pipeline(
                 _save_steps(state_file, steps, run_file)
                 raise
 
+    llm_text_path = tree["transcripts"] / "clean_transcript.txt"
+    if compress_tokens > 0:
+        compressed_path = tree["transcripts"] / "compressed_transcript.txt"
+        compress_inputs = {
+            "target_tokens": compress_tokens,
+            "source_hash": _hash_file(tree["transcripts"] / "clean_transcript.txt"),
+        }
+        previous = _step_metadata(steps, "compress_transcript")
+        unchanged = all(previous.get(key) == value for key, value in compress_inputs.items())
+        skip = unchanged and _should_skip(steps, "compress_transcript", [compressed_path], force)
+        if not skip:
+            logger.info("Running step compress_transcript")
+            _start_step(steps, "compress_transcript")
+            try:
+                stats = compress_transcript_file(
+                    tree["transcripts"] / "clean_transcript.txt",
+                    compressed_path,
+                    compress_tokens,
+                )
+                _finish_step(steps, "compress_transcript", {**stats, **compress_inputs})
+                _save_steps(state_file, steps, run_file)
+                logger.info(
+                    "Step compress_transcript complete (ratio %.2f)", stats["ratio"]
+                )
+            except Exception as exc:  # noqa: BLE001
+                _fail_step(steps, "compress_transcript", str(exc))
+                _save_steps(state_file, steps, run_file)
+                raise
+        llm_text_path = compressed_path
+
+    reuse_source: Path | None = None
+    clean_transcript = tree["transcripts"] / "clean_transcript.txt"
+    if clean_transcript.exists():
+        signature = write_signature(
+            tree["state"] / SIGNATURE_FILE, clean_transcript.read_text(encoding="utf-8")
+        )
+        can_reuse = not is_quick and (force or not _step_done(steps, "blueprint"))
+        if reuse_threshold > 0 and can_reuse:
+            match = find_similar_job(out_root, signature, reuse_threshold, exclude=root)
+            if match is not None:
+                reuse_source, similarity = match
+                logger.info(
+                    "Reusing LLM results from %s (similarity %.2f, mode %s)",
+                    reuse_source,
+                    similarity,
+                    reuse_mode,
+                )
+                run_data = _load_json(run_file, {})
+                run_data["reused_from"] = {
+                    "job": str(reuse_source),
+                    "similarity": round(similarity, 4),
+                    "mode": reuse_mode,
+                }
+                _save_json(run_file, run_data)
+
     blueprint_dir = tree["content"] / "blueprint"
     blueprint_dir.mkdir(parents=True, exist_ok=True)
     blueprint_json = blueprint_dir / "content_blueprint.json"
@@ -503,18 +696,45 @@ def run_pipeline(
     if (not is_quick or is_offline) and not _should_skip(steps, "blueprint", blueprint_outputs, force):
         logger.info("Running step blueprint")
         _start_step(steps, "blueprint")
+        if section_mapper is None:
+            pop_usage()
         try:
-            clean_path = tree["transcripts"] / "clean_transcript.txt"
-            clean_text = clean_path.read_text(encoding="utf-8")
-            raw, blueprint, input_hash = generate_content_blueprint(
-                clean_text=clean_text,
-                title=title,
-                prompt_path=Path(__file__).parent / "prompts" / "content_blueprint.txt",
-                model=model,
-                temperature=temperature,
-                max_input_chars=max_input_chars,
-                lang=lang,
-            )
+            clean_text = llm_text_path.read_text(encoding="utf-8")
+            partials = []
+            if section_mapper is not None and reuse_source is not None:
+                section_mapper.cancel()
+            elif section_mapper is not None:
+                partials = section_mapper.finish()
+            if reuse_source is not None:
+                prior_tree = delivery_tree(reuse_source)
+                raw, blueprint, input_hash = reuse_content_blueprint(
+                    clean_text=clean_transcript.read_text(encoding="utf-8"),
+                    prior_text=(prior_tree["transcripts"] / "clean_transcript.txt").read_text(
+                        encoding="utf-8"
+                    ),
+                    prior_raw=(
+                        prior_tree["content"] / "blueprint" / "content_blueprint.json"
+                    ).read_text(encoding="utf-8"),
+                    title=title,
+                    prompt_path=Path(__file__).parent / "prompts" / "content_blueprint.txt",
+                    model=model,
+                    temperature=temperature,
+                    lang=lang,
+                    refresh=reuse_mode == "refresh",
+                )
+            else:
+                raw, blueprint, input_hash = generate_content_blueprint(
+                    clean_text=clean_text,
+                    title=title,
+                    prompt_path=Path(__file__).parent / "prompts" / "content_blueprint.txt",
+                    model=model,
+                    temperature=temperature,
+                    max_input_chars=max_input_chars,
+                    lang=lang,
+                    chunks=blueprint_chunks,
+                    workers=blueprint_workers,
+                    partials=partials or None,
+                )
             blueprint_raw.write_text(raw, encoding="utf-8")
             blueprint_json.write_text(
                 json.dumps(blueprint.model_dump(), indent=2, sort_keys=True),
@@ -524,10 +744,17 @@ def run_pipeline(
                 steps,
                 "blueprint",
                 {
-                    "model": model,
-                    "temperature": temperature,
+                    "model": route_table.resolve("blueprint").model,
+                    "temperature": route_table.resolve("blueprint").temperature,
+                    "map_model": route_table.resolve("blueprint_map").model,
+                    "repair_model": route_table.resolve("repair").model,
                     "lang": lang,
                     "input_hash": input_hash,
+                    "chunks": len(partials)
+                    or plan_chunk_count(len(clean_text), max_input_chars, blueprint_chunks),
+                    "pipelined": bool(partials),
+                    "reused_from": str(reuse_source) if reuse_source else None,
+                    "usage": pop_usage(),
                     "output": str(blueprint_json),
                 },
             )
@@ -550,6 +777,7 @@ def run_pipeline(
     raw_x_threads = drafts_dir / "raw_x_threads.txt"
     raw_blog_outlines = drafts_dir / "raw_blog_outlines.txt"
     raw_ig_stories = drafts_dir / "raw_ig_stories.txt"
+    drafts_partial = drafts_dir / "drafts.partial.json"
 
     drafts_outputs = [drafts_json]
 
@@ -558,10 +786,10 @@ def run_pipeline(
     if is_quick and not is_offline and not _should_skip(steps, "generate_quick", [quick_json, drafts_json], force):
         logger.info("Running step generate_quick")
         _start_step(steps, "generate_quick")
+        pop_usage()
         try:
             quick_dir.mkdir(parents=True, exist_ok=True)
-            clean_path = tree["transcripts"] / "clean_transcript.txt"
-            clean_text = clean_path.read_text(encoding="utf-8")
+            clean_text = llm_text_path.read_text(encoding="utf-8")
             raw, bundle = generate_quick_bundle(
                 transcript=clean_text,
                 prompt_path=Path(__file__).parent / "prompts" / "quick_bundle.txt",
@@ -583,10 +811,12 @@ def run_pipeline(
                 steps,
                 "generate_quick",
                 {
-                    "model": model,
-                    "temperature": temperature,
+                    "model": route_table.resolve("quick").model,
+                    "temperature": route_table.resolve("quick").temperature,
+                    "repair_model": route_table.resolve("repair").model,
                     "lang": lang,
                     "tone": tone,
+                    "usage": pop_usage(),
                     "output": str(quick_json),
                 },
             )
@@ -600,25 +830,41 @@ def run_pipeline(
     if not is_quick and not _should_skip(steps, "generate_drafts", drafts_outputs, force):
         logger.info("Running step generate_drafts")
         _start_step(steps, "generate_drafts")
+        pop_usage()
+        drafts_partial.unlink(missing_ok=True)
+        on_progress = None
+        if stream_drafts:
+            on_progress = partial(_record_partial_drafts, drafts_partial, {})
         try:
-            clean_path = tree["transcripts"] / "clean_transcript.txt"
-            clean_text = clean_path.read_text(encoding="utf-8")
+            clean_text = llm_text_path.read_text(encoding="utf-8")
             blueprint_data = json.loads(blueprint_json.read_text(encoding="utf-8"))
-
-            drafts, raw_outputs = generate_all_drafts(
-                blueprint=blueprint_data,
-                transcript=clean_text,
-                prompts_dir=Path(__file__).parent / "prompts",
-                model=model,
-                temperature=temperature,
-                lang=lang,
-                tone=tone,
-                max_input_chars=max_input_chars,
-                linkedin_count=linkedin_count,
-                x_count=x_count,
-                blog_count=blog_count,
-                ig_count=ig_count,
-            )
+            counts = {"linkedin": linkedin_count, "x": x_count, "blog": blog_count, "ig": ig_count}
+
+            reused = None
+            if reuse_source is not None:
+                reused = load_reusable_drafts(reuse_source, lang, tone, counts, reuse_mode)
+            if reused is not None:
+                drafts, raw_outputs = reused
+                logger.info("Reusing drafts from %s", reuse_source)
+            else:
+                drafts, raw_outputs = generate_all_drafts(
+                    blueprint=blueprint_data,
+                    transcript=clean_text,
+                    prompts_dir=Path(__file__).parent / "prompts",
+                    model=model,
+                    temperature=temperature,
+                    lang=lang,
+                    tone=tone,
+                    max_input_chars=max_input_chars,
+                    linkedin_count=linkedin_count,
+                    x_count=x_count,
+                    blog_count=blog_count,
+                    ig_count=ig_count,
+                    retrieval_tokens=retrieval_tokens,
+                    shard_size=draft_shard_size,
+                    workers=draft_workers,
+                    on_progress=on_progress,
+                )
 
             raw_linkedin.write_text(raw_outputs["raw_linkedin"], encoding="utf-8")
             raw_x_threads.write_text(raw_outputs["raw_x_threads"], encoding="utf-8")
@@ -626,6 +872,7 @@ def run_pipeline(
             raw_ig_stories.write_text(raw_outputs["raw_ig_stories"], encoding="utf-8")
 
             write_drafts_json(drafts_json, drafts)
+            drafts_partial.unlink(missing_ok=True)
 
             delivery_dir = tree["delivery"] / "Platform Ready"
             delivery_dir.mkdir(parents=True, exist_ok=True)
@@ -638,16 +885,17 @@ def run_pipeline(
                 steps,
                 "generate_drafts",
                 {
-                    "model": model,
-                    "temperature": temperature,
+                    "model": route_table.resolve("drafts").model,
+                    "temperature": route_table.resolve("drafts").temperature,
+                    "repair_model": route_table.resolve("repair").model,
                     "lang": lang,
                     "tone": tone,
-                    "counts": {
-                        "linkedin": linkedin_count,
-                        "x": x_count,
-                        "blog": blog_count,
-                        "ig": ig_count,
-                    },
+                    "counts": counts,
+                    "retrieval_tokens": retrieval_tokens,
+                    "streamed": stream_drafts,
+                    "shard_size": draft_shard_size,
+                    "reused_from": str(reuse_source) if reused is not None else None,
+                    "usage": pop_usage(),
                     "output": str(drafts_json),
                 },
             )
@@ -735,49 +983,80 @@ def run_pipeline(
             _save_steps(state_file, steps, run_file)
             raise
 
+    # Poster steps always run: their render manifests skip posters whose inputs are unchanged.
     posters_root = tree["delivery"] / "Posters"
-    posters_outputs = [posters_root]
-    if not _should_skip(steps, "export_posters", posters_outputs, force):
-        logger.info("Running step export_posters")
-        _start_step(steps, "export_posters")
-        try:
-            cards_dir = tree["delivery"] / "Cards"
-            outputs = export_posters(cards_dir=cards_dir, posters_root=posters_root)
-            _finish_step(
-                steps,
-                "export_posters",
-                {
-                    "poster_count": len(outputs),
-                    "output_path": str(posters_root),
-                },
+    logger.info("Running step export_posters")
+    _start_step(steps, "export_posters")
+    try:
+        cards_dir = tree["delivery"] / "Cards"
+        manifest = _render_manifest(tree, posters_root)
+        if poster_renderer == "native":
+            outputs = export_native_posters(
+                cards_dir=cards_dir, posters_root=posters_root, manifest=manifest
             )
-            _save_steps(state_file, steps, run_file)
-            logger.info("Step export_posters complete")
-            _cleanup_memory("export_posters")
-        except Exception as exc:  # noqa: BLE001
-            _fail_step(steps, "export_posters", str(exc))
-            _save_steps(state_file, steps, run_file)
-            raise
+        else:
+            outputs = export_posters(
+                cards_dir=cards_dir,
+                posters_root=posters_root,
+                concurrency=poster_concurrency,
+                capture=poster_capture,
+                manifest=manifest,
+            )
+        _finish_step(
+            steps,
+            "export_posters",
+            {
+                "poster_count": len(outputs),
+                "output_path": str(posters_root),
+                "renderer": poster_renderer,
+                "capture": poster_capture if poster_renderer != "native" else None,
+                "concurrency": poster_concurrency,
+                "browser_pool": pool_metrics() if poster_renderer != "native" else None,
+                "manifest": manifest.metrics(),
+            },
+        )
+        _save_steps(state_file, steps, run_file)
+        logger.info("Step export_posters complete")
+        _cleanup_memory("export_posters")
+    except Exception as exc:  # noqa: BLE001
+        _fail_step(steps, "export_posters", str(exc))
+        _save_steps(state_file, steps, run_file)
+        raise
+
+    # One cache serves every AI image step, so backgrounds shared by them are generated once.
+    cache_dir = image_cache_root(image_cache, tree["state"], out_root)
+    images = ImageCache(cache_dir, max_bytes=image_cache_max_mb * MB) if cache_dir else None
 
     ai_posters_root = tree["delivery"] / "Posters_AI"
-    ai_posters_outputs = [ai_posters_root]
-    if ai_posters and not _should_skip(steps, "export_ai_posters", ai_posters_outputs, force):
+    if ai_posters:
         logger.info("Running step export_ai_posters")
         _start_step(steps, "export_ai_posters")
         try:
             cards_dir = tree["delivery"] / "Cards"
+            manifest = _render_manifest(tree, ai_posters_root)
             outputs = export_ai_posters(
                 cards_dir=cards_dir,
                 posters_root=ai_posters_root,
                 model=model,
                 count=ai_poster_count,
+                image_cache=images,
+                workers=ai_poster_workers,
+                keep_backgrounds=keep_ai_backgrounds,
+                backgrounds=poster_backgrounds,
+                theme_name=structured_theme,
+                manifest=manifest,
             )
             _finish_step(
                 steps,
                 "export_ai_posters",
                 {
+                    "model": route_table.resolve("image").model,
                     "ai_poster_count": len(outputs),
+                    "workers": ai_poster_workers,
+                    "backgrounds": poster_backgrounds,
                     "output_path": str(ai_posters_root),
+                    "image_cache": images.metrics() if images else None,
+                    "manifest": manifest.metrics(),
                 },
             )
             _save_steps(state_file, steps, run_file)
@@ -789,10 +1068,7 @@ def run_pipeline(
 
     structured_root = tree["delivery"] / "Posters_Structured"
     blueprints_dir = tree["content"] / "visual_blueprints"
-    structured_outputs = [structured_root]
-    if structured_posters and not _should_skip(
-        steps, "export_structured_posters", structured_outputs, force
-    ):
+    if structured_posters:
         logger.info("Running step export_structured_posters")
         _start_step(steps, "export_structured_posters")
         try:
@@ -802,18 +1078,29 @@ def run_pipeline(
                 output_dir=blueprints_dir,
                 count=structured_count,
             )
+            manifest = _render_manifest(tree, structured_root)
             outputs = export_structured_posters(
                 cards_dir=cards_dir,
                 blueprints=blueprints,
                 posters_root=structured_root,
                 model=model,
+                concurrency=poster_concurrency,
+                image_cache=images,
+                backgrounds=poster_backgrounds,
+                theme_name=structured_theme,
+                manifest=manifest,
             )
             _finish_step(
                 steps,
                 "export_structured_posters",
                 {
+                    "model": route_table.resolve("image").model,
                     "structured_count": len(outputs),
+                    "backgrounds": poster_backgrounds,
                     "output_path": str(structured_root),
+                    "browser_pool": pool_metrics(),
+                    "image_cache": images.metrics() if images else None,
+                    "manifest": manifest.metrics(),
                 },
             )
             _save_steps(state_file, steps, run_file)
@@ -825,18 +1112,16 @@ def run_pipeline(
             raise
 
     premium_root = tree["delivery"] / "Posters_Structured_Premium"
-    premium_outputs = [premium_root]
     if structured_only and not (tree["content"] / "visual_blueprints").exists():
         raise FileNotFoundError("visual_blueprints not found. Run structured posters first.")
 
-    if (structured_posters or structured_premium or structured_only) and not _should_skip(
-        steps, "export_structured_posters_premium", premium_outputs, force
-    ):
+    if structured_posters or structured_premium or structured_only:
         logger.info("Running step export_structured_posters_premium")
         _start_step(steps, "export_structured_posters_premium")
         try:
             cards_dir = tree["delivery"] / "Cards"
             blueprints_dir = tree["content"] / "visual_blueprints"
+            manifest = _render_manifest(tree, premium_root)
             outputs = export_structured_posters_premium(
                 cards_dir=cards_dir,
                 blueprints_dir=blueprints_dir,
@@ -844,14 +1129,23 @@ def run_pipeline(
                 theme_name=structured_theme,
                 model=model,
                 font_path=os.environ.get("ATOMIZE_FONT_PATH"),
+                concurrency=poster_concurrency,
+                image_cache=images,
+                backgrounds=poster_backgrounds,
+                manifest=manifest,
             )
             _finish_step(
                 steps,
                 "export_structured_posters_premium",
                 {
+                    "model": route_table.resolve("image").model,
                     "theme": structured_theme,
                     "output_path": str(premium_root),
                     "poster_count": len(outputs),
+                    "backgrounds": poster_backgrounds,
+                    "browser_pool": pool_metrics(),
+                    "image_cache": images.metrics() if images else None,
+                    "manifest": manifest.metrics(),
                 },
             )
             _save_steps(state_file, steps, run_file)
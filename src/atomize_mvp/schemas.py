@@ -11,6 +11,15 @@ class ContentBlueprint(BaseModel):
     do_not_say: conlist(str, min_length=5, max_length=10)
 
 
+class PartialBlueprint(BaseModel):
+    summary: str = ""
+    key_points: list[str] = Field(default_factory=list)
+    hooks: list[str] = Field(default_factory=list)
+    quotes: list[str] = Field(default_factory=list)
+    ctas: list[str] = Field(default_factory=list)
+    do_not_say: list[str] = Field(default_factory=list)
+
+
 class LinkedinPost(BaseModel):
     id: str
     hook: str
@@ -1,11 +1,14 @@
-import base64
 import json
 import re
+from functools import partial
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
-
-from atomize_mvp.llm_client import generate_image_base64
+from atomize_mvp.asset_store import get_asset_store
+from atomize_mvp.browser_pool import get_pool, hydrate_screenshot
+from atomize_mvp.design_system import get_theme
+from atomize_mvp.image_cache import IMAGE_SIZE, ImageCache, generate_image, image_source
+from atomize_mvp.procedural import procedural_background
+from atomize_mvp.render_manifest import RenderManifest, poster_hash
 from atomize_mvp.schemas import VisualBlueprint, VisualSection
 
 PLATFORM_FOLDERS = {
@@ -96,13 +99,31 @@ def generate_visual_blueprints(cards_dir: Path, output_dir: Path, count: int) ->
     return outputs
 
 
-def _render_template(blueprint: VisualBlueprint, image_data_uri: str, template: str) -> str:
-    icon_html = "\n".join(
-        [
-            f"<li><span class='icon'>{ICON_MAP.get(s.icon, '✨')}</span>{s.text}</li>"
-            for s in blueprint.sections
-        ]
-    )
+HYDRATE_SCRIPT = """
+window.hydrate = async (data) => {
+  document.querySelector(".title").textContent = data.title;
+  document.querySelector(".subtitle").textContent = data.subtitle;
+  document.querySelector(".grid").classList.toggle("reverse", data.layout === "b");
+  document.querySelector("ul").replaceChildren(
+    ...data.items.map((item) => {
+      const li = document.createElement("li");
+      const icon = document.createElement("span");
+      icon.className = "icon";
+      icon.textContent = item.icon;
+      li.append(icon, item.text);
+      return li;
+    })
+  );
+  const image = document.querySelector(".visual img");
+  image.src = data.image;
+  await image.decode();
+  await document.fonts.ready;
+};
+"""
+
+
+def _build_shell() -> str:
+    """Poster document with empty slots, filled per poster by ``window.hydrate``."""
     return f"""<!DOCTYPE html>
 <html lang="en">
   <head>
@@ -119,6 +140,7 @@ def _render_template(blueprint: VisualBlueprint, image_data_uri: str, template:
       .title {{ font-size: 56px; font-weight: 700; margin: 0 0 12px 0; }}
       .subtitle {{ font-size: 24px; color: #cbd5f5; margin-bottom: 24px; }}
       .grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 28px; flex: 1; }}
+      .grid.reverse .visual {{ order: 2; }}
       .panel {{ background: rgba(255,255,255,0.04); border-radius: 24px; padding: 24px; }}
       .visual {{ display: flex; align-items: center; justify-content: center; }}
       .visual img {{ width: 100%; max-width: 360px; border-radius: 18px; }}
@@ -126,41 +148,36 @@ def _render_template(blueprint: VisualBlueprint, image_data_uri: str, template:
       li {{ margin-bottom: 16px; font-size: 22px; }}
       .icon {{ margin-right: 12px; }}
     </style>
+    <script>{HYDRATE_SCRIPT}</script>
   </head>
   <body>
     <div class="poster" id="poster">
-      <div class="title">{blueprint.title}</div>
-      <div class="subtitle">{blueprint.subtitle}</div>
-      {template}
-    </div>
-  </body>
-</html>""".replace("{{IMAGE}}", image_data_uri).replace("{{ITEMS}}", icon_html)
-
-
-def _template_a() -> str:
-    return """
+      <div class="title"></div>
+      <div class="subtitle"></div>
       <div class="grid">
         <div class="panel visual">
-          <img src="{{IMAGE}}" alt="visual" />
+          <img alt="visual" />
         </div>
         <div class="panel">
-          <ul>{{ITEMS}}</ul>
+          <ul></ul>
         </div>
       </div>
-    """
+    </div>
+  </body>
+</html>"""
 
 
-def _template_b() -> str:
-    return """
-      <div class="grid">
-        <div class="panel">
-          <ul>{{ITEMS}}</ul>
-        </div>
-        <div class="panel visual">
-          <img src="{{IMAGE}}" alt="visual" />
-        </div>
-      </div>
-    """
+def _poster_data(blueprint: VisualBlueprint, image_url: str, layout: str) -> dict:
+    return {
+        "title": blueprint.title,
+        "subtitle": blueprint.subtitle,
+        "layout": layout,
+        "image": image_url,
+        "items": [
+            {"icon": ICON_MAP.get(section.icon, "✨"), "text": section.text}
+            for section in blueprint.sections
+        ],
+    }
 
 
 def export_structured_posters(
@@ -168,18 +185,22 @@ def export_structured_posters(
     blueprints: list[Path],
     posters_root: Path,
     model: str,
+    concurrency: int = 4,
+    image_cache: ImageCache | None = None,
+    backgrounds: str = "ai",
+    theme_name: str = "bright_canva",
+    manifest: RenderManifest | None = None,
 ) -> list[Path]:
     cards_json = cards_dir / "cards.json"
     cards = {card["id"]: card for card in json.loads(cards_json.read_text(encoding="utf-8"))}
-    outputs: list[Path] = []
 
     posters_root.mkdir(parents=True, exist_ok=True)
-    template_a = _template_a()
-    template_b = _template_b()
+    manifest = manifest or RenderManifest(posters_root)
+    shell = _build_shell()
+    source = theme_name if backgrounds == "procedural" else image_source(model)
+    outputs: list[Path] = []
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch()
-        page = browser.new_page(viewport={"width": 1080, "height": 1080, "deviceScaleFactor": 1})
+    def renders():
         for idx, blueprint_path in enumerate(blueprints):
             blueprint = VisualBlueprint.model_validate(
                 json.loads(blueprint_path.read_text(encoding="utf-8"))
@@ -187,17 +208,24 @@ def export_structured_posters(
             card = cards.get(blueprint_path.stem)
             if not card:
                 continue
-            prompt = blueprint.visual_hint
-            image_b64 = generate_image_base64(prompt, model=model, size="1024x1024")
-            image_data_uri = f"data:image/png;base64,{image_b64}"
-            template = template_a if idx % 2 == 0 else template_b
-            html = _render_template(blueprint, image_data_uri, template)
-            page.set_content(html, wait_until="load")
-            element = page.query_selector("#poster")
+            # Posters alternate between the image-left and image-right layouts.
+            layout = "a" if idx % 2 == 0 else "b"
             output_path = structured_output_path(posters_root, card["platform"], card["id"])
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            element.screenshot(path=str(output_path))
             outputs.append(output_path)
-        browser.close()
-
+            digest = poster_hash(
+                "structured", card, blueprint.model_dump(), layout, shell, backgrounds, source
+            )
+            if not manifest.needs_render(output_path, digest):
+                continue
+            if backgrounds == "procedural":
+                image = procedural_background(card["id"], get_theme(theme_name))
+            else:
+                prompt = blueprint.visual_hint
+                image = generate_image(prompt, model=model, size=IMAGE_SIZE, cache=image_cache)
+            image_url = get_asset_store().put(image, ".png")
+            data = _poster_data(blueprint, image_url, layout)
+            yield partial(hydrate_screenshot, data=data, output_path=output_path)
+
+    get_pool().render_many(renders(), concurrency=concurrency, shell=shell)
+    manifest.commit()
     return outputs
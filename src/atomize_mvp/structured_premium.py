@@ -1,12 +1,13 @@
-import base64
 import json
-import urllib.parse
+from functools import lru_cache, partial
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright
-
+from atomize_mvp.asset_store import get_asset_store
+from atomize_mvp.browser_pool import get_pool, hydrate_screenshot
 from atomize_mvp.design_system import Theme, get_theme
-from atomize_mvp.llm_client import generate_image_base64
+from atomize_mvp.image_cache import IMAGE_SIZE, ImageCache, generate_image, image_source
+from atomize_mvp.procedural import procedural_background
+from atomize_mvp.render_manifest import RenderManifest, file_digest, poster_hash
 from atomize_mvp.schemas import VisualBlueprint
 
 PLATFORM_FOLDERS = {
@@ -24,39 +25,55 @@ def premium_output_path(root: Path, platform: str, content_id: str) -> Path:
     return root / folder / f"{content_id}.png"
 
 
-def _load_icon_svg(name: str) -> str:
+@lru_cache(maxsize=None)
+def _load_icon_svg(name: str) -> bytes:
     icon_path = Path(__file__).parent / "assets" / "icons" / f"{name}.svg"
-    return icon_path.read_text(encoding="utf-8")
+    return icon_path.read_bytes()
 
 
-def _icon_data_uri(name: str) -> str:
-    svg = _load_icon_svg(name)
-    svg = svg.replace('fill="currentColor"', 'fill="currentColor"')
-    encoded = urllib.parse.quote(svg)
-    return f"data:image/svg+xml;utf8,{encoded}"
+def _icon_url(name: str) -> str:
+    # Put on every use so the store never evicts an icon a poster still needs.
+    return get_asset_store().put(_load_icon_svg(name), ".svg")
 
 
-def _build_html(
-    blueprint: VisualBlueprint,
-    platform: str,
-    theme: Theme,
-    image_data_uri: str | None,
-    font_path: str | None,
-) -> str:
-    icon_html = "\n".join(
-        [
-            f"""
-            <div class="feature-card">
-              <div class="icon-wrap">
-                <img src="{_icon_data_uri(section.icon if section.icon in ICON_NAMES else 'ai')}" alt="{section.icon}" />
-              </div>
-              <div class="feature-text">{section.text}</div>
-            </div>
-            """
-            for section in blueprint.sections
-        ]
-    )
+HYDRATE_SCRIPT = """
+window.hydrate = async (data) => {
+  document.querySelector(".badge").textContent = data.platform;
+  document.querySelector(".title").textContent = data.title;
+  document.querySelector(".subtitle").textContent = data.subtitle;
+  document.querySelector(".grid").replaceChildren(
+    ...data.sections.map((section) => {
+      const card = document.createElement("div");
+      card.className = "feature-card";
+      const wrap = document.createElement("div");
+      wrap.className = "icon-wrap";
+      const icon = document.createElement("img");
+      icon.src = section.icon;
+      icon.alt = section.name;
+      wrap.append(icon);
+      const text = document.createElement("div");
+      text.className = "feature-text";
+      text.textContent = section.text;
+      card.append(wrap, text);
+      return card;
+    })
+  );
+  const anchor = document.querySelector(".anchor");
+  anchor.hidden = !data.image;
+  if (data.image) {
+    anchor.querySelector("img").src = data.image;
+  }
+  const images = [...document.querySelectorAll(".poster img")].filter(
+    (image) => !image.closest("[hidden]")
+  );
+  await Promise.all(images.map((image) => image.decode()));
+  await document.fonts.ready;
+};
+"""
 
+
+def _build_shell(theme: Theme, font_path: str | None) -> str:
+    """Poster document for one theme and font, filled per poster by ``window.hydrate``."""
     font_face = ""
     if font_path:
         font_url = Path(font_path).resolve().as_uri()
@@ -65,18 +82,8 @@ def _build_html(
             f"url('{font_url}'); font-weight: 400; }}"
         )
 
-    title = blueprint.title
-    subtitle = blueprint.subtitle
     font_family = "AtomizeCustom" if font_path else "Segoe UI"
 
-    anchor_html = ""
-    if image_data_uri:
-        anchor_html = f"""
-        <div class="anchor">
-          <img src="{image_data_uri}" alt="visual anchor" />
-        </div>
-        """
-
     return f"""<!DOCTYPE html>
 <html lang="en">
   <head>
@@ -183,25 +190,46 @@ def _build_html(
         height: 100%;
         object-fit: cover;
       }}
+      .anchor[hidden] {{
+        display: none;
+      }}
     </style>
+    <script>{HYDRATE_SCRIPT}</script>
   </head>
   <body>
     <div class="poster" id="poster">
       <div class="header">
-        <div class="badge">{platform}</div>
-        <h1 class="title">{title}</h1>
-        <div class="subtitle">{subtitle}</div>
+        <div class="badge"></div>
+        <h1 class="title"></h1>
+        <div class="subtitle"></div>
       </div>
-      <div class="grid">
-        {icon_html}
+      <div class="grid"></div>
+      <div class="anchor" hidden>
+        <img alt="visual anchor" />
       </div>
-      {anchor_html}
     </div>
   </body>
 </html>
 """
 
 
+def _poster_data(blueprint: VisualBlueprint, platform: str, image_url: str | None) -> dict:
+    return {
+        "platform": platform,
+        "title": blueprint.title,
+        "subtitle": blueprint.subtitle,
+        "image": image_url,
+        "sections": [
+            {
+                "name": section.icon,
+                "icon": _icon_url(section.icon if section.icon in ICON_NAMES else "ai"),
+                "text": section.text,
+            }
+            for section in blueprint.sections
+        ],
+    }
+
+
 def export_structured_posters_premium(
     cards_dir: Path,
     blueprints_dir: Path,
@@ -209,17 +237,23 @@ def export_structured_posters_premium(
     theme_name: str,
     model: str,
     font_path: str | None,
+    concurrency: int = 4,
+    image_cache: ImageCache | None = None,
+    backgrounds: str = "ai",
+    manifest: RenderManifest | None = None,
 ) -> list[Path]:
     cards = json.loads((cards_dir / "cards.json").read_text(encoding="utf-8"))
     cards_by_id = {card["id"]: card for card in cards}
     theme = get_theme(theme_name)
 
     posters_root.mkdir(parents=True, exist_ok=True)
+    manifest = manifest or RenderManifest(posters_root)
+    shell = _build_shell(theme, font_path)
+    font = file_digest(font_path)
+    source = theme_name if backgrounds == "procedural" else image_source(model)
     outputs: list[Path] = []
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch()
-        page = browser.new_page(viewport={"width": 1080, "height": 1080, "deviceScaleFactor": 1})
+    def renders():
         for blueprint_path in sorted(blueprints_dir.glob("*.json")):
             blueprint = VisualBlueprint.model_validate_json(
                 blueprint_path.read_text(encoding="utf-8")
@@ -227,22 +261,24 @@ def export_structured_posters_premium(
             card = cards_by_id.get(blueprint_path.stem)
             if not card:
                 continue
-            visual_prompt = blueprint.visual_hint
-            image_b64 = generate_image_base64(visual_prompt, model=model, size="1024x1024")
-            image_data_uri = f"data:image/png;base64,{image_b64}"
-            html = _build_html(
-                blueprint=blueprint,
-                platform=card["platform"],
-                theme=theme,
-                image_data_uri=image_data_uri,
-                font_path=font_path,
-            )
-            page.set_content(html, wait_until="load")
-            element = page.query_selector("#poster")
             output_path = premium_output_path(posters_root, card["platform"], card["id"])
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            element.screenshot(path=str(output_path))
             outputs.append(output_path)
-        browser.close()
+            digest = poster_hash(
+                "premium", card, blueprint.model_dump(), shell, font, backgrounds, source
+            )
+            if not manifest.needs_render(output_path, digest):
+                continue
+            if backgrounds == "procedural":
+                image = procedural_background(card["id"], theme)
+            else:
+                visual_prompt = blueprint.visual_hint
+                image = generate_image(
+                    visual_prompt, model=model, size=IMAGE_SIZE, cache=image_cache
+                )
+            image_url = get_asset_store().put(image, ".png")
+            data = _poster_data(blueprint, card["platform"], image_url)
+            yield partial(hydrate_screenshot, data=data, output_path=output_path)
 
+    get_pool().render_many(renders(), concurrency=concurrency, shell=shell)
+    manifest.commit()
     return outputs
@@ -1,6 +1,7 @@
 import json
 import os
 from pathlib import Path
+from typing import Callable
 from multiprocessing import get_context
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
@@ -91,6 +92,7 @@ def transcribe_audio_chunks(
     segments_jsonl_path: Path,
     srt_path: Path,
     segment_seconds: int,
+    on_chunk: Callable[[int, list[dict]], None] | None = None,
 ) -> tuple[int, dict]:
     whisper = WhisperModel(model, device=device)
     segment_count = 0
@@ -117,6 +119,7 @@ def transcribe_audio_chunks(
             )
             if language_value is None:
                 language_value = getattr(info, "language", None)
+            chunk_segments: list[dict] = []
             for segment in segments_iter:
                 payload = {
                     "start": float(segment.start) + offset,
@@ -124,6 +127,7 @@ def transcribe_audio_chunks(
                     "text": segment.text.strip(),
                 }
                 segment_count += 1
+                chunk_segments.append(payload)
 
                 if not first:
                     segments_file.write(",\n")
@@ -148,6 +152,8 @@ def transcribe_audio_chunks(
                 srt_file.write(
                     f"{segment_count}\n{start} --> {end}\n{payload['text']}\n\n"
                 )
+            if on_chunk is not None:
+                on_chunk(idx, chunk_segments)
 
         if chunk_text:
             transcript_file.write(" ".join(chunk_text).strip() + "\n")
@@ -261,12 +267,13 @@ def transcribe_audio_chunks_parallel(
     srt_path: Path,
     segment_seconds: int,
     max_workers: int,
+    on_chunk: Callable[[int, list[dict]], None] | None = None,
 ) -> tuple[int, dict]:
     if not chunks:
         return 0, {"language": None, "duration": 0.0}
 
     jsonl_paths: list[Path] = []
-    futures = []
+    futures = {}
     language_value = None
     ctx = get_context("spawn")
     with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as executor:
@@ -274,22 +281,24 @@ def transcribe_audio_chunks_parallel(
             offset = idx * segment_seconds
             jsonl_path = chunk.parent / f"{chunk.stem}.jsonl"
             jsonl_paths.append(jsonl_path)
-            futures.append(
-                executor.submit(
-                    _transcribe_chunk_to_jsonl,
-                    str(chunk),
-                    model,
-                    language,
-                    device,
-                    vad_filter,
-                    str(jsonl_path),
-                    offset,
-                )
+            future = executor.submit(
+                _transcribe_chunk_to_jsonl,
+                str(chunk),
+                model,
+                language,
+                device,
+                vad_filter,
+                str(jsonl_path),
+                offset,
             )
+            futures[future] = idx
         for future in as_completed(futures):
             _, info = future.result()
             if language_value is None and info.get("language"):
                 language_value = info["language"]
+            if on_chunk is not None:
+                idx = futures[future]
+                on_chunk(idx, read_segments_jsonl(jsonl_paths[idx]))
 
     jsonl_paths = sorted(jsonl_paths)
     segment_count, max_end = _merge_jsonl_outputs(
@@ -432,6 +441,11 @@ def transcribe_audio_chunks_subprocess(
     return int(data.get("segments_count", 0)), data.get("info", {})
 
 
+def read_segments_jsonl(path: Path) -> list[dict]:
+    with path.open("r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
 def write_segments(path: Path, segments: list[dict]) -> None:
     path.write_text(json.dumps(segments, indent=2), encoding="utf-8")
 
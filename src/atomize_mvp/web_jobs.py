@@ -106,33 +106,17 @@ def _read_job_meta(job_root: Path) -> dict:
     return {}
 
 
-def _infer_progress(steps: dict, meta: dict) -> tuple[str | None, int, bool, bool]:
-    mode = (meta.get("mode") or "full").lower()
-    order = [
-        "init",
-        "stage_source",
-        "prepare_audio",
-        "transcribe",
-        "cleanup_transcript",
-    ]
-    if mode == "quick":
-        order += [
-            "generate_quick",
-            "render_cards",
-            "export_posters",
-        ]
-    else:
-        order += [
-            "blueprint",
-            "generate_drafts",
-            "finalize_delivery",
-            "render_cards",
-            "export_posters",
-        ]
-        if meta.get("structured_posters"):
-            order.append("export_structured_posters")
-        if meta.get("structured_premium"):
-            order.append("export_structured_posters_premium")
+def _read_delivery_phase(job_root: Path) -> str | None:
+    run_path = job_root / ".atomize" / "run.json"
+    if not run_path.exists():
+        return None
+    try:
+        return json.loads(run_path.read_text(encoding="utf-8")).get("delivery_phase")
+    except json.JSONDecodeError:
+        return None
+
+
+def _walk_steps(steps: dict, order: list[str]) -> tuple[int, str | None, bool, bool]:
     completed = 0
     current = None
     has_failed = False
@@ -147,6 +131,53 @@ def _infer_progress(steps: dict, meta: dict) -> tuple[str | None, int, bool, boo
             break
         elif status == "failed":
             has_failed = True
+    return completed, current, has_running, has_failed
+
+
+def _infer_progress(
+    steps: dict, meta: dict, phase: str | None = None
+) -> tuple[str | None, int, bool, bool]:
+    mode = (meta.get("mode") or "full").lower()
+    order = [
+        "init",
+        "stage_source",
+        "prepare_audio",
+        "transcribe",
+        "cleanup_transcript",
+    ]
+    if meta.get("compress_tokens"):
+        order.append("compress_transcript")
+    quick_order = [
+        "generate_quick",
+        "render_cards",
+        "export_posters",
+    ]
+    full_order = [
+        "blueprint",
+        "generate_drafts",
+        "finalize_delivery",
+        "render_cards",
+        "export_posters",
+    ]
+    if meta.get("structured_posters"):
+        full_order.append("export_structured_posters")
+    if meta.get("structured_premium"):
+        full_order.append("export_structured_posters_premium")
+
+    if mode == "progressive":
+        preview_order = order + quick_order
+        total = len(preview_order) + len(full_order)
+        if phase in {"preview_ready", "full", "complete"}:
+            # Preview steps are reset for the full phase, so count them as done.
+            completed, current, has_running, has_failed = _walk_steps(steps, full_order)
+            completed += len(preview_order)
+        else:
+            completed, current, has_running, has_failed = _walk_steps(steps, preview_order)
+        percent = int((completed / total) * 100)
+        return current, percent, has_running, has_failed
+
+    order += quick_order if mode == "quick" else full_order
+    completed, current, has_running, has_failed = _walk_steps(steps, order)
     percent = int((completed / max(len(order), 1)) * 100)
     return current, percent, has_running, has_failed
 
@@ -158,11 +189,16 @@ def get_job_status(out_root: Path, job_id: str) -> dict | None:
             job_root = Path(record["job_path"])
             steps = _read_steps_status(job_root)
             meta = _read_job_meta(job_root)
-            current_step, percent, has_running, has_failed = _infer_progress(steps, meta)
+            phase = _read_delivery_phase(job_root)
+            current_step, percent, has_running, has_failed = _infer_progress(
+                steps, meta, phase
+            )
             record = {**record}
             record["current_step"] = current_step
             record["percent"] = percent
             record["mode"] = meta.get("mode")
+            record["phase"] = phase
+            record["preview_ready"] = phase in {"preview_ready", "full", "complete"}
             if record.get("status") == "running":
                 if has_failed:
                     record["status"] = "failed"
@@ -220,6 +256,7 @@ def create_job(
         "mode": config.get("mode", "full"),
         "structured_posters": config.get("structured_posters"),
         "structured_premium": config.get("structured_premium"),
+        "compress_tokens": config.get("compress_tokens", 0),
     }
     job_meta_path.write_text(
         json.dumps(job_meta, indent=2, sort_keys=True), encoding="utf-8"
@@ -279,6 +316,21 @@ def _run_job(out_root: Path, job_id: str, config: dict[str, Any]) -> None:
             structured_only=False,
             structured_premium=config["structured_premium"],
             mode=config.get("mode", "full"),
+            blueprint_chunks=config.get("blueprint_chunks", 0),
+            blueprint_workers=config.get("blueprint_workers", 4),
+            compress_tokens=config.get("compress_tokens", 0),
+            retrieval_tokens=config.get("retrieval_tokens", 0),
+            routes=config.get("routes"),
+            stream_drafts=config.get("stream_drafts", False),
+            draft_shard_size=config.get("draft_shard_size", 0),
+            draft_workers=config.get("draft_workers", 4),
+            pipeline_section_seconds=config.get("pipeline_section_seconds", 0),
+            reuse_threshold=config.get("reuse_threshold", 0.0),
+            reuse_mode=config.get("reuse_mode", "reuse"),
+            poster_concurrency=config.get("poster_concurrency", 4),
+            poster_renderer=config.get("poster_renderer", "browser"),
+            image_cache=config.get("image_cache", "job"),
+            poster_backgrounds=config.get("poster_backgrounds", "ai"),
         )
         _update_registry(
             out_root,
@@ -25,6 +25,8 @@ class JobStatusResponse(BaseModel):
     error: Optional[str] = None
     job_path: str
     mode: Optional[str] = None
+    phase: Optional[str] = None
+    preview_ready: bool = False
 
 
 class JobResultsResponse(BaseModel):
@@ -34,7 +36,10 @@ class JobResultsResponse(BaseModel):
     job_path: str
     summary: Optional[str] = None
     drafts: dict = Field(default_factory=dict)
+    drafts_partial: bool = False
     posters: dict = Field(default_factory=dict)
     docs: list[dict] = Field(default_factory=list)
     cards: list[dict] = Field(default_factory=list)
     manifest: Optional[dict] = None
+    phase: Optional[str] = None
+    preview_ready: bool = False
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 
@@ -38,6 +38,7 @@ def _include_path(path: Path, started_at: datetime | None) -> bool:
 def build_results(out_root: Path, job_root: Path) -> dict:
     delivery = job_root / "04_delivery"
     drafts_path = job_root / "03_content" / "drafts" / "drafts.json"
+    partial_path = job_root / "03_content" / "drafts" / "drafts.partial.json"
     quick_path = job_root / "03_content" / "quick" / "quick_bundle.json"
     manifest_path = delivery / "run_manifest.json"
     started_at = _started_at(job_root)
@@ -45,12 +46,24 @@ def build_results(out_root: Path, job_root: Path) -> dict:
     results = {
         "summary": None,
         "drafts": {},
+        "drafts_partial": False,
         "posters": {},
         "docs": [],
         "cards": [],
         "manifest": None,
+        "phase": None,
+        "preview_ready": False,
     }
 
+    run_path = job_root / ".atomize" / "run.json"
+    if run_path.exists():
+        try:
+            phase = json.loads(run_path.read_text(encoding="utf-8")).get("delivery_phase")
+        except json.JSONDecodeError:
+            phase = None
+        results["phase"] = phase
+        results["preview_ready"] = phase in {"preview_ready", "full", "complete"}
+
     if drafts_path.exists() and _include_path(drafts_path, started_at):
         data = json.loads(drafts_path.read_text(encoding="utf-8"))
         results["drafts"] = {
@@ -65,6 +78,18 @@ def build_results(out_root: Path, job_root: Path) -> dict:
                 results["summary"] = quick_data.get("summary")
             except json.JSONDecodeError:
                 pass
+    elif partial_path.exists() and _include_path(partial_path, started_at):
+        try:
+            data = json.loads(partial_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            data = {}
+        results["drafts"] = {
+            "linkedin": data.get("linkedin_posts", []),
+            "x": data.get("x_threads", []),
+            "blog": data.get("blog_outlines", []),
+            "ig": data.get("ig_stories", []),
+        }
+        results["drafts_partial"] = True
     elif quick_path.exists() and _include_path(quick_path, started_at):
         data = json.loads(quick_path.read_text(encoding="utf-8"))
         results["summary"] = data.get("summary")
@@ -9,6 +9,12 @@ from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from atomize_mvp.browser_pool import pool_metrics
+from atomize_mvp.image_cache import IMAGE_CACHE_MODES
+from atomize_mvp.procedural import BACKGROUND_SOURCES
+from atomize_mvp.render_posters import POSTER_RENDERERS
+from atomize_mvp.reuse import REUSE_MODES
+from atomize_mvp.routing import parse_route_spec
 from atomize_mvp.web_jobs import create_job, get_job_status
 from atomize_mvp.web_models import JobCreateResponse, JobResultsResponse, JobStatusResponse
 from atomize_mvp.web_results import build_results
@@ -53,6 +59,12 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@router.get("/api/browser-pool")
+def browser_pool_metrics() -> dict:
+    metrics = pool_metrics()
+    return {"started": metrics is not None, "metrics": metrics or {}}
+
+
 @router.post("/api/jobs", response_model=JobCreateResponse)
 def create_job_api(
     file: UploadFile = File(...),
@@ -70,7 +82,22 @@ def create_job_api(
     device: str = Form("cpu"),
     model: str = Form("gpt-4o-mini"),
     temperature: float = Form(0.3),
+    routes: str = Form(""),
     max_input_chars: int = Form(120000),
+    blueprint_chunks: int = Form(0),
+    blueprint_workers: int = Form(4),
+    pipeline_section_minutes: int = Form(0),
+    reuse_threshold: float = Form(0.0),
+    reuse_mode: str = Form("reuse"),
+    poster_concurrency: int = Form(4),
+    poster_renderer: str = Form("native" if os.environ.get("RENDER") else "browser"),
+    image_cache: str = Form("job"),
+    poster_backgrounds: str = Form("ai"),
+    compress_tokens: int = Form(0),
+    retrieval_tokens: int = Form(0),
+    stream_drafts: bool = Form(True),
+    draft_shard_size: int = Form(0),
+    draft_workers: int = Form(4),
     mode: str = Form("quick" if os.environ.get("RENDER") else "full"),
     linkedin_count: int = Form(2),
     x_count: int = Form(2),
@@ -86,6 +113,18 @@ def create_job_api(
     out_root = Path(os.environ.get("ATOMIZE_OUT_ROOT", "./out")).resolve()
     if not _allowed_ext(file.filename or ""):
         raise HTTPException(status_code=400, detail="Unsupported file type.")
+    try:
+        model_routes = parse_route_spec(routes)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if reuse_mode not in REUSE_MODES:
+        raise HTTPException(status_code=400, detail="Unsupported reuse mode.")
+    if poster_renderer not in POSTER_RENDERERS:
+        raise HTTPException(status_code=400, detail="Unsupported poster renderer.")
+    if image_cache not in IMAGE_CACHE_MODES:
+        raise HTTPException(status_code=400, detail="Unsupported image cache mode.")
+    if poster_backgrounds not in BACKGROUND_SOURCES:
+        raise HTTPException(status_code=400, detail="Unsupported poster backgrounds.")
 
     job_id = str(uuid.uuid4())
     job_root = out_root / client / f"{title}__{job_id}"
@@ -112,7 +151,22 @@ def create_job_api(
         "device": device,
         "model": model,
         "temperature": temperature,
+        "routes": model_routes,
         "max_input_chars": max_input_chars,
+        "blueprint_chunks": blueprint_chunks,
+        "blueprint_workers": blueprint_workers,
+        "pipeline_section_seconds": pipeline_section_minutes * 60,
+        "reuse_threshold": reuse_threshold,
+        "reuse_mode": reuse_mode,
+        "poster_concurrency": poster_concurrency,
+        "poster_renderer": poster_renderer,
+        "image_cache": image_cache,
+        "poster_backgrounds": poster_backgrounds,
+        "compress_tokens": compress_tokens,
+        "retrieval_tokens": retrieval_tokens,
+        "stream_drafts": stream_drafts,
+        "draft_shard_size": draft_shard_size,
+        "draft_workers": draft_workers,
         "lang": lang,
         "tone": tone,
         "linkedin_count": linkedin_count,
@@ -65,7 +65,8 @@ async function pollJob(jobId, delayMs = 1000) {
   if (!resp.ok) return;
   const data = await resp.json();
   if (statusEl) {
-    statusEl.textContent = `${data.status} | ${data.current_step || "waiting"} | ${data.percent}%`;
+    const phase = data.preview_ready && data.status === "running" ? " | preview ready" : "";
+    statusEl.textContent = `${data.status} | ${data.current_step || "waiting"} | ${data.percent}%${phase}`;
   }
   if (progressEl) {
     progressEl.value = data.percent || 0;
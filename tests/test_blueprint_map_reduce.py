@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+
+from atomize_mvp import blueprint as blueprint_module
+from atomize_mvp.blueprint import (
+    SectionMapper,
+    chunk_transcript,
+    generate_content_blueprint,
+    plan_chunk_count,
+)
+from atomize_mvp.schemas import PartialBlueprint
+
+
+def test_plan_chunk_count():
+    assert plan_chunk_count(1000, 120000, 0) == 1
+    assert plan_chunk_count(250000, 120000, 0) == 3
+    assert plan_chunk_count(1000, 120000, 4) == 4
+
+
+def test_chunk_transcript_keeps_paragraphs():
+    paragraphs = [f"Paragraph {idx} talks about drones." for idx in range(20)]
+    text = "\n\n".join(paragraphs)
+    chunks = chunk_transcript(text, 4, 120000)
+    assert len(chunks) >= 4
+    rejoined = "\n\n".join(chunks).split("\n\n")
+    assert rejoined == paragraphs
+
+
+def test_chunk_transcript_splits_oversized_paragraph():
+    text = " ".join(["This is a sentence."] * 200)
+    chunks = chunk_transcript(text, 1, 500)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 500 for chunk in chunks)
+
+
+def test_map_reduce_blueprint(monkeypatch):
+    partial = {
+        "summary": "Section summary",
+        "key_points": ["Point"],
+        "hooks": ["Hook"],
+        "quotes": ["Quote"],
+        "ctas": ["CTA"],
+        "do_not_say": ["Avoid"],
+    }
+    merged = {
+        "title": "Kickoff",
+        "summary": "Summary",
+        "key_points": ["P"] * 8,
+        "hooks": ["H"] * 10,
+        "quotes": ["Q"] * 10,
+        "ctas": ["C"] * 8,
+        "do_not_say": ["D"] * 5,
+    }
+    map_calls = []
+    reduce_calls = []
+
+    def fake_generate_text(system_prompt, user_prompt, model, temperature, *args, **kwargs):
+        map_calls.append(user_prompt)
+        return json.dumps(partial)
+
+    def fake_generate_blueprint(text, model, temperature, *args):
+        reduce_calls.append(text)
+        return json.dumps(merged)
+
+    monkeypatch.delenv("ATOMIZE_OFFLINE", raising=False)
+    monkeypatch.setattr(blueprint_module, "generate_text", fake_generate_text)
+    monkeypatch.setattr(blueprint_module, "generate_blueprint", fake_generate_blueprint)
+
+    text = "\n\n".join([f"Paragraph {idx}." for idx in range(30)])
+    prompt_path = Path(blueprint_module.__file__).parent / "prompts" / "content_blueprint.txt"
+    _, blueprint, _ = generate_content_blueprint(
+        clean_text=text,
+        title="Kickoff",
+        prompt_path=prompt_path,
+        model="test",
+        temperature=0.0,
+        max_input_chars=100,
+        lang="en",
+        chunks=0,
+        workers=2,
+    )
+    assert len(map_calls) > 1
+    assert len(reduce_calls) == 1
+    assert "Paragraph 29." in "".join(map_calls)
+    assert blueprint.title == "Kickoff"
+
+
+def test_section_mapper_orders_out_of_order_chunks(monkeypatch, tmp_path):
+    seen = []
+
+    def fake_extract(section, title, prompt_path, model, temperature, lang, index, total):
+        seen.append((index, section))
+        return PartialBlueprint(summary=f"s{index}", key_points=[section])
+
+    monkeypatch.setattr(blueprint_module, "extract_partial_blueprint", fake_extract)
+    mapper = SectionMapper(
+        title="t",
+        prompt_path=tmp_path / "map.txt",
+        model="m",
+        temperature=0.0,
+        lang="en",
+        partials_dir=tmp_path / "partials",
+        section_seconds=60,
+        workers=1,
+    )
+    mapper.add_chunk(1, [{"start": 60.0, "end": 70.0, "text": "second"}])
+    assert mapper.sections == 0
+    mapper.add_chunk(0, [{"start": 0.0, "end": 10.0, "text": "first"}])
+    mapper.add_chunk(2, [{"start": 120.0, "end": 130.0, "text": "third"}])
+    partials = mapper.finish()
+
+    assert [partial.key_points for partial in partials] == [["first"], ["second"], ["third"]]
+    assert sorted(path.name for path in (tmp_path / "partials").iterdir()) == [
+        "partial_001.json",
+        "partial_002.json",
+        "partial_003.json",
+    ]
@@ -0,0 +1,221 @@
+import asyncio
+import os
+
+from atomize_mvp import browser_pool
+from atomize_mvp.asset_store import ASSET_ORIGIN, AssetStore
+from atomize_mvp.browser_pool import BrowserPool, process_tree_rss
+
+
+class FakePage:
+    def __init__(self):
+        self.content = None
+        self.closed = False
+
+    async def set_content(self, html, wait_until=None):
+        self.content = html
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.routes = {}
+
+    async def route(self, pattern, handler):
+        self.routes[pattern] = handler
+
+    async def new_page(self):
+        return FakePage()
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.browsers = []
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def _install_fake(monkeypatch) -> FakePlaywright:
+    fake = FakePlaywright()
+
+    class Manager:
+        async def start(self):
+            return fake
+
+    monkeypatch.setattr(browser_pool, "async_playwright", Manager)
+    return fake
+
+
+def test_pool_recycles_after_max_renders(monkeypatch):
+    fake = _install_fake(monkeypatch)
+    pool = BrowserPool(size=1, max_renders=2, max_rss_mb=0)
+
+    async def render(page):
+        return "ok"
+
+    try:
+        results = [
+            pool.render(render, viewport=(1200, 1200), device_scale_factor=2) for _ in range(3)
+        ]
+        metrics = pool.metrics()
+    finally:
+        pool.close()
+
+    assert results == ["ok", "ok", "ok"]
+    assert metrics["renders"] == 3
+    assert metrics["launches"] == 2
+    assert metrics["recycles"] == 1
+    first, second = fake.chromium.browsers
+    assert first.closed
+    # The relaunched browser gets its context before the next render asks for it.
+    assert second.contexts[0].options == {
+        "viewport": {"width": 1200, "height": 1200},
+        "device_scale_factor": 2,
+    }
+    assert fake.stopped
+
+
+def test_pool_runs_renders_concurrently(monkeypatch):
+    fake = _install_fake(monkeypatch)
+    pool = BrowserPool(size=2, pages_per_browser=1, max_rss_mb=0)
+    async def render(page, idx):
+        await asyncio.sleep(0.05)
+        return idx
+
+    try:
+        futures = [pool.submit(lambda page, idx=idx: render(page, idx)) for idx in range(4)]
+        assert [future.result() for future in futures] == [0, 1, 2, 3]
+        assert pool.metrics()["launched"] == 2
+    finally:
+        pool.close()
+    assert len(fake.chromium.browsers) == 2
+
+
+def test_process_tree_rss_reads_current_process():
+    if not os.path.isdir("/proc"):
+        return
+    assert process_tree_rss(os.getpid()) > 0
+
+
+def test_render_many_keeps_input_order_within_limit(monkeypatch):
+    _install_fake(monkeypatch)
+    pool = BrowserPool(size=1, pages_per_browser=4, max_rss_mb=0)
+    in_flight = []
+    peak = []
+
+    async def render(page, idx):
+        in_flight.append(idx)
+        peak.append(len(in_flight))
+        # Later items finish first; results must still come back in input order.
+        await asyncio.sleep(0.01 * (5 - idx))
+        in_flight.remove(idx)
+        return idx
+
+    try:
+        results = pool.render_many(
+            (lambda page, idx=idx: render(page, idx) for idx in range(6)), concurrency=2
+        )
+    finally:
+        pool.close()
+    assert results == [0, 1, 2, 3, 4, 5]
+    assert max(peak) == 2
+
+
+def test_shell_pages_are_loaded_once_and_reused(monkeypatch):
+    _install_fake(monkeypatch)
+    pool = BrowserPool(size=1, pages_per_browser=1, max_rss_mb=0)
+    seen = []
+
+    async def render(page):
+        seen.append(page)
+        return page.content
+
+    try:
+        results = pool.render_many((render for _ in range(3)), concurrency=1, shell="<shell/>")
+        metrics = pool.metrics()
+    finally:
+        pool.close()
+    assert results == ["<shell/>"] * 3
+    assert len({id(page) for page in seen}) == 1
+    assert metrics["shell_loads"] == 1
+
+
+class FakeRoute:
+    def __init__(self, url):
+        self.request = type("Request", (), {"url": url})()
+        self.fulfilled = None
+
+    async def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+
+def test_contexts_serve_assets_from_store(monkeypatch, tmp_path):
+    fake = _install_fake(monkeypatch)
+    store = AssetStore(tmp_path)
+    url = store.put(b"png-bytes", ".png")
+    assert store.put(b"png-bytes", ".png") == url
+    assert len(list(tmp_path.iterdir())) == 1
+
+    pool = BrowserPool(size=1, max_rss_mb=0, assets=store)
+
+    async def render(page):
+        return "ok"
+
+    try:
+        pool.render(render)
+    finally:
+        pool.close()
+    handler = fake.chromium.browsers[0].contexts[0].routes[f"{ASSET_ORIGIN}**"]
+
+    found, missing = FakeRoute(url), FakeRoute(f"{ASSET_ORIGIN}../secret")
+    asyncio.run(handler(found))
+    asyncio.run(handler(missing))
+    assert found.fulfilled == {"path": str(store.path_for(url)), "content_type": "image/png"}
+    assert missing.fulfilled["status"] == 404
+
+
+def test_asset_store_evicts_least_recently_put(tmp_path):
+    store = AssetStore(tmp_path, max_bytes=25)
+    first = store.put(b"a" * 10, ".png")
+    second = store.put(b"b" * 10, ".png")
+    os.utime(store.path_for(first), (0, 0))
+    os.utime(store.path_for(second), (1, 1))
+    # Re-putting the first file makes the second one the oldest.
+    store.put(b"a" * 10, ".png")
+    third = store.put(b"c" * 10, ".png")
+
+    assert store.path_for(second) is None
+    assert store.path_for(first) is not None
+    assert store.path_for(third) is not None
+    assert store.evicted == 1
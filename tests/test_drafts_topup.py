@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from atomize_mvp import drafts as drafts_module
+from atomize_mvp.drafts import LINKEDIN_SCHEMA, _generate_platform
+from atomize_mvp.schemas import LinkedinPost
+
+
+def _post(idx: int) -> dict:
+    return {"id": f"LI-{idx:02d}", "hook": f"Hook {idx}", "body": "b", "cta": "c", "hashtags": []}
+
+
+def _run(monkeypatch, responses: list[str], count: int):
+    prompts = []
+
+    def fake_generate_text(system_prompt, user_prompt, model, temperature, *args, **kwargs):
+        prompts.append(user_prompt)
+        return responses[len(prompts) - 1]
+
+    monkeypatch.delenv("ATOMIZE_OFFLINE", raising=False)
+    monkeypatch.setattr(drafts_module, "generate_text", fake_generate_text)
+    prompt_path = Path(drafts_module.__file__).parent / "prompts" / "linkedin.txt"
+    _, items = _generate_platform(
+        name="LinkedIn",
+        prompt_path=prompt_path,
+        schema=LINKEDIN_SCHEMA,
+        count=count,
+        tone="friendly",
+        lang="en",
+        blueprint={"key_points": ["k"]},
+        transcript="t",
+        model="test",
+        temperature=0.0,
+        max_input_chars=1000,
+        adapter=TypeAdapter(list[LinkedinPost]),
+    )
+    return items, prompts
+
+
+def test_missing_items_are_topped_up(monkeypatch):
+    first = json.dumps([_post(1), _post(2), _post(3)])
+    topup = json.dumps([_post(1), _post(2)])
+    items, prompts = _run(monkeypatch, [first, topup], count=5)
+    assert [item.id for item in items] == ["LI-01", "LI-02", "LI-03", "LI-04", "LI-05"]
+    assert len(prompts) == 2
+    assert "Return only the 2 missing items" in prompts[1]
+    assert "LI-03: Hook 3" in prompts[1]
+
+
+def test_extra_items_are_trimmed_locally(monkeypatch):
+    first = json.dumps([_post(idx) for idx in range(1, 5)])
+    items, prompts = _run(monkeypatch, [first], count=2)
+    assert [item.id for item in items] == ["LI-01", "LI-02"]
+    assert len(prompts) == 1
+
+
+def test_sharded_generation_drops_near_duplicates(monkeypatch):
+    prompts = []
+    words = iter(f"topic{idx}" for idx in range(100))
+
+    def unique_post() -> dict:
+        word = next(words)
+        return {
+            "id": "LI-01",
+            "hook": f"Why {word} matters now",
+            "body": f"A short story about {word} and what it taught the team",
+            "cta": "Share it",
+            "hashtags": [],
+        }
+
+    shared = {
+        "id": "LI-01",
+        "hook": "The one lesson every founder learns too late",
+        "body": "Ship early, listen to customers and keep the team small",
+        "cta": "Share it",
+        "hashtags": [],
+    }
+
+    def fake_generate_text(system_prompt, user_prompt, model, temperature, *args, **kwargs):
+        prompts.append(user_prompt)
+        if "Return only the" in user_prompt:
+            return json.dumps([unique_post()])
+        return json.dumps([shared, unique_post(), unique_post()])
+
+    monkeypatch.delenv("ATOMIZE_OFFLINE", raising=False)
+    monkeypatch.setattr(drafts_module, "generate_text", fake_generate_text)
+    prompt_path = Path(drafts_module.__file__).parent / "prompts" / "linkedin.txt"
+    _, items = _generate_platform(
+        name="LinkedIn",
+        prompt_path=prompt_path,
+        schema=LINKEDIN_SCHEMA,
+        count=6,
+        tone="friendly",
+        lang="en",
+        blueprint={"key_points": ["a", "b"], "hooks": ["h1", "h2"]},
+        transcript="t",
+        model="test",
+        temperature=0.0,
+        max_input_chars=1000,
+        adapter=TypeAdapter(list[LinkedinPost]),
+        shard_size=3,
+        workers=2,
+    )
+    assert len(prompts) == 3
+    assert [item.id for item in items] == [f"LI-{idx:02d}" for idx in range(1, 7)]
+    assert sum(item.hook == shared["hook"] for item in items) == 1
@@ -0,0 +1,76 @@
+from atomize_mvp.extractive import compress_text, estimate_tokens, split_sentences
+from atomize_mvp.runner import run_pipeline
+
+
+def _sample_text() -> str:
+    paragraphs = []
+    for idx in range(40):
+        paragraphs.append(
+            f"Drones map the field in block {idx}. "
+            "Mapping data feeds the AI model every morning. "
+            f"Unrelated remark number {idx} about lunch."
+        )
+    return "\n\n".join(paragraphs)
+
+
+def test_compress_respects_budget_and_keeps_sentences():
+    text = _sample_text()
+    compressed, stats = compress_text(text, 200)
+    assert estimate_tokens(compressed) <= 200
+    assert stats["ratio"] < 1.0
+    assert stats["sentences_kept"] < stats["sentences_total"]
+    original = {sentence for _, sentence in split_sentences(text)}
+    for _, sentence in split_sentences(compressed):
+        assert sentence in original
+
+
+def test_compress_noop_under_budget():
+    text = "Short transcript. Nothing to trim."
+    compressed, stats = compress_text(text, 1000)
+    assert compressed == text
+    assert stats["ratio"] == 1.0
+
+
+def test_compress_step_reruns_when_budget_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("ATOMIZE_OFFLINE", "1")
+    source = tmp_path / "talk.txt"
+    source.write_text(
+        " ".join(f"Sentence {idx} covers drone mapping details." for idx in range(60)),
+        encoding="utf-8",
+    )
+    out_root = tmp_path / "out"
+
+    def run(tokens):
+        run_pipeline(
+            input_path=source,
+            client="Acme",
+            title="Kickoff",
+            out_root=out_root,
+            force=False,
+            whisper_model="tiny",
+            language="auto",
+            device="cpu",
+            model="gpt-4o-mini",
+            temperature=0.3,
+            max_input_chars=120000,
+            lang="en",
+            tone="friendly",
+            linkedin_count=1,
+            x_count=1,
+            blog_count=0,
+            ig_count=1,
+            ai_posters=False,
+            ai_poster_count=0,
+            structured_posters=False,
+            structured_count=0,
+            structured_theme="bright_canva",
+            structured_only=False,
+            structured_premium=False,
+            compress_tokens=tokens,
+            poster_renderer="native",
+        )
+        transcripts = out_root / "acme" / "kickoff" / "02_transcripts"
+        return estimate_tokens((transcripts / "compressed_transcript.txt").read_text())
+
+    assert run(200) <= 200
+    assert run(60) <= 60
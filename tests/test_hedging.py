@@ -0,0 +1,45 @@
+import threading
+import time
+
+from atomize_mvp.hedging import HedgePolicy
+
+
+def test_no_hedge_without_history():
+    policy = HedgePolicy(min_samples=3, budget=1.0)
+    assert policy.run("text", lambda: "ok") == "ok"
+    assert policy.threshold("text") is None
+    assert policy.stats()["hedges"] == 0
+
+
+def test_slow_primary_is_hedged_and_duplicate_wins():
+    policy = HedgePolicy(percentile=50.0, min_samples=3, budget=1.0)
+    for seconds in (0.01, 0.02, 0.03):
+        policy.record("text", seconds)
+    assert policy.threshold("text") == 0.02
+
+    calls = []
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        time.sleep(1.0 if first else 0.01)
+        return "slow" if first else "fast"
+
+    assert policy.run("text", call) == "fast"
+    stats = policy.stats()
+    assert stats["hedges"] == 1
+    assert stats["wins"] == 1
+
+
+def test_budget_caps_hedges():
+    policy = HedgePolicy(percentile=50.0, min_samples=1, budget=0.0)
+    policy.record("text", 0.001)
+
+    def call():
+        time.sleep(0.05)
+        return "primary"
+
+    assert policy.run("text", call) == "primary"
+    assert policy.stats()["hedges"] == 0
@@ -0,0 +1,62 @@
+import base64
+import threading
+import time
+
+from atomize_mvp.image_cache import ImageCache
+
+
+def _fake_generator(calls):
+    def generate(prompt, model, size):
+        calls.append(prompt)
+        time.sleep(0.05)
+        return base64.b64encode(f"{prompt}|{model}|{size}".encode()).decode()
+
+    return generate
+
+
+def test_cache_generates_each_request_once(tmp_path):
+    calls = []
+    cache = ImageCache(tmp_path, generate=_fake_generator(calls))
+
+    first = cache.get("sunrise", "gpt-4o-mini", "1024x1024")
+    again = ImageCache(tmp_path, generate=_fake_generator(calls)).get(
+        "sunrise", "gpt-4o-mini", "1024x1024"
+    )
+    other = cache.get("sunrise", "gpt-4o-mini", "512x512")
+
+    assert first == again == b"sunrise|gpt-4o-mini|1024x1024"
+    assert other == b"sunrise|gpt-4o-mini|512x512"
+    assert calls == ["sunrise", "sunrise"]
+    assert cache.metrics()["misses"] == 2
+
+
+def test_concurrent_requests_share_one_generation(tmp_path):
+    calls = []
+    cache = ImageCache(tmp_path, generate=_fake_generator(calls))
+    results = []
+
+    def worker():
+        results.append(cache.get("forest", "gpt-4o-mini", "1024x1024"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["forest"]
+    assert len(set(results)) == 1 and len(results) == 4
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = ImageCache(tmp_path, max_bytes=60, generate=_fake_generator([]))
+    cache.get("a" * 20, "m", "s")
+    old = cache.path(cache.key("a" * 20, "m", "s"))
+    time.sleep(0.01)
+    cache.get("b" * 20, "m", "s")
+    time.sleep(0.01)
+    cache.get("c" * 20, "m", "s")
+
+    assert not old.exists()
+    assert cache.metrics()["evicted"] == 1
+    assert sum(path.stat().st_size for path in tmp_path.glob("*/*.png")) <= 60
@@ -0,0 +1,64 @@
+from pydantic import TypeAdapter
+
+from atomize_mvp.blueprint import _parse_with_repair
+from atomize_mvp.json_repair import parse_json_loose, repair_list, repair_model
+from atomize_mvp.schemas import ContentBlueprint, LinkedinPost, QuickBundle
+
+
+def test_parse_json_loose_fixes_common_breakage():
+    assert parse_json_loose('```json\n{"a": [1, 2,],}\n```') == {"a": [1, 2]}
+    assert parse_json_loose("{'a': 'b', c: True}") == {"a": "b", "c": True}
+    assert parse_json_loose('Sure! {"a": ["x", "y"') == {"a": ["x", "y"]}
+
+
+def test_repair_model_pads_and_trims_blueprint_lists():
+    raw = """{
+      "title": "T", "summary": "S",
+      "key_points": ["P1", "P2"],
+      "hooks": ["H1"],
+      "quotes": ["Q1", "Q2", "Q3"],
+      "ctas": ["C"],
+      "do_not_say": ["D1","D2","D3","D4","D5","D6","D7","D8","D9","D10","D11"],
+    }"""
+    blueprint = repair_model(raw, ContentBlueprint)
+    assert blueprint is not None
+    assert len(blueprint.key_points) == 8
+    assert set(blueprint.quotes) == {"Q1", "Q2", "Q3"}
+    assert len(blueprint.do_not_say) == 10
+
+
+def test_repair_model_does_not_pad_empty_lists_from_other_fields():
+    raw = """{
+      "title": "T", "summary": "S",
+      "key_points": ["P1", "P2"],
+      "hooks": ["H1"],
+      "quotes": [],
+      "ctas": ["C"],
+      "do_not_say": ["D1"],
+    }"""
+    assert repair_model(raw, ContentBlueprint) is None
+
+
+def test_repair_model_does_not_pad_object_lists():
+    raw = '{"summary": "s", "linkedin_posts": [], "x_threads": [], "ig_stories": []}'
+    assert repair_model(raw, QuickBundle) is None
+
+
+def test_repair_list_unwraps_items():
+    raw = '{"items": [{"id": "LI-01", "hook": "h", "body": "b", "cta": "c", "hashtags": []}]}'
+    items = repair_list(raw, TypeAdapter(list[LinkedinPost]))
+    assert items is not None
+    assert items[0].id == "LI-01"
+
+
+def test_blueprint_repair_returns_parseable_raw():
+    raw = """{
+      "title": "T", "summary": "S",
+      "key_points": ["P1", "P2"],
+      "hooks": ["H1"],
+      "quotes": ["Q1"],
+      "ctas": ["C"],
+      "do_not_say": ["D1"],
+    }"""
+    candidate, blueprint = _parse_with_repair(raw, "gpt-4o-mini", 0.0)
+    assert ContentBlueprint.model_validate_json(candidate) == blueprint
@@ -0,0 +1,109 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from openai import BadRequestError
+from pydantic import TypeAdapter
+
+from atomize_mvp import llm_client
+from atomize_mvp.blueprint import PARTIAL_SCHEMA_TEXT, SCHEMA_TEXT
+from atomize_mvp.drafts import (
+    BLOG_SCHEMA,
+    IG_SCHEMA,
+    LINKEDIN_SCHEMA,
+    QUICK_SCHEMA,
+    X_SCHEMA,
+)
+from atomize_mvp.json_schemas import list_schema, model_schema
+from atomize_mvp.schemas import (
+    BlogOutline,
+    ContentBlueprint,
+    IGStory,
+    LinkedinPost,
+    PartialBlueprint,
+    QuickBundle,
+    XThread,
+)
+
+
+def _walk_objects(schema):
+    if isinstance(schema, dict):
+        if "properties" in schema:
+            yield schema
+        for value in schema.values():
+            yield from _walk_objects(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from _walk_objects(item)
+
+
+def test_model_schema_is_strict():
+    schema = model_schema(QuickBundle)
+    objects = list(_walk_objects(schema))
+    assert objects
+    for obj in objects:
+        assert obj["additionalProperties"] is False
+        assert sorted(obj["required"]) == sorted(obj["properties"])
+    assert "title" not in schema
+
+
+def test_list_schema_wraps_items_with_count():
+    schema = list_schema(TypeAdapter(list[LinkedinPost]), 3)
+    assert schema["type"] == "object"
+    assert schema["required"] == ["items"]
+    items = schema["properties"]["items"]
+    assert items["minItems"] == 3
+    assert items["maxItems"] == 3
+    assert "LinkedinPost" in schema["$defs"]
+
+
+def test_prompt_schema_text_matches_models():
+    # The prompt examples are hand-written; keep them in sync with the models.
+    cases = [
+        (SCHEMA_TEXT, ContentBlueprint),
+        (PARTIAL_SCHEMA_TEXT, PartialBlueprint),
+        (LINKEDIN_SCHEMA, LinkedinPost),
+        (X_SCHEMA, XThread),
+        (BLOG_SCHEMA, BlogOutline),
+        (IG_SCHEMA, IGStory),
+        (QUICK_SCHEMA, QuickBundle),
+    ]
+    for text, model in cases:
+        example = json.loads(text)
+        if isinstance(example, list):
+            example = example[0]
+        assert set(example) == set(model.model_fields), model.__name__
+
+
+def _bad_request(param, code):
+    response = SimpleNamespace(request=None, status_code=400, headers={})
+    body = {"param": param, "code": code, "type": "invalid_request_error"}
+    return BadRequestError("bad request", response=response, body=body)
+
+
+def _schema_call(monkeypatch, error):
+    formats = []
+
+    def fake_create(client, context, hedge=True, **kwargs):
+        formats.append(kwargs["text"]["format"]["type"])
+        if len(formats) == 1:
+            raise error
+        return "ok"
+
+    monkeypatch.setattr(llm_client, "_create", fake_create)
+    text = {"format": {"type": "json_schema", "name": "blueprint", "schema": {}}}
+    return formats, lambda: llm_client._responses_create(None, "test", model="m", text=text)
+
+
+def test_schema_rejection_falls_back_to_json_object(monkeypatch):
+    error = _bad_request("text.format.schema", "invalid_json_schema")
+    formats, call = _schema_call(monkeypatch, error)
+    assert call() == "ok"
+    assert formats == ["json_schema", "json_object"]
+
+
+def test_other_bad_requests_are_not_retried(monkeypatch):
+    formats, call = _schema_call(monkeypatch, _bad_request("input", "context_length_exceeded"))
+    with pytest.raises(BadRequestError):
+        call()
+    assert formats == ["json_schema"]
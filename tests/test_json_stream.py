@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from atomize_mvp import drafts as drafts_module
+from atomize_mvp.drafts import LINKEDIN_SCHEMA, _generate_platform
+from atomize_mvp.json_stream import ArrayItemParser
+from atomize_mvp.schemas import LinkedinPost
+from atomize_mvp.web_results import build_results
+
+
+def _post(idx: int) -> dict:
+    return {"id": f"LI-{idx:02d}", "hook": f"Hook {{{idx}}}", "body": "say \"hi\"", "cta": "c", "hashtags": []}
+
+
+def test_parser_emits_items_as_they_close():
+    text = json.dumps({"items": [_post(1), _post(2)]})
+    parser = ArrayItemParser()
+    emitted = []
+    for idx in range(0, len(text), 7):
+        emitted.append(parser.feed(text[idx : idx + 7]))
+    flat = [item for batch in emitted for item in batch]
+    assert [item["id"] for item in flat] == ["LI-01", "LI-02"]
+    # The first item arrives before the stream is finished.
+    first_batch = next(idx for idx, batch in enumerate(emitted) if batch)
+    assert first_batch < len(emitted) - 1
+    assert parser.done
+
+
+def test_streamed_platform_reports_progress(monkeypatch):
+    raw = json.dumps({"items": [_post(1), _post(2)]})
+
+    def fake_stream_text(system_prompt, user_prompt, model, temperature, on_delta, *args, **kwargs):
+        for idx in range(0, len(raw), 5):
+            on_delta(raw[idx : idx + 5])
+        return raw
+
+    monkeypatch.delenv("ATOMIZE_OFFLINE", raising=False)
+    monkeypatch.setattr(drafts_module, "stream_text", fake_stream_text)
+    progress = []
+    _, items = _generate_platform(
+        name="LinkedIn",
+        prompt_path=Path(drafts_module.__file__).parent / "prompts" / "linkedin.txt",
+        schema=LINKEDIN_SCHEMA,
+        count=2,
+        tone="friendly",
+        lang="en",
+        blueprint={"key_points": ["k"]},
+        transcript="t",
+        model="test",
+        temperature=0.0,
+        max_input_chars=1000,
+        adapter=TypeAdapter(list[LinkedinPost]),
+        on_progress=lambda current: progress.append([item.id for item in current]),
+    )
+    assert [item.id for item in items] == ["LI-01", "LI-02"]
+    assert progress[0] == ["LI-01"]
+    assert progress[-1] == ["LI-01", "LI-02"]
+
+
+def test_results_show_partial_drafts(tmp_path: Path):
+    out_root = tmp_path / "out"
+    drafts_dir = out_root / "acme" / "kickoff" / "03_content" / "drafts"
+    drafts_dir.mkdir(parents=True)
+    (drafts_dir / "drafts.partial.json").write_text(
+        json.dumps({"linkedin_posts": [_post(1)]}), encoding="utf-8"
+    )
+    results = build_results(out_root, out_root / "acme" / "kickoff")
+    assert results["drafts_partial"] is True
+    assert results["drafts"]["linkedin"][0]["id"] == "LI-01"
@@ -0,0 +1,27 @@
+from atomize_mvp.minhash import MinHasher, estimate_jaccard, filter_near_duplicates, shingles
+
+
+def test_shingles_use_word_trigrams():
+    assert shingles("One two three four") == {"one two three", "two three four"}
+    assert shingles("Hi there") == {"hi there"}
+    assert shingles("") == set()
+
+
+def test_signature_similarity_tracks_overlap():
+    hasher = MinHasher()
+    base = "the quick brown fox jumps over the lazy dog near the quiet river bank today"
+    close = base + " again"
+    other = "completely different words describing a product launch and pricing plan"
+    assert estimate_jaccard(hasher.signature(base), hasher.signature(base)) == 1.0
+    assert estimate_jaccard(hasher.signature(base), hasher.signature(close)) > 0.7
+    assert estimate_jaccard(hasher.signature(base), hasher.signature(other)) < 0.2
+
+
+def test_filter_near_duplicates_keeps_first_occurrence():
+    texts = [
+        "Five lessons we learned shipping our first product to real customers this year",
+        "A guide to hiring your first engineer without a recruiter or a big budget",
+        "Five lessons we learned shipping our first product to real customers this year!",
+        "What nobody tells you about pricing a subscription product in a crowded market",
+    ]
+    assert filter_near_duplicates(texts, threshold=0.7) == [0, 1, 3]
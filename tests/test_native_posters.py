@@ -0,0 +1,62 @@
+import json
+
+from PIL import Image
+
+from atomize_mvp.native_posters import (
+    CARD_WIDTH,
+    SCALE,
+    _text_width,
+    export_native_posters,
+    layout_card,
+    wrap_text,
+)
+
+
+def test_wrap_text_uses_glyph_widths():
+    lines = wrap_text("Drones map farmland faster than ever before\nSecond", 32, 300)
+    assert lines[-1] == "Second"
+    assert len(lines) > 2
+    assert all(_text_width(line, 32, False) <= 300 for line in lines)
+    # A word wider than the column is split rather than overflowing.
+    assert all(_text_width(line, 32, False) <= 300 for line in wrap_text("W" * 40, 32, 300))
+
+
+def test_layout_grows_with_content():
+    short = layout_card({"platform": "Blog", "id": "B-01", "title": "T", "content": "c"})
+    long = layout_card(
+        {"platform": "Blog", "id": "B-01", "title": "T", "content": "word " * 200, "cta": "Go"}
+    )
+    assert long.height > short.height
+    assert short.badge_class == "blog"
+
+
+def test_export_native_posters(tmp_path):
+    cards_dir = tmp_path / "Cards"
+    cards_dir.mkdir()
+    cards = [
+        {
+            "platform": "LinkedIn",
+            "id": "LI-01",
+            "title": "Hook",
+            "content": "Body",
+            "cta": "Follow",
+            "hashtags": ["#ai"],
+        },
+        {
+            "platform": "X / Twitter",
+            "id": "X-01",
+            "title": "Tweet",
+            "content": "One\nTwo",
+            "cta": "",
+            "hashtags": [],
+        },
+    ]
+    (cards_dir / "cards.json").write_text(json.dumps(cards), encoding="utf-8")
+
+    outputs = export_native_posters(cards_dir, tmp_path / "Posters")
+    assert [path.relative_to(tmp_path).as_posix() for path in outputs] == [
+        "Posters/LinkedIn/LI-01.png",
+        "Posters/X/X-01.png",
+    ]
+    with Image.open(outputs[0]) as image:
+        assert image.width == CARD_WIDTH * SCALE
@@ -1,6 +1,8 @@
 from pathlib import Path
 
-from atomize_mvp.render_posters import poster_output_path
+from PIL import Image
+
+from atomize_mvp.render_posters import _band_clip, _crop_card, plan_bands, poster_output_path
 
 
 def test_poster_output_path():
@@ -17,3 +19,33 @@ def test_poster_output_path():
     assert poster_output_path(root, "Blog", "B-01").as_posix().endswith(
         "posters/Blogs/B-01.png"
     )
+
+
+def test_plan_bands_keeps_cards_whole():
+    rects = [
+        {
+            "id": f"C-{idx}",
+            "x": 28 + (idx % 2) * 300,
+            "y": 100 + (idx // 2) * 500,
+            "width": 272,
+            "height": 450,
+        }
+        for idx in range(6)
+    ]
+    bands = plan_bands(rects, max_height=1000)
+    assert [[rect["id"] for rect in band] for band in bands] == [
+        ["C-0", "C-1", "C-2", "C-3"],
+        ["C-4", "C-5"],
+    ]
+    assert _band_clip(bands[1]) == {"x": 28, "y": 1100, "width": 572, "height": 450}
+
+
+def test_crop_card_scales_rect_into_band(tmp_path):
+    band = Image.new("RGB", (200, 100), "white")
+    band.paste((255, 0, 0), (40, 20, 80, 60))
+    clip = {"x": 10, "y": 10, "width": 100, "height": 50}
+    rect = {"x": 30, "y": 20, "width": 20, "height": 20}
+    output = _crop_card(band, clip, rect, tmp_path / "LinkedIn" / "LI-01.png")
+    with Image.open(output) as image:
+        assert image.size == (40, 40)
+        assert image.getpixel((20, 20)) == (255, 0, 0)
@@ -1,6 +1,15 @@
+import io
+import json
+import threading
+import time
 from pathlib import Path
 
+from PIL import Image
+
+from atomize_mvp import ai_posters
 from atomize_mvp.ai_posters import ai_poster_output_path, build_background_prompt, select_hero_cards
+from atomize_mvp.render_manifest import RenderManifest
+from atomize_mvp.routing import RouteTable, set_routes
 
 
 def test_ai_poster_output_path():
@@ -24,3 +33,61 @@ def test_select_hero_cards():
     ]
     selected = select_hero_cards(cards, 5)
     assert selected == [{"id": "LI-01", "hero": True}]
+
+
+def test_export_ai_posters_generates_concurrently(monkeypatch, tmp_path):
+    cards = [
+        {"id": f"LI-0{idx}", "platform": "LinkedIn", "title": f"Topic {idx}", "hero": True}
+        for idx in range(1, 5)
+    ]
+    cards_dir = tmp_path / "Cards"
+    cards_dir.mkdir()
+    (cards_dir / "cards.json").write_text(json.dumps(cards), encoding="utf-8")
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "teal").save(buffer, format="PNG")
+    active, peak = [], []
+    lock = threading.Lock()
+
+    def fake_generate(prompt, model, size, cache=None):
+        with lock:
+            active.append(prompt)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(prompt)
+        return buffer.getvalue()
+
+    monkeypatch.setattr(ai_posters, "generate_image", fake_generate)
+    posters_root = tmp_path / "Posters_AI"
+    outputs = ai_posters.export_ai_posters(cards_dir, posters_root, "gpt-4o-mini", 4, workers=4)
+
+    assert [path.stem for path in outputs] == ["LI-01", "LI-02", "LI-03", "LI-04"]
+    assert all(Image.open(path).size == (1080, 1080) for path in outputs)
+    assert max(peak) > 1
+    assert not (posters_root / "_backgrounds").exists()
+
+
+def test_manifest_tracks_routed_image_model(monkeypatch, tmp_path):
+    cards_dir = tmp_path / "Cards"
+    cards_dir.mkdir()
+    card = {"id": "LI-01", "platform": "LinkedIn", "title": "Topic", "hero": True}
+    (cards_dir / "cards.json").write_text(json.dumps([card]), encoding="utf-8")
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "teal").save(buffer, format="PNG")
+    monkeypatch.setattr(
+        ai_posters, "generate_image", lambda prompt, model, size, cache=None: buffer.getvalue()
+    )
+    posters_root = tmp_path / "Posters_AI"
+
+    def export(text_model, image_model):
+        set_routes(RouteTable(text_model, 0.2, {"image": {"model": image_model}}))
+        manifest = RenderManifest(posters_root)
+        try:
+            ai_posters.export_ai_posters(cards_dir, posters_root, text_model, 1, manifest=manifest)
+        finally:
+            set_routes(None)
+        return manifest.metrics()["rendered"]
+
+    assert export("gpt-4o-mini", "gpt-image-1") == 1
+    assert export("gpt-4o", "gpt-image-1") == 0
+    assert export("gpt-4o", "dall-e-3") == 1
@@ -22,3 +22,33 @@ def test_build_results(tmp_path: Path) -> None:
     assert results["drafts"]["linkedin"][0]["id"] == "LI-01"
     assert "Posters" in results["posters"]
     assert results["docs"]
+
+
+def test_progressive_progress_counts_preview(tmp_path: Path) -> None:
+    from atomize_mvp.web_jobs import _infer_progress
+
+    done = {"status": "done"}
+    base = {name: done for name in ("init", "stage_source", "prepare_audio", "transcribe", "cleanup_transcript")}
+    meta = {"mode": "progressive"}
+
+    preview_steps = {**base, "generate_quick": done, "render_cards": {"status": "running"}}
+    current, percent, running, failed = _infer_progress(preview_steps, meta, "preview")
+    assert current == "render_cards" and running and not failed
+    assert 0 < percent < 50
+
+    full_steps = {**base, "generate_quick": done, "blueprint": {"status": "running"}}
+    current, percent, _, _ = _infer_progress(full_steps, meta, "full")
+    assert current == "blueprint"
+    assert percent >= 50
+
+
+def test_results_expose_delivery_phase(tmp_path: Path) -> None:
+    out_root = tmp_path / "out"
+    job_root = out_root / "acme" / "kickoff"
+    (job_root / ".atomize").mkdir(parents=True)
+    (job_root / ".atomize" / "run.json").write_text(
+        '{"delivery_phase": "full"}', encoding="utf-8"
+    )
+    results = build_results(out_root, job_root)
+    assert results["phase"] == "full"
+    assert results["preview_ready"] is True
@@ -0,0 +1,25 @@
+import io
+
+from PIL import Image
+
+from atomize_mvp.design_system import BRIGHT_CANVA
+from atomize_mvp.procedural import procedural_background, render_background
+
+
+def test_background_is_deterministic_per_card():
+    first = render_background("LI-01", BRIGHT_CANVA, size=256)
+    again = render_background("LI-01", BRIGHT_CANVA, size=256)
+    other = render_background("LI-02", BRIGHT_CANVA, size=256)
+
+    assert first.size == (256, 256)
+    assert first.tobytes() == again.tobytes()
+    assert first.tobytes() != other.tobytes()
+
+
+def test_background_png_is_upscaled_to_requested_size():
+    image = Image.open(io.BytesIO(procedural_background("X-01", BRIGHT_CANVA, size=1024)))
+    assert image.size == (1024, 1024)
+    assert image.mode == "RGB"
+    # The gradient should span visibly different colors, not a flat fill.
+    low, high = image.convert("L").getextrema()
+    assert high - low > 40
@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+
+from atomize_mvp import runner
+
+
+def test_progressive_runs_preview_then_full(tmp_path: Path, monkeypatch) -> None:
+    out_root = tmp_path / "out"
+    state_dir = runner.build_delivery_root(out_root, "Acme", "Kickoff") / ".atomize"
+    calls = []
+
+    def fake_run_pipeline(**params):
+        run_data = json.loads((state_dir / "run.json").read_text(encoding="utf-8"))
+        calls.append((params["mode"], params["force"], run_data.get("delivery_phase")))
+        steps = {"steps": {name: {"status": "done"} for name in runner.PREVIEW_STEPS}}
+        if params["mode"] == "quick":
+            (state_dir / "steps.json").write_text(json.dumps(steps), encoding="utf-8")
+        else:
+            saved = json.loads((state_dir / "steps.json").read_text(encoding="utf-8"))
+            # Preview renders are redone by the full phase; the quick bundle is kept.
+            assert set(saved["steps"]) == {"generate_quick"}
+
+    monkeypatch.setattr(runner, "run_pipeline", fake_run_pipeline)
+    runner._run_progressive(
+        {"out_root": out_root, "client": "Acme", "title": "Kickoff", "force": True, "mode": "progressive"}
+    )
+
+    assert calls == [("quick", True, "preview"), ("full", False, "full")]
+    run_data = json.loads((state_dir / "run.json").read_text(encoding="utf-8"))
+    assert run_data["delivery_phase"] == "complete"
+
+
+def test_preview_phase_survives_quick_init(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("ATOMIZE_OFFLINE", "1")
+    source = tmp_path / "talk.txt"
+    source.write_text("Drone mapping saves survey time. " * 20, encoding="utf-8")
+    out_root = tmp_path / "out"
+    state_dir = runner.build_delivery_root(out_root, "Acme", "Kickoff") / ".atomize"
+    real_run_pipeline = runner.run_pipeline
+    seen = {}
+
+    def quick_then_stop(**params):
+        if params["mode"] == "quick":
+            real_run_pipeline(**params)
+            seen.update(json.loads((state_dir / "run.json").read_text(encoding="utf-8")))
+
+    monkeypatch.setattr(runner, "run_pipeline", quick_then_stop)
+    runner._run_progressive(
+        {
+            "input_path": source,
+            "client": "Acme",
+            "title": "Kickoff",
+            "out_root": out_root,
+            "force": True,
+            "mode": "progressive",
+            "whisper_model": "tiny",
+            "language": "auto",
+            "device": "cpu",
+            "model": "gpt-4o-mini",
+            "temperature": 0.3,
+            "max_input_chars": 120000,
+            "lang": "en",
+            "tone": "friendly",
+            "linkedin_count": 1,
+            "x_count": 1,
+            "blog_count": 0,
+            "ig_count": 1,
+            "ai_posters": False,
+            "ai_poster_count": 0,
+            "structured_posters": False,
+            "structured_count": 0,
+            "structured_theme": "bright_canva",
+            "structured_only": False,
+            "structured_premium": False,
+            "poster_renderer": "native",
+        }
+    )
+
+    assert seen["delivery_phase"] == "preview"
+    assert "preview" in seen["phase_times"]
+    assert seen["input_hash"]
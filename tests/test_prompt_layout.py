@@ -0,0 +1,12 @@
+from atomize_mvp.drafts import _build_user_prompt, _compact_json
+
+
+def test_platform_prompts_share_prefix():
+    blueprint_json = _compact_json({"hooks": ["h"], "key_points": ["k"]})
+    transcript = "Transcript body " * 50
+    linkedin = _build_user_prompt("LinkedIn", "LI rules", 5, "friendly", "en", blueprint_json, transcript)
+    x_threads = _build_user_prompt("X", "X rules", 3, "friendly", "en", blueprint_json, transcript)
+    shared = linkedin[: linkedin.index("Platform instructions:")]
+    assert x_threads.startswith(shared)
+    assert transcript in shared
+    assert '{"hooks":["h"],"key_points":["k"]}' in shared
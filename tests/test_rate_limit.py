@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+from openai import RateLimitError
+
+from atomize_mvp import rate_limit
+from atomize_mvp.rate_limit import (
+    BULK,
+    INTERACTIVE,
+    RateLimiter,
+    backoff_delay,
+    call_with_retry,
+    retry_after_seconds,
+)
+
+
+def _rate_limit_error(headers: dict) -> RateLimitError:
+    error = RateLimitError.__new__(RateLimitError)
+    error.status_code = 429
+    error.response = SimpleNamespace(headers=headers)
+    return error
+
+
+def test_bucket_blocks_when_empty(tmp_path, monkeypatch):
+    limiter = RateLimiter(tmp_path / "limits.sqlite3", rpm=2, tpm=0)
+    sleeps = []
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "time", lambda: clock[0])
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_sleep)
+    limiter.acquire(10)
+    limiter.acquire(10)
+    assert sleeps == []
+    limiter.acquire(10)
+    # Two requests per minute refill one slot every 30 seconds.
+    assert sum(sleeps) == pytest.approx(30.0, abs=0.1)
+
+
+def test_bulk_yields_to_interactive_waiter(tmp_path, monkeypatch):
+    limiter = RateLimiter(tmp_path / "limits.sqlite3", rpm=60, tpm=0)
+    conn = limiter._connect()
+    conn.execute(
+        "INSERT INTO waiters (id, lane, seen) VALUES (?, ?, ?)",
+        ("other", INTERACTIVE, rate_limit.time.time()),
+    )
+    conn.close()
+
+    sleeps = []
+
+    def fake_sleep(seconds):
+        # The interactive caller gets its slot while the bulk caller waits.
+        sleeps.append(seconds)
+        conn = limiter._connect()
+        conn.execute("DELETE FROM waiters WHERE id = 'other'")
+        conn.close()
+
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_sleep)
+    limiter.acquire(1, BULK)
+    assert len(sleeps) == 1
+    limiter.acquire(1, INTERACTIVE)
+    assert len(sleeps) == 1
+
+
+def test_retry_after_header_is_honored():
+    assert retry_after_seconds(_rate_limit_error({"retry-after": "7"})) == 7.0
+    assert retry_after_seconds(_rate_limit_error({"retry-after-ms": "1500"})) == 1.5
+    assert 7.0 <= backoff_delay(3, 7.0, base=1.0) <= 8.0
+    assert 0.0 <= backoff_delay(2) <= 4.0
+
+
+def test_call_with_retry_retries_rate_limits(monkeypatch):
+    monkeypatch.delenv("ATOMIZE_LLM_RPM", raising=False)
+    monkeypatch.delenv("ATOMIZE_LLM_TPM", raising=False)
+    sleeps = []
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _rate_limit_error({"retry-after": "2"})
+        return "ok"
+
+    assert call_with_retry(flaky, 10, "test") == "ok"
+    assert len(calls) == 3
+    assert all(2.0 <= delay <= 3.0 for delay in sleeps)
+
+    def broken():
+        raise ValueError("not retryable")
+
+    with pytest.raises(ValueError):
+        call_with_retry(broken, 10, "test")
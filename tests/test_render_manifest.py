@@ -0,0 +1,57 @@
+import json
+
+from atomize_mvp.native_posters import export_native_posters
+from atomize_mvp.render_manifest import RenderManifest
+
+
+def _write_cards(cards_dir, cards):
+    cards_dir.mkdir(exist_ok=True)
+    (cards_dir / "cards.json").write_text(json.dumps(cards), encoding="utf-8")
+
+
+def _card(content_id, title):
+    return {"id": content_id, "platform": "LinkedIn", "title": title, "content": "Body"}
+
+
+def test_only_changed_posters_are_rendered(tmp_path):
+    cards_dir = tmp_path / "Cards"
+    posters_root = tmp_path / "Posters"
+    _write_cards(cards_dir, [_card("LI-01", "First"), _card("LI-02", "Second")])
+    export_native_posters(cards_dir, posters_root)
+
+    unchanged = RenderManifest(posters_root)
+    export_native_posters(cards_dir, posters_root, manifest=unchanged)
+    assert unchanged.metrics() == {"rendered": 0, "skipped": 2, "removed": 0}
+
+    _write_cards(cards_dir, [_card("LI-01", "First, edited"), _card("LI-02", "Second")])
+    edited = RenderManifest(posters_root)
+    export_native_posters(cards_dir, posters_root, manifest=edited)
+    assert edited.metrics() == {"rendered": 1, "skipped": 1, "removed": 0}
+
+
+def test_posters_of_removed_cards_are_deleted(tmp_path):
+    cards_dir = tmp_path / "Cards"
+    posters_root = tmp_path / "Posters"
+    _write_cards(cards_dir, [_card("LI-01", "First"), _card("LI-02", "Second")])
+    export_native_posters(cards_dir, posters_root)
+
+    _write_cards(cards_dir, [_card("LI-01", "First")])
+    manifest = RenderManifest(posters_root)
+    outputs = export_native_posters(cards_dir, posters_root, manifest=manifest)
+
+    assert [path.name for path in outputs] == ["LI-01.png"]
+    assert not (posters_root / "LinkedIn" / "LI-02.png").exists()
+    assert manifest.metrics()["removed"] == 1
+
+
+def test_missing_output_is_rendered_again(tmp_path):
+    cards_dir = tmp_path / "Cards"
+    posters_root = tmp_path / "Posters"
+    _write_cards(cards_dir, [_card("LI-01", "First")])
+    (output,) = export_native_posters(cards_dir, posters_root)
+    output.unlink()
+
+    manifest = RenderManifest(posters_root)
+    export_native_posters(cards_dir, posters_root, manifest=manifest)
+    assert output.exists()
+    assert manifest.metrics()["rendered"] == 1
@@ -0,0 +1,22 @@
+from atomize_mvp.retrieval import BM25Index, retrieve_passages
+
+
+def test_bm25_ranks_relevant_passage_first():
+    index = BM25Index(
+        [
+            "We talked about lunch plans and the weather.",
+            "Drones map farmland and feed the AI model.",
+            "Quarterly budget review for the sales team.",
+        ]
+    )
+    scores = index.scores("drone mapping farmland")
+    assert max(scores, key=scores.get) == 1
+
+
+def test_retrieve_passages_respects_budget_and_order():
+    passages = [f"Passage {idx} about topic{idx} and shared words." for idx in range(50)]
+    index = BM25Index(passages)
+    blueprint = {"key_points": ["topic40", "topic3"], "hooks": ["topic10"], "quotes": []}
+    text = retrieve_passages(index, blueprint, "LinkedIn", budget_tokens=40)
+    selected = text.split("\n\n")
+    assert selected == [passages[3], passages[10], passages[40]]
@@ -0,0 +1,128 @@
+import json
+from pathlib import Path
+
+from atomize_mvp import blueprint as blueprint_module
+from atomize_mvp.blueprint import reuse_content_blueprint
+from atomize_mvp.paths import delivery_tree
+from atomize_mvp.reuse import (
+    SIGNATURE_FILE,
+    find_similar_job,
+    load_reusable_drafts,
+    transcript_diff,
+    write_signature,
+)
+
+TALK = " ".join(
+    f"In part {idx} we discuss how drones map farmland and why sensors matter for crop yield."
+    for idx in range(60)
+)
+
+
+def _blueprint(title: str = "Talk") -> dict:
+    return {
+        "title": title,
+        "summary": "Summary",
+        "key_points": [f"Point {idx}" for idx in range(8)],
+        "hooks": [f"Hook {idx}" for idx in range(10)],
+        "quotes": [f"Quote {idx}" for idx in range(10)],
+        "ctas": [f"CTA {idx}" for idx in range(8)],
+        "do_not_say": [f"Avoid {idx}" for idx in range(5)],
+    }
+
+
+def _make_job(out_root: Path, title: str, text: str) -> Path:
+    root = out_root / "client" / title
+    tree = delivery_tree(root)
+    (tree["transcripts"]).mkdir(parents=True)
+    (tree["transcripts"] / "clean_transcript.txt").write_text(text, encoding="utf-8")
+    blueprint_dir = tree["content"] / "blueprint"
+    blueprint_dir.mkdir(parents=True)
+    (blueprint_dir / "content_blueprint.json").write_text(json.dumps(_blueprint(title)))
+    drafts_dir = tree["content"] / "drafts"
+    drafts_dir.mkdir(parents=True)
+    (drafts_dir / "drafts.json").write_text(
+        json.dumps({"linkedin_posts": [], "x_threads": [], "blog_outlines": [], "ig_stories": []})
+    )
+    steps = {
+        "steps": {
+            "blueprint": {"status": "done"},
+            "generate_drafts": {
+                "status": "done",
+                "metadata": {
+                    "lang": "en",
+                    "tone": "friendly",
+                    "counts": {"linkedin": 0, "x": 0, "blog": 0, "ig": 0},
+                },
+            },
+        }
+    }
+    (tree["state"]).mkdir(parents=True)
+    (tree["state"] / "steps.json").write_text(json.dumps(steps))
+    write_signature(tree["state"] / SIGNATURE_FILE, text)
+    return root
+
+
+def test_find_similar_job_matches_recut(tmp_path):
+    original = _make_job(tmp_path, "original", TALK)
+    _make_job(tmp_path, "unrelated", "A cooking class about bread, butter and slow fermentation. " * 30)
+    recut = TALK.replace("part 7 ", "section 7 ")
+    signature = write_signature(tmp_path / "new" / SIGNATURE_FILE, recut)
+
+    match = find_similar_job(tmp_path, signature, threshold=0.8)
+    assert match is not None
+    assert match[0] == original
+    assert match[1] >= 0.8
+    assert find_similar_job(tmp_path, signature, threshold=0.8, exclude=original) is None
+
+
+def test_transcript_diff_reports_changed_sentences():
+    old = "First point. Second point.\nThird point."
+    new = "First point. Second point, revised.\nThird point. A new ending."
+    added, removed = transcript_diff(old, new)
+    assert removed == ["Second point."]
+    assert added == ["Second point, revised.", "A new ending."]
+
+
+def test_drafts_are_only_reused_with_matching_settings(tmp_path):
+    root = _make_job(tmp_path, "original", TALK)
+    counts = {"linkedin": 0, "x": 0, "blog": 0, "ig": 0}
+    assert load_reusable_drafts(root, "en", "friendly", counts) is not None
+    assert load_reusable_drafts(root, "es", "friendly", counts) is None
+    assert load_reusable_drafts(root, "en", "friendly", {**counts, "x": 3}) is None
+
+
+def test_refresh_mode_regenerates_drafts(tmp_path):
+    root = _make_job(tmp_path, "original", TALK)
+    counts = {"linkedin": 0, "x": 0, "blog": 0, "ig": 0}
+    assert load_reusable_drafts(root, "en", "friendly", counts, mode="refresh") is None
+
+
+def test_refresh_sends_only_the_diff(monkeypatch):
+    prompts = []
+
+    def fake_generate_blueprint(user_prompt, *args, **kwargs):
+        prompts.append(user_prompt)
+        return json.dumps(_blueprint("Refreshed"))
+
+    monkeypatch.setattr(blueprint_module, "generate_blueprint", fake_generate_blueprint)
+    prompt_path = Path(blueprint_module.__file__).parent / "prompts" / "content_blueprint.txt"
+    prior_raw = json.dumps(_blueprint())
+    kwargs = dict(
+        prior_raw=prior_raw,
+        title="Talk",
+        prompt_path=prompt_path,
+        model="test",
+        temperature=0.0,
+        lang="en",
+        refresh=True,
+    )
+
+    _, unchanged, _ = reuse_content_blueprint(clean_text=TALK, prior_text=TALK, **kwargs)
+    assert unchanged.title == "Talk"
+    assert prompts == []
+
+    recut = TALK + " A brand new closing remark."
+    _, refreshed, _ = reuse_content_blueprint(clean_text=recut, prior_text=TALK, **kwargs)
+    assert refreshed.title == "Refreshed"
+    assert len(prompts) == 1
+    assert "+ A brand new closing remark." in prompts[0]
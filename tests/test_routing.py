@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import pytest
+
+from atomize_mvp import web_routes
+from atomize_mvp.routing import (
+    ModelRoute,
+    RouteTable,
+    load_routes,
+    parse_route_spec,
+    resolve_route,
+    set_routes,
+)
+from atomize_mvp.web_app import create_app
+
+
+def test_parse_route_spec():
+    routes = parse_route_spec("repair=gpt-4o-mini:0, blueprint=gpt-4o::4000")
+    assert routes == {
+        "repair": {"model": "gpt-4o-mini", "temperature": 0.0},
+        "blueprint": {"model": "gpt-4o", "max_output_tokens": 4000},
+    }
+    with pytest.raises(ValueError):
+        parse_route_spec("unknown=gpt-4o")
+
+
+def test_route_table_merges_env_and_overrides(monkeypatch, tmp_path):
+    routes_file = tmp_path / "routes.json"
+    routes_file.write_text(
+        json.dumps({"quick": "gpt-4o-mini", "blueprint": {"model": "gpt-4o", "temperature": 0.1}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("ATOMIZE_MODEL_ROUTES", str(routes_file))
+    table = RouteTable.from_sources("base", 0.3, {"quick": {"temperature": 0.5}})
+    assert table.resolve("drafts") == ModelRoute("base", 0.3)
+    assert table.resolve("quick") == ModelRoute("gpt-4o-mini", 0.5)
+    # Map calls inherit the blueprint route unless they have their own.
+    assert table.resolve("blueprint_map") == ModelRoute("gpt-4o", 0.1)
+    assert load_routes('{"repair": "small"}') == {"repair": {"model": "small"}}
+
+
+def test_resolve_route_uses_active_table():
+    set_routes(None)
+    assert resolve_route("repair", "base", 0.3) == ModelRoute("base", 0.3)
+    set_routes(RouteTable("base", 0.3, {"repair": {"model": "small", "max_output_tokens": 800}}))
+    try:
+        assert resolve_route("repair", "base", 0.3) == ModelRoute("small", 0.3, 800)
+    finally:
+        set_routes(None)
+
+
+def _post_form(app, path, fields, files):
+    boundary = "atomize-test-boundary"
+    body = b""
+    for name, value in fields.items():
+        body += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+        ).encode("utf-8")
+    for name, (filename, data) in files.items():
+        body += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{filename}"\r\nContent-Type: text/plain\r\n\r\n'
+        ).encode("utf-8") + data + b"\r\n"
+    body += f"--{boundary}--\r\n".encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", f"multipart/form-data; boundary={boundary}".encode("utf-8")),
+            (b"content-length", str(len(body)).encode("utf-8")),
+        ],
+        "client": ("test", 0),
+        "server": ("test", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    status = next(message["status"] for message in sent if message["type"] == "http.response.start")
+    payload = b"".join(
+        message.get("body", b"") for message in sent if message["type"] == "http.response.body"
+    )
+    return status, json.loads(payload or b"null")
+
+
+def test_web_form_routes_reach_job_config(monkeypatch, tmp_path):
+    monkeypatch.setenv("ATOMIZE_OUT_ROOT", str(tmp_path))
+    captured = {}
+
+    def fake_create_job(out_root, client, title, input_path, config, job_id=None, job_root=None):
+        captured.update(config)
+        return {
+            "id": job_id, "status": "queued", "client": client, "title": title, "created_at": ""
+        }
+
+    monkeypatch.setattr(web_routes, "create_job", fake_create_job)
+    app = create_app(tmp_path)
+    fields = {"client": "Acme", "title": "Kickoff", "routes": "repair=gpt-4o-mini:0, image=dall-e-3"}
+    files = {"file": ("talk.txt", b"Drone mapping saves survey time.")}
+
+    status, _ = _post_form(app, "/api/jobs", fields, files)
+    assert status == 200
+    assert captured["routes"] == {
+        "repair": {"model": "gpt-4o-mini", "temperature": 0.0},
+        "image": {"model": "dall-e-3"},
+    }
+
+    status, body = _post_form(app, "/api/jobs", {**fields, "routes": "repair"}, files)
+    assert status == 400
+    assert "Invalid route" in body["detail"]